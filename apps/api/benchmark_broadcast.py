@@ -0,0 +1,149 @@
+"""
+Benchmark WebSocket broadcast fan-out
+Compares per-client send_json (one JSON encode per socket) with the
+serialize-once broadcast in ConnectionManager, using in-memory sockets
+
+Usage: python benchmark_broadcast.py [--clients 100 1000 5000] [--messages 20]
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add monitor directory to path so websocket_manager can import shared config
+sys.path.insert(0, str(Path(__file__).parent.parent / "monitor"))
+
+from websocket_manager import ConnectionManager, ORJSON_AVAILABLE
+
+
+class FakeWebSocket:
+    """In-memory stand-in for a client socket that only counts what it receives"""
+
+    def __init__(self, index: int):
+        self.client = None
+        self.index = index
+        self.frames = 0
+        self.bytes = 0
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data: str):
+        self.frames += 1
+        self.bytes += len(data)
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+def build_game_message(game_id: int) -> dict:
+    """A game_update about the size of a mapped live log row"""
+    game = {
+        "game_id": str(401000000 + game_id),
+        "home_team": "North Carolina Tar Heels",
+        "away_team": "Duke Blue Devils",
+        "home_score": 41,
+        "away_score": 38,
+        "total_points": 79,
+        "period": 2,
+        "minutes_remaining": 14,
+        "seconds_remaining": 22,
+        "ou_line": 151.5,
+        "sportsbook": "DraftKings",
+        "referees": ["Roger Ayers", "Ted Valentine", "Bert Smith"],
+        "required_ppm": 4.82,
+        "current_ppm": 3.21,
+        "projected_final_score": 141.3,
+        "bet_type": "under",
+        "trigger_flag": True,
+        "confidence_score": 72.5,
+        "unit_size": 1,
+        "timestamp": "2025-02-01T20:14:05.123456",
+    }
+    # Shooting / possession stats and team metrics
+    for side in ("home", "away"):
+        for stat in ("fg_made", "fg_attempted", "three_made", "three_attempted",
+                     "ft_made", "ft_attempted", "rebounds", "off_rebounds",
+                     "def_rebounds", "assists", "steals", "blocks", "turnovers", "fouls"):
+            game[f"{side}_{stat}"] = 12
+        for metric in ("fg_pct", "three_pct", "ft_pct", "live_efg_pct", "live_ts_pct",
+                       "pace", "off_eff", "def_eff", "adj_em", "avg_ppm", "efg_pct", "ts_pct"):
+            game[f"{side}_{metric}"] = 51.37
+
+    return {"type": "game_update", "timestamp": "2025-02-01T20:14:05.123456", "data": game}
+
+
+async def run_per_client(sockets: list, messages: list) -> float:
+    """Old path: encode the message once per socket, like WebSocket.send_json"""
+    start = time.perf_counter()
+    for message in messages:
+        for ws in sockets:
+            await ws.send_text(json.dumps(message, separators=(",", ":"), ensure_ascii=False))
+    return time.perf_counter() - start
+
+
+async def run_queued(sockets: list, messages: list, serialize_once: bool) -> float:
+    """
+    Queued fan-out through ConnectionManager
+
+    serialize_once=True is ConnectionManager.broadcast (one encode, same frame
+    for every socket); False encodes per client like send_json did.
+    """
+    manager = ConnectionManager()
+    manager.max_queue = len(messages) + 1  # Measure fan-out, not the drop policy
+    for ws in sockets:
+        await manager.connect(ws)
+    channels = list(manager.channels.values())
+
+    # Let the welcome messages drain before timing
+    while any(channel._pending for channel in channels):
+        await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    for message in messages:
+        if serialize_once:
+            await manager.broadcast(message)
+        else:
+            for channel in channels:
+                channel.enqueue(message, json.dumps(message, separators=(",", ":"), ensure_ascii=False))
+    while any(channel._pending for channel in channels):
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+
+    for ws in sockets:
+        manager.disconnect(ws)
+    await asyncio.sleep(0)  # Let the cancelled sender tasks finish
+    return elapsed
+
+
+async def main(client_counts: list, message_count: int):
+    messages = [build_game_message(i) for i in range(message_count)]
+    frame_size = len(json.dumps(messages[0], separators=(",", ":")))
+
+    print(f"Encoder: {'orjson' if ORJSON_AVAILABLE else 'json (orjson not installed)'}")
+    print(f"{message_count} game_update messages per run, ~{frame_size} bytes each\n")
+    print(f"{'Clients':>8} {'send_json loop':>15} {'queued, per-client':>19} "
+          f"{'serialize-once':>15} {'speedup':>8}")
+    print("-" * 69)
+
+    for count in client_counts:
+        direct = await run_per_client([FakeWebSocket(i) for i in range(count)], messages)
+        per_client = await run_queued([FakeWebSocket(i) for i in range(count)], messages, False)
+        once = await run_queued([FakeWebSocket(i) for i in range(count)], messages, True)
+        print(f"{count:>8} {direct * 1000:>13.1f}ms {per_client * 1000:>17.1f}ms "
+              f"{once * 1000:>13.1f}ms {per_client / once:>7.1f}x")
+
+    print("\nspeedup = queued per-client encoding / serialize-once")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark WebSocket broadcast fan-out")
+    parser.add_argument("--clients", type=int, nargs="+", default=[100, 1000, 5000],
+                        help="Simulated connection counts")
+    parser.add_argument("--messages", type=int, default=20,
+                        help="Broadcasts per run (roughly one poll cycle)")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.clients, args.messages))
@@ -0,0 +1,68 @@
+"""
+Bounded Thread Pool for Blocking Work
+
+Handlers are async; anything that blocks (sync HTTP clients, pandas file
+reads, OpenAI calls, full log scans) runs here so the event loop stays free
+for WebSocket pings and other requests.
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+import config
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+
+# In-flight / total counters for the admin metrics endpoint
+_active = 0
+_submitted = 0
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get singleton executor for blocking handler work"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=config.API_BLOCKING_WORKERS,
+            thread_name_prefix="api-blocking"
+        )
+    return _executor
+
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a blocking callable on the bounded executor and await its result
+
+    Calls beyond API_BLOCKING_WORKERS wait in the executor's queue rather
+    than starting more threads.
+    """
+    global _active, _submitted
+    _active += 1
+    _submitted += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_executor(), functools.partial(func, *args, **kwargs))
+    finally:
+        _active -= 1
+
+
+def get_executor_stats() -> dict:
+    """Executor size and load"""
+    return {
+        "max_workers": config.API_BLOCKING_WORKERS,
+        "in_flight": _active,
+        "submitted": _submitted
+    }
+
+
+def shutdown_executor() -> None:
+    """Stop the executor (call on shutdown)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,190 @@
+"""
+Streaming Log Exports
+
+Generator pipeline behind /api/export/*: log rows are read one at a time,
+filtered by date range / team / game, and encoded as CSV, gzip-compressed
+CSV or Parquet in chunks, so an export never holds the whole log in memory.
+"""
+
+import csv
+import io
+import logging
+import zlib
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from utils.csv_logger import LIVE_LOG_HEADERS, RESULTS_HEADERS
+
+# Optional Parquet support
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Bytes of encoded output buffered before a chunk is sent
+CHUNK_SIZE = 64 * 1024
+
+# Rows per Parquet row group (each group is written and sent as it fills)
+PARQUET_ROW_GROUP_SIZE = 10000
+
+# format -> (media type, file extension)
+EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "gzip": ("application/gzip", "csv.gz"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+# Column names for each log kind: (headers, date, teams, game id)
+LOG_COLUMNS = {
+    "live_log": (LIVE_LOG_HEADERS, "Timestamp", ("Team 1", "Team 2"), "Game ID"),
+    "results": (RESULTS_HEADERS, "date", ("home_team", "away_team"), "game_id"),
+}
+
+
+def filter_rows(
+    rows: Iterable[Dict],
+    kind: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    team: Optional[str] = None,
+    game_id: Optional[str] = None
+) -> Iterator[Dict]:
+    """
+    Lazily filter log rows
+
+    Args:
+        rows: Rows of a "live_log" or "results" log
+        kind: Which log the rows come from
+        start_date, end_date: Inclusive YYYY-MM-DD bounds on the row's date
+        team: Case-insensitive substring of either team name
+        game_id: Exact game ID
+    """
+    _, date_column, team_columns, id_column = LOG_COLUMNS[kind]
+    team = team.lower() if team else None
+
+    for row in rows:
+        if game_id and row.get(id_column) != game_id:
+            continue
+
+        # ISO timestamps and dates both start with YYYY-MM-DD
+        date = (row.get(date_column) or "")[:10]
+        if start_date and date < start_date:
+            continue
+        if end_date and date > end_date:
+            continue
+
+        if team and not any(team in (row.get(col) or "").lower() for col in team_columns):
+            continue
+
+        yield row
+
+
+def stream_export(rows: Iterator[Dict], kind: str, export_format: str) -> Iterator[bytes]:
+    """Encode rows in the requested format ("csv", "gzip" or "parquet"), chunk by chunk"""
+    headers = LOG_COLUMNS[kind][0]
+
+    # Use the log's own column order (older logs may predate newer columns)
+    first = next(rows, None)
+    if first is not None:
+        headers = list(first.keys())
+        rows = chain([first], rows)
+
+    if export_format == "parquet":
+        return iter_parquet(rows, headers)
+    if export_format == "gzip":
+        return iter_gzip(iter_csv(rows, headers))
+    return iter_csv(rows, headers)
+
+
+def iter_csv(rows: Iterable[Dict], headers: List[str]) -> Iterator[bytes]:
+    """CSV text (header first) in ~CHUNK_SIZE pieces"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(headers)
+    for row in rows:
+        writer.writerow([row.get(h, "") for h in headers])
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def iter_gzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Gzip-compress a byte stream incrementally"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+class _ChunkSink:
+    """Write-only file object that hands written bytes back out in chunks"""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        """Bytes written since the last drain"""
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def iter_parquet(rows: Iterable[Dict], headers: List[str]) -> Iterator[bytes]:
+    """
+    Parquet file bytes, one row group at a time
+
+    Columns are strings, matching the CSV log's values.
+    """
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError("Parquet export requires pyarrow")
+
+    schema = pa.schema([(h, pa.string()) for h in headers])
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="snappy")
+
+    def write_group(batch: List[Dict]):
+        columns = [[row.get(h) for row in batch] for h in headers]
+        writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+
+    try:
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= PARQUET_ROW_GROUP_SIZE:
+                write_group(batch)
+                batch = []
+                yield sink.drain()
+        if batch:
+            write_group(batch)
+    finally:
+        writer.close()
+
+    yield sink.drain()
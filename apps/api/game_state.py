@@ -0,0 +1,311 @@
+"""
+In-Memory Live Game State
+
+- LiveGameStore: latest live log row per game (plus its latest triggered
+  row, a short window of recent rows and running O/U line stats), fed by /api/internal/trigger-update so
+  read endpoints don't touch the log files
+- GameStateCache: latest mapped state of each game with a version number
+  that increases on every update, so WebSocket updates can be sent as
+  deltas (only the fields that changed) against the previous version
+"""
+
+import logging
+import math
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import config
+from utils.csv_logger import LIVE_LOG_HEADERS, build_live_log_row
+
+logger = logging.getLogger(__name__)
+
+# A row counts as a trigger for /api/games/triggered above this confidence
+TRIGGERED_MIN_CONFIDENCE = 40
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    """Equality that treats NaN as equal to NaN"""
+    if isinstance(old, float) and isinstance(new, float) and math.isnan(old) and math.isnan(new):
+        return True
+    return old == new
+
+
+class LiveGameStore:
+    """
+    Latest live log row per game, kept in the API process.
+
+    Rows use the live log's column names and string values, exactly as a
+    CSV reader would return them, so endpoints can treat rows from the
+    store and from the log the same way.
+    """
+
+    def __init__(self, recent_size: int = 1000, max_age: int = 6 * 60 * 60):
+        """
+        Args:
+            recent_size: Number of recent rows (all games) kept for history-based metrics
+            max_age: Seconds after its last row before a game is forgotten
+        """
+        self._latest: Dict[str, Dict[str, str]] = {}
+        self._triggered: Dict[str, Dict[str, str]] = {}  # Latest triggered row per game
+        self._ou_lines: Dict[str, Dict[str, Any]] = {}
+        self._recent: deque = deque(maxlen=recent_size)
+        self.max_age = max_age
+        self.loaded = False
+        self._last_prune = time.monotonic()
+
+    def update(self, game_data: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Record a monitor update (same dict the monitor passes to log_live_poll)
+
+        Returns:
+            The update as a live log row
+        """
+        values = build_live_log_row(game_data)
+        row = {h: "" if v is None else str(v) for h, v in zip(LIVE_LOG_HEADERS, values)}
+        self.add_row(row)
+        return row
+
+    def add_row(self, row: Dict[str, str]) -> None:
+        """Record a row already in live log format"""
+        game_id = row.get("Game ID") or row.get("game_id")
+        if not game_id:
+            return
+
+        self._recent.append(row)
+
+        # Keep the newest row per game even if updates arrive out of order
+        current = self._latest.get(game_id)
+        timestamp = row.get("Timestamp") or row.get("timestamp", "")
+        if current is None or timestamp >= (current.get("Timestamp") or current.get("timestamp", "")):
+            self._latest[game_id] = row
+
+        self._track_trigger(game_id, row, timestamp)
+        self._track_ou_line(game_id, row, timestamp)
+        self._prune()
+
+    def _track_trigger(self, game_id: str, row: Dict[str, str], timestamp: str) -> None:
+        """Remember the row if it is the game's newest trigger above TRIGGERED_MIN_CONFIDENCE"""
+        if not (row.get("Trigger") == "YES" or row.get("trigger_flag") == "True"):
+            return
+        try:
+            confidence = float(row.get("Confidence") or row.get("confidence_score") or 0)
+        except (ValueError, TypeError):
+            return
+        if confidence <= TRIGGERED_MIN_CONFIDENCE:
+            return
+
+        current = self._triggered.get(game_id)
+        if current is None or timestamp >= (current.get("Timestamp") or current.get("timestamp", "")):
+            self._triggered[game_id] = row
+
+    def _track_ou_line(self, game_id: str, row: Dict[str, str], timestamp: str) -> None:
+        """Fold a row's O/U line into the game's running peak/valley/first/last stats"""
+        ou_line = row.get("OU Line") or row.get("ou_line")
+        if not ou_line:
+            return
+        try:
+            line = float(ou_line)
+        except (ValueError, TypeError):
+            return
+
+        stats = self._ou_lines.get(game_id)
+        if stats is None:
+            self._ou_lines[game_id] = {
+                "peak": line,
+                "valley": line,
+                "first": line,
+                "first_seen": timestamp,
+                "current": line,
+                "last_seen": timestamp,
+                "samples": 1
+            }
+            return
+
+        stats["peak"] = max(stats["peak"], line)
+        stats["valley"] = min(stats["valley"], line)
+        stats["samples"] += 1
+        if timestamp < stats["first_seen"]:
+            stats["first"] = line
+            stats["first_seen"] = timestamp
+        if timestamp >= stats["last_seen"]:
+            stats["current"] = line
+            stats["last_seen"] = timestamp
+
+    def warm_load(self, rows: List[Dict[str, str]]) -> None:
+        """Seed the store from live log rows (oldest first), e.g. on startup"""
+        for row in rows:
+            self.add_row(row)
+        self.loaded = True
+        logger.info(f"Live game store loaded {len(rows)} rows for {len(self._latest)} games")
+
+    def latest_rows(self) -> List[Dict[str, str]]:
+        """Most recent row of every game"""
+        return list(self._latest.values())
+
+    def triggered_rows(self, since: Optional[datetime] = None) -> List[Dict[str, str]]:
+        """
+        Latest triggered row of every game that has triggered and is still live
+
+        A game is left out once its latest row is final, and (with since)
+        when its latest row is older than since, so finished games drop off
+        like they do from the live list. The trigger itself may have cleared.
+
+        Args:
+            since: Time the game's latest row must be newer than
+        """
+        rows = []
+        for game_id, row in self._triggered.items():
+            latest = self._latest.get(game_id, row)
+            status = (latest.get("Status") or latest.get("status", "")).lower()
+            if status in ("final", "post", "completed"):
+                continue
+            if since is not None:
+                try:
+                    if datetime.fromisoformat(latest.get("Timestamp") or latest.get("timestamp", "")) <= since:
+                        continue
+                except ValueError:
+                    continue
+            rows.append(row)
+        return rows
+
+    def recent_rows(self, limit: int = 100) -> List[Dict[str, str]]:
+        """Most recent rows across all games (oldest first)"""
+        if limit >= len(self._recent):
+            return list(self._recent)
+        return list(self._recent)[-limit:]
+
+    def ou_line_stats(self, game_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Running O/U line stats of a game, or None if no line has been seen
+
+        Returns:
+            Dict with peak, valley, first/first_seen, current/last_seen,
+            samples and position (STABLE, PEAK, VALLEY or NEUTRAL: which
+            extreme the current line is closer to)
+        """
+        stats = self._ou_lines.get(game_id)
+        if stats is None:
+            return None
+
+        peak, valley, current = stats["peak"], stats["valley"], stats["current"]
+        dist_to_peak = abs(current - peak)
+        dist_to_valley = abs(current - valley)
+
+        if peak == valley:
+            position = "STABLE"  # Line hasn't moved
+        elif dist_to_peak < dist_to_valley:
+            position = "PEAK"  # Closer to peak (high)
+        elif dist_to_valley < dist_to_peak:
+            position = "VALLEY"  # Closer to valley (low)
+        else:
+            position = "NEUTRAL"  # Exactly in the middle
+
+        return {**stats, "position": position}
+
+    def _prune(self) -> None:
+        """Forget games with no rows in max_age seconds (checked at most once a minute)"""
+        now = time.monotonic()
+        if now - self._last_prune < 60:
+            return
+        self._last_prune = now
+
+        cutoff = (datetime.now() - timedelta(seconds=self.max_age)).isoformat()
+        stale = [
+            game_id for game_id, row in self._latest.items()
+            if (row.get("Timestamp") or row.get("timestamp", "")) < cutoff
+        ]
+        for game_id in stale:
+            del self._latest[game_id]
+            self._triggered.pop(game_id, None)
+            self._ou_lines.pop(game_id, None)
+
+
+class GameStateCache:
+    """
+    Latest state and version of every game seen by the API.
+
+    Games that stop updating (finished, or no longer monitored) are pruned
+    after max_age seconds.
+    """
+
+    def __init__(self, snapshot_every: int = 20, max_age: int = 30 * 60):
+        """
+        Args:
+            snapshot_every: Send a full snapshot every N versions of a game
+            max_age: Seconds without an update before a game is dropped
+        """
+        self.snapshot_every = snapshot_every
+        self.max_age = max_age
+        self._games: Dict[str, Dict[str, Any]] = {}
+        self._last_prune = time.monotonic()
+
+    def update(self, game_data: Dict[str, Any]) -> Tuple[int, Dict[str, Any], List[str], bool]:
+        """
+        Store a game's new state and work out what changed.
+
+        Args:
+            game_data: Full mapped game dict (must contain game_id)
+
+        Returns:
+            (version, changed fields, removed field names, full snapshot due)
+        """
+        game_id = str(game_data.get("game_id"))
+        entry = self._games.get(game_id)
+
+        if entry is None:
+            changed = dict(game_data)
+            removed = []
+            version = 1
+        else:
+            previous = entry["state"]
+            changed = {
+                key: value for key, value in game_data.items()
+                if key not in previous or not _same_value(previous[key], value)
+            }
+            removed = [key for key in previous if key not in game_data]
+            version = entry["version"] + 1
+
+        self._games[game_id] = {
+            "version": version,
+            "state": dict(game_data),
+            "updated": time.monotonic()
+        }
+
+        # First sighting and every snapshot_every versions: full state so clients can resync
+        snapshot_due = version == 1 or version % self.snapshot_every == 0
+
+        self._prune()
+        return version, changed, removed, snapshot_due
+
+    def get(self, game_id: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """(version, state) of a game, or None if unknown"""
+        entry = self._games.get(str(game_id))
+        if entry is None:
+            return None
+        return entry["version"], entry["state"]
+
+    def _prune(self) -> None:
+        """Drop games that haven't updated in max_age seconds (checked at most once a minute)"""
+        now = time.monotonic()
+        if now - self._last_prune < 60:
+            return
+        self._last_prune = now
+
+        stale = [gid for gid, e in self._games.items() if now - e["updated"] > self.max_age]
+        for game_id in stale:
+            del self._games[game_id]
+        if stale:
+            logger.debug(f"Pruned {len(stale)} stale games from state cache")
+
+
+# Singleton instance
+_live_game_store = None
+
+def get_live_game_store() -> LiveGameStore:
+    """Get singleton live game store"""
+    global _live_game_store
+    if _live_game_store is None:
+        _live_game_store = LiveGameStore(recent_size=getattr(config, 'RECENT_LOG_BUFFER_SIZE', 1000))
+    return _live_game_store
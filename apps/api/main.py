@@ -1,6 +1,8 @@
 """
 FastAPI Backend for NCAA Basketball Betting Monitor
 """
+import base64
+import json
 import sys
 from pathlib import Path
 
@@ -9,14 +11,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "monitor"))
 # Add api directory to path so we can import local modules
 sys.path.insert(0, str(Path(__file__).parent))
 
-from fastapi import FastAPI, Depends, HTTPException, status, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Depends, HTTPException, Request, status, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict
 from datetime import datetime, timedelta
 import logging
 import asyncio
+import time
 import pandas as pd
 import numpy as np
 import config
@@ -42,6 +45,12 @@ from utils.pregame_analyzer import get_pregame_analyzer
 from utils.espn_live_fetcher import get_espn_live_fetcher
 from utils.referee_stats import get_referee_stats_manager
 from websocket_manager import manager as ws_manager
+from game_state import get_live_game_store
+from response_cache import ResponseCache
+from exports import EXPORT_FORMATS, PYARROW_AVAILABLE, filter_rows, stream_export
+from executor import run_blocking, get_executor_stats, shutdown_executor
+from metrics import LatencyHistograms
+from utils.http_client import close_async_http_client
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -53,6 +62,23 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Cached bodies for read-heavy dashboard endpoints (ETag / 304 support)
+response_cache = ResponseCache(ttl=config.RESPONSE_CACHE_TTL)
+
+# Per-route request latency
+latency_histograms = LatencyHistograms()
+
+
+@app.middleware("http")
+async def record_route_latency(request: Request, call_next):
+    """Record request latency under the matched route template"""
+    start = time.perf_counter()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    path = getattr(route, "path", None) or "unmatched"
+    latency_histograms.observe(f"{request.method} {path}", time.perf_counter() - start)
+    return response
+
 # CORS - Allow all origins for testing
 app.add_middleware(
     CORSMiddleware,
@@ -63,6 +89,35 @@ app.add_middleware(
 )
 
 
+# ========== STARTUP ==========
+
+@app.on_event("startup")
+async def warm_load_live_game_store():
+    """Seed the in-memory live game store from the tail of the live log"""
+    try:
+        csv_logger = get_csv_logger()
+        rows = csv_logger.get_recent_logs(limit=config.RECENT_LOG_BUFFER_SIZE)
+        get_live_game_store().warm_load(rows)
+    except Exception as e:
+        logger.error(f"Error warm-loading live game store: {e}")
+
+
+@app.on_event("startup")
+async def start_team_stats_refresh():
+    """Load team stats in the background so startup and requests don't wait on it"""
+    try:
+        get_stats_manager().refresh_in_background()
+    except Exception as e:
+        logger.error(f"Error starting team stats refresh: {e}")
+
+
+@app.on_event("shutdown")
+async def release_shared_resources():
+    """Close the pooled HTTP client and the blocking-work executor"""
+    await close_async_http_client()
+    shutdown_executor()
+
+
 # ========== MODELS ==========
 
 class LoginRequest(BaseModel):
@@ -109,6 +164,10 @@ class TriggerUpdate(BaseModel):
     update_type: str = "game_update"  # game_update, trigger, alert
 
 
+class TriggerUpdateBatch(BaseModel):
+    updates: List[TriggerUpdate]
+
+
 # ========== AUTH ENDPOINTS ==========
 
 @app.post("/api/auth/login", response_model=Token)
@@ -266,27 +325,14 @@ async def get_live_games():  # Auth disabled for testing
     from datetime import datetime, timedelta
     import config
 
-    csv_logger = get_csv_logger()
-
-    # Get recent logs (last 100 entries)
-    logs = csv_logger.get_recent_logs(limit=100)
-
-    # Group by game_id and get most recent entry for each game
-    games_dict = {}
-
-    for log in logs:
-        game_id = log.get("Game ID") or log.get("game_id")  # Support both new and old format
-        timestamp = log.get("Timestamp") or log.get("timestamp", "")
-
-        # Only include if more recent or first entry
-        if game_id not in games_dict or timestamp > games_dict[game_id].get("Timestamp", games_dict[game_id].get("timestamp", "")):
-            games_dict[game_id] = log
+    # Served from the in-memory store fed by the monitor (no log file reads)
+    live_store = get_live_game_store()
 
     # Filter to only games updated in last 30 minutes (actively being monitored)
     cutoff_time = datetime.now() - timedelta(minutes=30)
     active_games = []
 
-    for game in games_dict.values():
+    for game in live_store.latest_rows():
         # Filter out completed games by status
         status = game.get("Status") or game.get("status", "")
         if status and status.lower() in ['final', 'post', 'completed']:
@@ -317,60 +363,26 @@ async def get_live_games():  # Auth disabled for testing
     # Sort by confidence score (highest first)
     active_games.sort(key=lambda x: float(x.get("Confidence") or x.get("confidence_score", 0)), reverse=True)
 
-    # Calculate O/U peak/valley for each game
-    def calculate_ou_peak_valley(game_id, all_logs):
-        """Calculate peak/valley info for O/U line based on game history"""
-        game_logs = [log for log in all_logs if (log.get("Game ID") or log.get("game_id")) == game_id]
-        if not game_logs:
-            return None, None, None, None
-
-        ou_lines = []
-        for log in game_logs:
-            ou_line = log.get("OU Line") or log.get("ou_line")
-            if ou_line:
-                try:
-                    ou_lines.append(float(ou_line))
-                except (ValueError, TypeError):
-                    pass
-
-        if not ou_lines:
-            return None, None, None, None
-
-        peak = max(ou_lines)  # Highest O/U line
-        valley = min(ou_lines)  # Lowest O/U line
-        current = ou_lines[-1]  # Most recent O/U line
-
-        # Calculate distance to peak vs valley
-        dist_to_peak = abs(current - peak)
-        dist_to_valley = abs(current - valley)
-
-        # Determine position
-        if peak == valley:
-            position = "STABLE"  # Line hasn't moved
-        elif dist_to_peak < dist_to_valley:
-            position = "PEAK"  # Closer to peak (high)
-        elif dist_to_valley < dist_to_peak:
-            position = "VALLEY"  # Closer to valley (low)
-        else:
-            position = "NEUTRAL"  # Exactly in the middle
-
-        return peak, valley, position, current
-
     # Map new column names to old names for frontend compatibility
     mapped_games = []
     referee_manager = get_referee_stats_manager()
 
     for game in active_games:
         game_id = game.get("Game ID") or game.get("game_id")
-        ou_peak, ou_valley, ou_position, current_ou = calculate_ou_peak_valley(game_id, logs)
+        ou_stats = live_store.ou_line_stats(game_id) or {}
 
         # Use helper function to map CSV data to frontend format
         mapped_game = map_game_data(game)
 
-        # Add OU peak/valley data
-        mapped_game["ou_peak"] = ou_peak
-        mapped_game["ou_valley"] = ou_valley
-        mapped_game["ou_position"] = ou_position
+        # Add OU peak/valley data (running stats kept by the live store)
+        mapped_game["ou_peak"] = ou_stats.get("peak")
+        mapped_game["ou_valley"] = ou_stats.get("valley")
+        mapped_game["ou_position"] = ou_stats.get("position")
+
+        # First/last seen lines for line-movement charts
+        mapped_game["ou_first"] = ou_stats.get("first")
+        mapped_game["ou_first_seen"] = ou_stats.get("first_seen")
+        mapped_game["ou_last_seen"] = ou_stats.get("last_seen")
 
         # Add referee crew stats
         referees = mapped_game.get("referees", [])
@@ -388,27 +400,13 @@ async def get_live_games():  # Auth disabled for testing
 @app.get("/api/games/triggered")
 async def get_triggered_games():  # Auth disabled for testing
     """Get only games that have triggered (confidence > 40)"""
-    csv_logger = get_csv_logger()
-
-    # Get recent logs
-    logs = csv_logger.get_recent_logs(limit=200)
-
-    # Filter triggered games (confidence > 40) and get most recent for each
-    games_dict = {}
-
-    for log in logs:
-        if log.get("trigger_flag") == "True":
-            confidence = float(log.get("confidence_score", 0))
-
-            if confidence > 40:
-                game_id = log.get("game_id")
-                timestamp = log.get("timestamp", "")
-
-                if game_id not in games_dict or timestamp > games_dict[game_id].get("timestamp", ""):
-                    games_dict[game_id] = log
+    # Latest triggered row per game from the in-memory store (no log file reads),
+    # for games still being monitored: same 30-minute window as /api/games/live,
+    # and dropped once the game is final
+    cutoff_time = datetime.now() - timedelta(minutes=30)
+    games = get_live_game_store().triggered_rows(since=cutoff_time)
 
-    games = list(games_dict.values())
-    games.sort(key=lambda x: float(x.get("confidence_score", 0)), reverse=True)
+    games.sort(key=lambda x: float(x.get("Confidence") or x.get("confidence_score") or 0), reverse=True)
 
     return {"games": games, "count": len(games)}
 
@@ -418,10 +416,8 @@ async def get_game_history(game_id: str):  # Auth disabled for testing
     """Get historical data for a specific game"""
     csv_logger = get_csv_logger()
 
-    logs = csv_logger.get_recent_logs(limit=1000)
-
-    # Support both old and new column names
-    game_logs = [log for log in logs if (log.get("Game ID") or log.get("game_id")) == game_id]
+    # Full history for this game only (per-game side file)
+    game_logs = await run_blocking(csv_logger.get_game_history, game_id)
     game_logs.sort(key=lambda x: x.get("Timestamp") or x.get("timestamp", ""))
 
     # Map new column names to old names for frontend compatibility
@@ -466,70 +462,8 @@ async def generate_ai_summary(game_id: str):  # Auth disabled for testing
     - Key factors supporting the recommendation
     """
     try:
-        csv_logger = get_csv_logger()
-        stats_manager = get_stats_manager()
-        ai_generator = get_ai_summary_generator()
-
-        # Get latest game data from CSV logs
-        logs = csv_logger.get_recent_logs(limit=1000)
-        game_logs = [log for log in logs if (log.get("Game ID") or log.get("game_id")) == game_id]
-
-        if not game_logs:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No data found for game {game_id}"
-            )
-
-        # Get most recent log entry for this game
-        game_logs.sort(key=lambda x: x.get("Timestamp") or x.get("timestamp", ""), reverse=True)
-        latest_log = game_logs[0]
-
-        # Extract game data
-        home_team = latest_log.get("Team 2") or latest_log.get("home_team")
-        away_team = latest_log.get("Team 1") or latest_log.get("away_team")
-
-        # Build game data dict for AI
-        game_data = {
-            "game_id": game_id,
-            "home_team": home_team,
-            "away_team": away_team,
-            "home_score": int(latest_log.get("Score 2", 0) or 0),
-            "away_score": int(latest_log.get("Score 1", 0) or 0),
-            "total_points": int(latest_log.get("Score 1", 0) or 0) + int(latest_log.get("Score 2", 0) or 0),
-            "period": latest_log.get("Period") or latest_log.get("period", 1),
-            "minutes_remaining": latest_log.get("Mins Remaining") or latest_log.get("minutes_remaining", 20),
-            "ou_line": float(latest_log.get("OU Line", 0) or 0),
-            "required_ppm": float(latest_log.get("Required PPM", 0) or 0),
-            "current_ppm": float(latest_log.get("Current PPM", 0) or 0),
-            "confidence_score": float(latest_log.get("Confidence", 0) or 0),
-            "bet_type": latest_log.get("Bet Type") or latest_log.get("bet_type", "under"),
-        }
-
-        # Get team metrics if available
-        home_metrics = None
-        away_metrics = None
-
-        try:
-            home_metrics = stats_manager.get_team_metrics(home_team)
-            away_metrics = stats_manager.get_team_metrics(away_team)
-        except Exception as e:
-            logger.warning(f"Could not fetch team metrics: {e}")
-
-        # Generate AI summary
-        summary_result = ai_generator.generate_summary(
-            game_data=game_data,
-            home_metrics=home_metrics,
-            away_metrics=away_metrics
-        )
-
-        return {
-            "game_id": game_id,
-            "summary": summary_result.get("summary", ""),
-            "recommendation": summary_result.get("recommendation", "PASS"),
-            "reasoning": summary_result.get("reasoning", ""),
-            "game_data": game_data,
-            "timestamp": datetime.now().isoformat()
-        }
+        # Log read, team stats and the OpenAI call all block - run them off the event loop
+        return await run_blocking(_generate_ai_summary, game_id)
 
     except HTTPException:
         raise
@@ -541,6 +475,73 @@ async def generate_ai_summary(game_id: str):  # Auth disabled for testing
         )
 
 
+def _generate_ai_summary(game_id: str) -> dict:
+    """Build the game context and request the AI summary (blocking - call via run_blocking)"""
+    csv_logger = get_csv_logger()
+    stats_manager = get_stats_manager()
+    ai_generator = get_ai_summary_generator()
+
+    # Get latest game data from CSV logs
+    game_logs = csv_logger.get_game_history(game_id)
+
+    if not game_logs:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No data found for game {game_id}"
+        )
+
+    # Get most recent log entry for this game
+    game_logs.sort(key=lambda x: x.get("Timestamp") or x.get("timestamp", ""), reverse=True)
+    latest_log = game_logs[0]
+
+    # Extract game data
+    home_team = latest_log.get("Team 2") or latest_log.get("home_team")
+    away_team = latest_log.get("Team 1") or latest_log.get("away_team")
+
+    # Build game data dict for AI
+    game_data = {
+        "game_id": game_id,
+        "home_team": home_team,
+        "away_team": away_team,
+        "home_score": int(latest_log.get("Score 2", 0) or 0),
+        "away_score": int(latest_log.get("Score 1", 0) or 0),
+        "total_points": int(latest_log.get("Score 1", 0) or 0) + int(latest_log.get("Score 2", 0) or 0),
+        "period": latest_log.get("Period") or latest_log.get("period", 1),
+        "minutes_remaining": latest_log.get("Mins Remaining") or latest_log.get("minutes_remaining", 20),
+        "ou_line": float(latest_log.get("OU Line", 0) or 0),
+        "required_ppm": float(latest_log.get("Required PPM", 0) or 0),
+        "current_ppm": float(latest_log.get("Current PPM", 0) or 0),
+        "confidence_score": float(latest_log.get("Confidence", 0) or 0),
+        "bet_type": latest_log.get("Bet Type") or latest_log.get("bet_type", "under"),
+    }
+
+    # Get team metrics if available
+    home_metrics = None
+    away_metrics = None
+
+    try:
+        home_metrics = stats_manager.get_team_metrics(home_team)
+        away_metrics = stats_manager.get_team_metrics(away_team)
+    except Exception as e:
+        logger.warning(f"Could not fetch team metrics: {e}")
+
+    # Generate AI summary
+    summary_result = ai_generator.generate_summary(
+        game_data=game_data,
+        home_metrics=home_metrics,
+        away_metrics=away_metrics
+    )
+
+    return {
+        "game_id": game_id,
+        "summary": summary_result.get("summary", ""),
+        "recommendation": summary_result.get("recommendation", "PASS"),
+        "reasoning": summary_result.get("reasoning", ""),
+        "game_data": game_data,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
 @app.get("/api/games/upcoming")
 async def get_upcoming_games(hours_ahead: Optional[int] = 24):
     """
@@ -561,10 +562,12 @@ async def get_upcoming_games(hours_ahead: Optional[int] = 24):
         today = now.strftime("%Y%m%d")
         tomorrow = (now + timedelta(days=1)).strftime("%Y%m%d")
 
-        # Fetch today's and tomorrow's games
-        all_scheduled = []
-        all_scheduled.extend(espn_fetcher.fetch_scheduled_games(date=today, include_odds=True))
-        all_scheduled.extend(espn_fetcher.fetch_scheduled_games(date=tomorrow, include_odds=True))
+        # Fetch today's and tomorrow's games concurrently (async client, no thread needed)
+        today_games, tomorrow_games = await asyncio.gather(
+            espn_fetcher.fetch_scheduled_games_async(date=today, include_odds=True),
+            espn_fetcher.fetch_scheduled_games_async(date=tomorrow, include_odds=True)
+        )
+        all_scheduled = today_games + tomorrow_games
 
         logger.info(f"Fetched {len(all_scheduled)} total scheduled games from ESPN")
 
@@ -587,101 +590,8 @@ async def get_upcoming_games(hours_ahead: Optional[int] = 24):
 
         logger.info(f"Found {len(filtered_games)} games within {hours_ahead} hours")
 
-        # Analyze each game with team stats
-        stats_manager = get_stats_manager()
-        pregame_analyzer = get_pregame_analyzer()
-        enriched_games = []
-
-        for game in filtered_games:
-            try:
-                game_id = game.get('game_id')
-                home_team = game.get('home_team')
-                away_team = game.get('away_team')
-                game_date_str = game.get('game_date')
-
-                # Skip if missing essential data
-                if not all([game_id, home_team, away_team]):
-                    continue
-
-                # Get O/U line (prefer opening, fall back to current)
-                ou_line = game.get('ou_open') or game.get('over_under')
-                if not ou_line:
-                    logger.debug(f"No O/U line for {away_team} @ {home_team}")
-                    continue
-
-                # Get team metrics
-                home_metrics, away_metrics = stats_manager.get_matchup_metrics(home_team, away_team)
-
-                # Skip if we don't have stats for both teams
-                if not home_metrics or not away_metrics:
-                    logger.debug(f"Missing team stats for {away_team} @ {home_team}")
-                    continue
-
-                # Run pregame analysis
-                analysis = pregame_analyzer.analyze_matchup(
-                    home_metrics,
-                    away_metrics,
-                    ou_line
-                )
-
-                # Calculate time until start
-                time_until_start = "Unknown"
-                if game_date_str:
-                    try:
-                        game_time = datetime.fromisoformat(game_date_str.replace('Z', '+00:00'))
-                        if game_time.tzinfo:
-                            game_time = game_time.replace(tzinfo=None)
-
-                        time_diff = game_time - now
-                        hours_until = int(time_diff.total_seconds() // 3600)
-                        minutes_until = int((time_diff.total_seconds() % 3600) // 60)
-                        time_until_start = f"{hours_until}h {minutes_until}m"
-                    except:
-                        pass
-
-                # Build enriched game object
-                enriched_game = {
-                    'game_id': game_id,
-                    'home_team': home_team,
-                    'away_team': away_team,
-                    'commence_time': game_date_str,
-                    'time_until_start': time_until_start,
-
-                    # Odds (from ESPN single API call)
-                    'ou_line': ou_line,
-                    'ou_line_opening': game.get('ou_open'),
-                    'ou_line_closing': game.get('ou_close'),
-                    'sportsbook': game.get('provider', 'ESPN'),
-
-                    # Pregame prediction
-                    'predicted_total': analysis['predicted_total'],
-                    'edge': analysis['edge'],
-                    'confidence_score': analysis['under_score'],
-                    'recommendation': analysis['recommendation'],
-                    'factors': analysis['factors'],
-
-                    # Team metrics (selected important ones)
-                    'home_metrics': {
-                        'pace': home_metrics.get('pace'),
-                        'def_eff': home_metrics.get('def_efficiency'),
-                        'off_eff': home_metrics.get('off_efficiency'),
-                        'avg_ppg': home_metrics.get('avg_ppg'),
-                        'three_point_rate': home_metrics.get('three_p_rate'),
-                    },
-                    'away_metrics': {
-                        'pace': away_metrics.get('pace'),
-                        'def_eff': away_metrics.get('def_efficiency'),
-                        'off_eff': away_metrics.get('off_efficiency'),
-                        'avg_ppg': away_metrics.get('avg_ppg'),
-                        'three_point_rate': away_metrics.get('three_p_rate'),
-                    }
-                }
-
-                enriched_games.append(enriched_game)
-
-            except Exception as e:
-                logger.error(f"Error enriching game {game.get('game_id')}: {e}")
-                continue
+        # Team stats lookups can hit disk/network - run the analysis off the event loop
+        enriched_games = await run_blocking(_enrich_upcoming_games, filtered_games, now)
 
         # Sort by confidence score (highest first)
         enriched_games.sort(key=lambda x: x['confidence_score'], reverse=True)
@@ -702,101 +612,276 @@ async def get_upcoming_games(hours_ahead: Optional[int] = 24):
         )
 
 
+def _enrich_upcoming_games(filtered_games: List[Dict], now: datetime) -> List[Dict]:
+    """Run pregame analysis for scheduled games (blocking - call via run_blocking)"""
+    # Analyze each game with team stats
+    stats_manager = get_stats_manager()
+    pregame_analyzer = get_pregame_analyzer()
+    enriched_games = []
+
+    for game in filtered_games:
+        try:
+            game_id = game.get('game_id')
+            home_team = game.get('home_team')
+            away_team = game.get('away_team')
+            game_date_str = game.get('game_date')
+
+            # Skip if missing essential data
+            if not all([game_id, home_team, away_team]):
+                continue
+
+            # Get O/U line (prefer opening, fall back to current)
+            ou_line = game.get('ou_open') or game.get('over_under')
+            if not ou_line:
+                logger.debug(f"No O/U line for {away_team} @ {home_team}")
+                continue
+
+            # Get team metrics
+            home_metrics, away_metrics = stats_manager.get_matchup_metrics(home_team, away_team)
+
+            # Skip if we don't have stats for both teams
+            if not home_metrics or not away_metrics:
+                logger.debug(f"Missing team stats for {away_team} @ {home_team}")
+                continue
+
+            # Run pregame analysis
+            analysis = pregame_analyzer.analyze_matchup(
+                home_metrics,
+                away_metrics,
+                ou_line
+            )
+
+            # Calculate time until start
+            time_until_start = "Unknown"
+            if game_date_str:
+                try:
+                    game_time = datetime.fromisoformat(game_date_str.replace('Z', '+00:00'))
+                    if game_time.tzinfo:
+                        game_time = game_time.replace(tzinfo=None)
+
+                    time_diff = game_time - now
+                    hours_until = int(time_diff.total_seconds() // 3600)
+                    minutes_until = int((time_diff.total_seconds() % 3600) // 60)
+                    time_until_start = f"{hours_until}h {minutes_until}m"
+                except:
+                    pass
+
+            # Build enriched game object
+            enriched_game = {
+                'game_id': game_id,
+                'home_team': home_team,
+                'away_team': away_team,
+                'commence_time': game_date_str,
+                'time_until_start': time_until_start,
+
+                # Odds (from ESPN single API call)
+                'ou_line': ou_line,
+                'ou_line_opening': game.get('ou_open'),
+                'ou_line_closing': game.get('ou_close'),
+                'sportsbook': game.get('provider', 'ESPN'),
+
+                # Pregame prediction
+                'predicted_total': analysis['predicted_total'],
+                'edge': analysis['edge'],
+                'confidence_score': analysis['under_score'],
+                'recommendation': analysis['recommendation'],
+                'factors': analysis['factors'],
+
+                # Team metrics (selected important ones)
+                'home_metrics': {
+                    'pace': home_metrics.get('pace'),
+                    'def_eff': home_metrics.get('def_efficiency'),
+                    'off_eff': home_metrics.get('off_efficiency'),
+                    'avg_ppg': home_metrics.get('avg_ppg'),
+                    'three_point_rate': home_metrics.get('three_p_rate'),
+                },
+                'away_metrics': {
+                    'pace': away_metrics.get('pace'),
+                    'def_eff': away_metrics.get('def_efficiency'),
+                    'off_eff': away_metrics.get('off_efficiency'),
+                    'avg_ppg': away_metrics.get('avg_ppg'),
+                    'three_point_rate': away_metrics.get('three_p_rate'),
+                }
+            }
+
+            enriched_games.append(enriched_game)
+
+        except Exception as e:
+            logger.error(f"Error enriching game {game.get('game_id')}: {e}")
+            continue
+
+    return enriched_games
+
+
 @app.get("/api/games/completed")
-async def get_completed_games(limit: Optional[int] = 20):
-    """Get games with historical data from live log"""
+async def get_completed_games(
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    format: str = "json"
+):
+    """
+    Stream games with their history from the live log, newest first
+
+    Pages come from the loggers' index of game end times, so only the
+    requested games' rows are read. Pass the returned next_cursor (also in
+    the X-Next-Cursor header) to get the following page; it is null on the
+    last page.
+
+    format=json streams {"games": [...], "count": n, "next_cursor": ...};
+    format=ndjson streams one game per line, then a {"next_cursor": ...} line.
+    """
+    if format not in ("json", "ndjson"):
+        raise HTTPException(status_code=400, detail="format must be 'json' or 'ndjson'")
+
+    limit = max(1, min(limit, config.COMPLETED_GAMES_MAX_PAGE))
+    before = _decode_games_cursor(cursor) if cursor else None
+    csv_logger = get_csv_logger()
+
+    # One extra entry tells us whether there is a next page
+    entries = await run_blocking(csv_logger.get_games_by_end_time, limit + 1, before)
+    page = entries[:limit]
+    next_cursor = _encode_games_cursor(page[-1]) if len(entries) > limit else None
+
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    if format == "ndjson":
+        return StreamingResponse(
+            _stream_completed_games_ndjson(page, next_cursor),
+            media_type="application/x-ndjson",
+            headers=headers
+        )
+    return StreamingResponse(
+        _stream_completed_games_json(page, next_cursor),
+        media_type="application/json",
+        headers=headers
+    )
+
+
+def _encode_games_cursor(entry: tuple) -> str:
+    """Opaque cursor for an (end timestamp, game_id) index entry"""
+    return base64.urlsafe_b64encode(json.dumps(list(entry)).encode()).decode()
+
+
+def _decode_games_cursor(cursor: str) -> tuple:
+    """Inverse of _encode_games_cursor"""
+    try:
+        ended, game_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return str(ended), str(game_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _iter_completed_games(page: list):
+    """Read and build one game at a time (sync generator, run in Starlette's threadpool)"""
     csv_logger = get_csv_logger()
 
-    # Get all logs and group by game_id
-    logs = csv_logger.get_recent_logs(limit=5000)
+    # Games logged before per-game side files: one log scan for the whole page
+    csv_logger.prepare_game_histories([game_id for _, game_id in page])
 
-    # Group by game_id
-    games_by_id = {}
-    for log in logs:
-        game_id = log.get("Game ID") or log.get("game_id")
-        if game_id:
-            if game_id not in games_by_id:
-                games_by_id[game_id] = []
-            games_by_id[game_id].append(log)
+    for _, game_id in page:
+        completed_game = _build_completed_game(game_id, csv_logger.get_game_history(game_id))
+        if completed_game:
+            yield completed_game
 
-    # Build completed games list
-    completed_games_with_history = []
 
-    for game_id, game_logs in list(games_by_id.items())[:limit]:
-        # Sort by timestamp
-        game_logs.sort(key=lambda x: x.get("Timestamp") or x.get("timestamp", ""))
+def _stream_completed_games_json(page: list, next_cursor: Optional[str]):
+    """Chunked JSON body with the same shape as the old non-paginated response"""
+    yield '{"games":['
+    count = 0
+    for completed_game in _iter_completed_games(page):
+        yield ("," if count else "") + json.dumps(completed_game)
+        count += 1
+    yield '],"count":' + str(count) + ',"next_cursor":' + json.dumps(next_cursor) + '}'
 
-        if not game_logs:
-            continue
 
-        # Get first and last entries
-        first_entry = game_logs[0]
-        last_entry = game_logs[-1]
+def _stream_completed_games_ndjson(page: list, next_cursor: Optional[str]):
+    """One game per line, then a trailer line with the next page's cursor"""
+    for completed_game in _iter_completed_games(page):
+        yield json.dumps(completed_game) + "\n"
+    yield json.dumps({"next_cursor": next_cursor}) + "\n"
 
-        # Extract team names and scores
-        away_team = first_entry.get("Team 1") or first_entry.get("away_team", "Unknown")
-        home_team = first_entry.get("Team 2") or first_entry.get("home_team", "Unknown")
 
-        final_away = int(last_entry.get("Score 1", 0) or 0)
-        final_home = int(last_entry.get("Score 2", 0) or 0)
-        final_total = final_away + final_home
+def _build_completed_game(game_id: str, game_logs: list) -> Optional[dict]:
+    """Summarize one game's live log rows (final score, O/U result, history)"""
+    if not game_logs:
+        return None
 
-        ou_line = float(last_entry.get("OU Line") or last_entry.get("ou_line", 0))
+    # Sort by timestamp
+    game_logs.sort(key=lambda x: x.get("Timestamp") or x.get("timestamp", ""))
 
-        # Determine O/U result
-        if final_total > ou_line:
-            ou_result = "over"
-        elif final_total < ou_line:
-            ou_result = "under"
-        else:
-            ou_result = "push"
-
-        # Get timestamp
-        timestamp = last_entry.get("Timestamp") or last_entry.get("timestamp", "")
-        date = timestamp.split("T")[0] if timestamp else ""
-
-        # Map historical data
-        mapped_history = []
-        for log in game_logs:
-            mapped_log = {
-                "timestamp": log.get("Timestamp") or log.get("timestamp"),
-                "total_points": int(log.get("Score 1", 0) or 0) + int(log.get("Score 2", 0) or 0),
-                "ou_line": float(log.get("OU Line") or log.get("ou_line", 0)),
-                "period": log.get("Period") or log.get("period"),
-                "minutes_remaining": float(log.get("Mins Remaining") or log.get("minutes_remaining", 0)),
-                "bet_type": log.get("Bet Type") or log.get("bet_type", ""),
-            }
-            mapped_history.append(mapped_log)
-
-        completed_game = {
-            "game_id": game_id,
-            "date": date,
-            "home_team": home_team,
-            "away_team": away_team,
-            "away_score": final_away,
-            "home_score": final_home,
-            "final_total": final_total,
-            "ou_line": ou_line,
-            "ou_result": ou_result,
-            "our_trigger": last_entry.get("Bet Type") or "",
-            "outcome": "",  # Not available without results CSV
-            "unit_profit": 0,  # Not available without results CSV
-            "history": mapped_history,
-        }
+    # Get first and last entries
+    first_entry = game_logs[0]
+    last_entry = game_logs[-1]
 
-        completed_games_with_history.append(completed_game)
+    # Extract team names and scores
+    away_team = first_entry.get("Team 1") or first_entry.get("away_team", "Unknown")
+    home_team = first_entry.get("Team 2") or first_entry.get("home_team", "Unknown")
 
-    # Sort by date/timestamp descending
-    completed_games_with_history.sort(key=lambda x: x.get("date", ""), reverse=True)
+    final_away = int(last_entry.get("Score 1", 0) or 0)
+    final_home = int(last_entry.get("Score 2", 0) or 0)
+    final_total = final_away + final_home
 
-    return {"games": completed_games_with_history, "count": len(completed_games_with_history)}
+    ou_line = float(last_entry.get("OU Line") or last_entry.get("ou_line", 0))
+
+    # Determine O/U result
+    if final_total > ou_line:
+        ou_result = "over"
+    elif final_total < ou_line:
+        ou_result = "under"
+    else:
+        ou_result = "push"
+
+    # Get timestamp
+    timestamp = last_entry.get("Timestamp") or last_entry.get("timestamp", "")
+    date = timestamp.split("T")[0] if timestamp else ""
+
+    # Map historical data
+    mapped_history = []
+    for log in game_logs:
+        mapped_log = {
+            "timestamp": log.get("Timestamp") or log.get("timestamp"),
+            "total_points": int(log.get("Score 1", 0) or 0) + int(log.get("Score 2", 0) or 0),
+            "ou_line": float(log.get("OU Line") or log.get("ou_line", 0)),
+            "period": log.get("Period") or log.get("period"),
+            "minutes_remaining": float(log.get("Mins Remaining") or log.get("minutes_remaining", 0)),
+            "bet_type": log.get("Bet Type") or log.get("bet_type", ""),
+        }
+        mapped_history.append(mapped_log)
+
+    return {
+        "game_id": game_id,
+        "date": date,
+        "home_team": home_team,
+        "away_team": away_team,
+        "away_score": final_away,
+        "home_score": final_home,
+        "final_total": final_total,
+        "ou_line": ou_line,
+        "ou_result": ou_result,
+        "our_trigger": last_entry.get("Bet Type") or "",
+        "outcome": "",  # Not available without results CSV
+        "unit_profit": 0,  # Not available without results CSV
+        "history": mapped_history,
+    }
 
 
 # ========== STATS ENDPOINTS ==========
 
 @app.get("/api/stats/performance", response_model=PerformanceStats)
-async def get_performance_stats():  # Auth disabled for testing
-    """Get betting performance statistics"""
+async def get_performance_stats(request: Request):  # Auth disabled for testing
+    """Get betting performance statistics (cached until the results log changes)"""
+    csv_logger = get_csv_logger()
+    today = datetime.now().strftime("%Y-%m-%d")
+
+    return await response_cache.respond(
+        request,
+        key=("performance", today),
+        version=csv_logger.data_version("results"),
+        compute=_build_performance_stats
+    )
+
+
+def _build_performance_stats() -> dict:
+    """All-time performance stats with today's stats attached"""
     from datetime import datetime
     csv_logger = get_csv_logger()
 
@@ -836,6 +921,8 @@ async def get_team_stats(
     metrics = stats_manager.get_team_metrics(team_name)
 
     if not metrics:
+        if stats_manager.fetcher.stats_cache is None:
+            raise HTTPException(status_code=503, detail="Team stats are still loading")
         raise HTTPException(status_code=404, detail=f"Team not found: {team_name}")
 
     return metrics
@@ -843,6 +930,7 @@ async def get_team_stats(
 
 @app.get("/api/stats/ppm-analysis")
 async def get_ppm_analysis(
+    request: Request,
     days: int = 30
 ):
     """
@@ -851,14 +939,23 @@ async def get_ppm_analysis(
     Analyzes performance at 0.1 PPM intervals from 0.5 to 10.0
     Shows win rate, ROI, and sample size for each threshold
     Recommends optimal threshold based on historical performance
+
+    Cached until the live log or results log changes.
     """
     analyzer = get_ppm_analyzer()
-    analysis = analyzer.analyze_ppm_performance(days=days)
-    return analysis
+    csv_logger = get_csv_logger()
+
+    return await response_cache.respond(
+        request,
+        key=("ppm-analysis", days, datetime.now().strftime("%Y-%m-%d")),
+        version=f"{csv_logger.data_version('live_log')}:{csv_logger.data_version('results')}",
+        compute=lambda: analyzer.analyze_ppm_performance(days=days)
+    )
 
 
 @app.get("/api/stats/daily-summary")
 async def get_daily_summary(
+    request: Request,
     date: Optional[str] = None
 ):
     """
@@ -878,25 +975,30 @@ async def get_daily_summary(
 
     if date:
         try:
-            from datetime import datetime
             target_date = datetime.fromisoformat(date)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
     else:
         target_date = None
 
-    summary = analyzer.generate_daily_summary(date=target_date)
-    return summary
+    # Cached until the live log changes
+    return await response_cache.respond(
+        request,
+        key=("daily-summary", date or datetime.now().strftime("%Y-%m-%d")),
+        version=get_csv_logger().data_version("live_log"),
+        compute=lambda: analyzer.generate_daily_summary(date=target_date)
+    )
 
 
 @app.post("/api/stats/refresh")
 async def refresh_team_stats():
-    """Refresh team statistics"""
+    """Start a background refresh of team statistics (current stats are served until it finishes)"""
     stats_manager = get_stats_manager()
 
     try:
-        stats_manager.fetch_all_stats(force_refresh=True)
-        return {"status": "success", "message": "Team stats refreshed"}
+        if stats_manager.refresh_in_background(force_refresh=True):
+            return {"status": "started", "message": "Team stats refresh started"}
+        return {"status": "in_progress", "message": "Team stats refresh already running"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -963,6 +1065,16 @@ async def admin_update_weights(
     return {"status": "success", "weights": update.weights}
 
 
+@app.get("/api/admin/metrics/latency")
+async def admin_latency_metrics():
+    """Per-route latency histograms and blocking executor load"""
+    return {
+        "routes": latency_histograms.snapshot(),
+        "executor": get_executor_stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
 @app.get("/api/admin/system/status")
 async def admin_system_status():
     """Get system status"""
@@ -973,40 +1085,187 @@ async def admin_system_status():
         "data_source": "kenpom" if config.USE_KENPOM else "espn",
         "environment": config.ENVIRONMENT,
         "last_stats_fetch": getattr(stats_manager.fetcher, "last_fetch", None),
-        "stats_cached": stats_manager.fetcher.stats_cache is not None
+        "stats_cached": stats_manager.fetcher.stats_cache is not None,
+        "stats_refresh": stats_manager.get_refresh_status(),
+        "response_cache": response_cache.get_stats()
     }
 
 
 # ========== DATA EXPORT ENDPOINTS ==========
 
 @app.get("/api/export/live-log")
-async def export_live_log():
-    """Download live log CSV"""
-    if not config.LIVE_LOG_FILE.exists():
-        raise HTTPException(status_code=404, detail="Live log file not found")
-
-    return FileResponse(
-        path=config.LIVE_LOG_FILE,
-        filename=f"ncaa_live_log_{datetime.now().strftime('%Y%m%d')}.csv",
-        media_type="text/csv"
-    )
+async def export_live_log(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    team: Optional[str] = None,
+    game_id: Optional[str] = None,
+    format: str = "csv"
+):
+    """
+    Download the live log, optionally filtered
+
+    Args:
+        start_date, end_date: Inclusive YYYY-MM-DD range
+        team: Case-insensitive part of either team's name
+        game_id: A single game
+        format: csv, gzip (gzip-compressed CSV) or parquet
+    """
+    return _export_log("live_log", "ncaa_live_log", config.LIVE_LOG_FILE,
+                       start_date, end_date, team, game_id, format)
 
 
 @app.get("/api/export/results")
-async def export_results():
-    """Download results CSV"""
-    if not config.RESULTS_FILE.exists():
-        raise HTTPException(status_code=404, detail="Results file not found")
-
-    return FileResponse(
-        path=config.RESULTS_FILE,
-        filename=f"ncaa_results_{datetime.now().strftime('%Y%m%d')}.csv",
-        media_type="text/csv"
+async def export_results(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    team: Optional[str] = None,
+    game_id: Optional[str] = None,
+    format: str = "csv"
+):
+    """
+    Download game results, optionally filtered
+
+    Args:
+        start_date, end_date: Inclusive YYYY-MM-DD range
+        team: Case-insensitive part of either team's name
+        game_id: A single game
+        format: csv, gzip (gzip-compressed CSV) or parquet
+    """
+    return _export_log("results", "ncaa_results", config.RESULTS_FILE,
+                       start_date, end_date, team, game_id, format)
+
+
+def _export_log(
+    kind: str,
+    name: str,
+    path: Path,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    team: Optional[str],
+    game_id: Optional[str],
+    export_format: str
+):
+    """Stream a filtered log export (rows are read, filtered and encoded lazily)"""
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+    if export_format == "parquet" and not PYARROW_AVAILABLE:
+        raise HTTPException(status_code=501, detail="Parquet export requires pyarrow on the server")
+
+    for value in (start_date, end_date):
+        if value:
+            try:
+                datetime.strptime(value, "%Y-%m-%d")
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+    media_type, extension = EXPORT_FORMATS[export_format]
+    filename = f"{name}_{datetime.now().strftime('%Y%m%d')}.{extension}"
+    filtered = any((start_date, end_date, team, game_id))
+
+    # Unfiltered CSV from the CSV backend: send the file as-is
+    if config.LOG_STORAGE_BACKEND != "sqlite" and export_format == "csv" and not filtered:
+        if not path.exists():
+            raise HTTPException(status_code=404, detail=f"{path.name} not found")
+        return FileResponse(path=path, filename=filename, media_type=media_type)
+
+    csv_logger = get_csv_logger()
+
+    def rows():
+        # A single game's live rows come from its history file, not a full scan
+        if kind == "live_log" and game_id:
+            source = iter(csv_logger.get_game_history(game_id))
+        else:
+            # Date range and game filters run in the log store (indexed WHERE clauses on SQLite)
+            until = None
+            if end_date:
+                until = (datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+            source = csv_logger.iter_rows(kind, since=start_date, until=until, game_id=game_id)
+        return filter_rows(source, kind, start_date, end_date, team, game_id)
+
+    def body():
+        yield from stream_export(rows(), kind, export_format)
+
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
     )
 
 
 # ========== WEBSOCKET ENDPOINTS ==========
 
+def _active_games_message(delta: bool) -> Dict:
+    """
+    games_update message with every actively monitored game
+
+    Sent to new WebSocket clients and in reply to "resync", so both get the
+    same game set: latest row per game, updated in the last 30 minutes,
+    not final or out of time.
+
+    Args:
+        delta: Include the versioned cached state delta clients apply game_deltas to
+    """
+    # Latest log entry for each game, from the in-memory store
+    games_dict = {
+        log.get("Game ID") or log.get("game_id"): log
+        for log in get_live_game_store().latest_rows()
+    }
+
+    # Filter to only games updated in last 30 minutes (actively being monitored)
+    # This matches the filtering logic in /api/games/live endpoint
+    cutoff_time = datetime.now() - timedelta(minutes=30)
+    active_games = []
+
+    for game in games_dict.values():
+        # Filter out completed games by status
+        status = game.get("Status") or game.get("status", "")
+        if status and status.lower() in ['final', 'post', 'completed']:
+            logger.debug(f"WebSocket: Filtering out completed game")
+            continue  # Skip completed games
+
+        # Filter out games with zero time remaining
+        total_time_left = float(game.get("Total Time Left") or game.get("total_time_remaining", 999))
+        if total_time_left <= 0:
+            logger.debug(f"WebSocket: Filtering out game with no time remaining")
+            continue
+
+        timestamp_str = game.get("Timestamp") or game.get("timestamp", "")
+        try:
+            game_time = datetime.fromisoformat(timestamp_str)
+            if game_time > cutoff_time:
+                # Filter out games in their last minute if configured
+                if config.FILTER_LAST_MINUTE_GAMES:
+                    if total_time_left <= config.MIN_TIME_REMAINING:
+                        logger.debug(f"WebSocket: Filtering out game in last minute")
+                        continue  # Skip this game
+
+                active_games.append(game)
+        except:
+            # If timestamp parsing fails, skip this game
+            continue
+
+    # Map CSV data to frontend format using the same helper function
+    mapped_games = [map_game_data(game) for game in active_games]
+
+    message = {
+        "type": "games_update",
+        "timestamp": datetime.now().isoformat(),
+        "count": len(mapped_games),
+        "data": mapped_games
+    }
+
+    # Delta clients need the versioned cached state their deltas will apply to
+    if delta:
+        versions = {}
+        for i, game in enumerate(mapped_games):
+            cached = ws_manager.game_states.get(game.get("game_id"))
+            if cached:
+                versions[str(game.get("game_id"))], mapped_games[i] = cached
+        message["versions"] = versions
+
+    return message
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """
@@ -1016,71 +1275,26 @@ async def websocket_endpoint(websocket: WebSocket):
     Clients receive:
     - connection_established: Welcome message
     - game_update: Individual game updates
+    - game_delta: Changed fields only (clients connecting with ?delta=1)
     - games_update: Full games list updates
     - alert: High-confidence opportunity alerts
     - ping: Keep-alive messages
+
+    Delta clients track each game's version and send "resync" to get a
+    full snapshot when a game_delta's base_version doesn't match (at most
+    once per WS_RESYNC_MIN_INTERVAL). Games not in a client's snapshot
+    are sent as full game_updates until it has their state.
     """
-    await ws_manager.connect(websocket)
+    delta = websocket.query_params.get("delta", "").lower() in ("1", "true")
+    await ws_manager.connect(websocket, delta=delta)
 
     # Send initial games list to new client
     try:
-        csv_logger = get_csv_logger()
-        logs = csv_logger.get_recent_logs(limit=1000)
-
-        # Get latest log entry for each unique game_id
-        games_dict = {}
-        for log in reversed(logs):
-            game_id = log.get("Game ID") or log.get("game_id")
-            if game_id and game_id not in games_dict:
-                games_dict[game_id] = log
-
-        # Filter to only games updated in last 30 minutes (actively being monitored)
-        # This matches the filtering logic in /api/games/live endpoint
-        cutoff_time = datetime.now() - timedelta(minutes=30)
-        active_games = []
-
-        for game in games_dict.values():
-            # Filter out completed games by status
-            status = game.get("Status") or game.get("status", "")
-            if status and status.lower() in ['final', 'post', 'completed']:
-                logger.debug(f"WebSocket: Filtering out completed game")
-                continue  # Skip completed games
-
-            # Filter out games with zero time remaining
-            total_time_left = float(game.get("Total Time Left") or game.get("total_time_remaining", 999))
-            if total_time_left <= 0:
-                logger.debug(f"WebSocket: Filtering out game with no time remaining")
-                continue
-
-            timestamp_str = game.get("Timestamp") or game.get("timestamp", "")
-            try:
-                game_time = datetime.fromisoformat(timestamp_str)
-                if game_time > cutoff_time:
-                    # Filter out games in their last minute if configured
-                    if config.FILTER_LAST_MINUTE_GAMES:
-                        if total_time_left <= config.MIN_TIME_REMAINING:
-                            logger.debug(f"WebSocket: Filtering out game in last minute")
-                            continue  # Skip this game
-
-                    active_games.append(game)
-            except:
-                # If timestamp parsing fails, skip this game
-                continue
-
-        # Map CSV data to frontend format using the same helper function
-        mapped_games = [map_game_data(game) for game in active_games]
+        initial_message = _active_games_message(delta)
 
         # Send mapped games to the newly connected client
-        await ws_manager.send_personal_message(
-            {
-                "type": "games_update",
-                "timestamp": datetime.now().isoformat(),
-                "count": len(mapped_games),
-                "data": mapped_games
-            },
-            websocket
-        )
-        logger.info(f"Sent initial {len(mapped_games)} active games to new WebSocket client (filtered by 30-min cutoff)")
+        await ws_manager.send_games_snapshot(initial_message, websocket)
+        logger.info(f"Sent initial {initial_message['count']} active games to new WebSocket client (filtered by 30-min cutoff)")
     except Exception as e:
         logger.error(f"Error sending initial games: {e}")
 
@@ -1098,17 +1312,22 @@ async def websocket_endpoint(websocket: WebSocket):
                         websocket
                     )
 
+                # Delta client missed a version - send full state (throttled per client)
+                elif data == "resync":
+                    if ws_manager.allow_resync(websocket):
+                        await ws_manager.send_games_snapshot(_active_games_message(delta=True), websocket)
+
             except asyncio.TimeoutError:
-                # Send ping to keep connection alive
-                try:
-                    await websocket.send_json({
-                        "type": "ping",
-                        "timestamp": datetime.now().isoformat()
-                    })
-                except:
-                    # Connection likely closed
+                # Client was dropped by its sender (closed or too slow)
+                if not ws_manager.is_connected(websocket):
                     break
 
+                # Send ping to keep connection alive
+                await ws_manager.send_personal_message(
+                    {"type": "ping", "timestamp": datetime.now().isoformat()},
+                    websocket
+                )
+
             except WebSocketDisconnect:
                 break
 
@@ -1118,6 +1337,49 @@ async def websocket_endpoint(websocket: WebSocket):
         ws_manager.disconnect(websocket)
 
 
+async def process_trigger_update(update: TriggerUpdate) -> float:
+    """
+    Map a monitor update and broadcast it (plus any alerts) to WebSocket clients
+
+    Returns:
+        Confidence score of the update
+    """
+    # Keep the in-memory live game store current for the read endpoints
+    try:
+        get_live_game_store().update(update.game_data)
+    except Exception as e:
+        logger.error(f"Error updating live game store: {e}")
+
+    # Map CSV column names to frontend-friendly field names
+    mapped_game_data = map_game_data(update.game_data)
+    confidence = float(mapped_game_data.get("confidence_score", 0))
+
+    # Broadcast mapped game update to all connected clients
+    await ws_manager.broadcast_game_update(mapped_game_data)
+
+    # Send special alert for high confidence opportunities
+    if confidence >= 75:
+        await ws_manager.send_alert(
+            game_data=mapped_game_data,
+            confidence=confidence,
+            alert_type="high_confidence"
+        )
+        logger.info(
+            f"High confidence alert sent: {mapped_game_data.get('away_team')} @ "
+            f"{mapped_game_data.get('home_team')} ({confidence:.0f}%)"
+        )
+
+    # Send trigger alert if this is a new trigger
+    if update.update_type == "trigger":
+        await ws_manager.send_trigger_alert(mapped_game_data)
+        logger.info(
+            f"Trigger alert sent: {mapped_game_data.get('away_team')} @ "
+            f"{mapped_game_data.get('home_team')} (PPM: {mapped_game_data.get('required_ppm')})"
+        )
+
+    return confidence
+
+
 @app.post("/api/internal/trigger-update")
 async def internal_trigger_update(update: TriggerUpdate):
     """
@@ -1135,32 +1397,7 @@ async def internal_trigger_update(update: TriggerUpdate):
     - "alert": High-confidence opportunity (>= 75)
     """
     try:
-        # Map CSV column names to frontend-friendly field names
-        mapped_game_data = map_game_data(update.game_data)
-        confidence = float(mapped_game_data.get("confidence_score", 0))
-
-        # Broadcast mapped game update to all connected clients
-        await ws_manager.broadcast_game_update(mapped_game_data)
-
-        # Send special alert for high confidence opportunities
-        if confidence >= 75:
-            await ws_manager.send_alert(
-                game_data=mapped_game_data,
-                confidence=confidence,
-                alert_type="high_confidence"
-            )
-            logger.info(
-                f"High confidence alert sent: {mapped_game_data.get('away_team')} @ "
-                f"{mapped_game_data.get('home_team')} ({confidence:.0f}%)"
-            )
-
-        # Send trigger alert if this is a new trigger
-        if update.update_type == "trigger":
-            await ws_manager.send_trigger_alert(mapped_game_data)
-            logger.info(
-                f"Trigger alert sent: {mapped_game_data.get('away_team')} @ "
-                f"{mapped_game_data.get('home_team')} (PPM: {mapped_game_data.get('required_ppm')})"
-            )
+        confidence = await process_trigger_update(update)
 
         return {
             "status": "success",
@@ -1177,6 +1414,37 @@ async def internal_trigger_update(update: TriggerUpdate):
         )
 
 
+@app.post("/api/internal/trigger-update/batch")
+async def internal_trigger_update_batch(batch: TriggerUpdateBatch):
+    """
+    Internal endpoint for monitor to send all of a poll cycle's game updates at once
+
+    Each update is processed exactly like /api/internal/trigger-update. A bad
+    update is logged and skipped so it can't drop the rest of the cycle.
+
+    Args:
+        batch: TriggerUpdateBatch containing a list of TriggerUpdate
+    """
+    processed = 0
+    failed = 0
+
+    for update in batch.updates:
+        try:
+            await process_trigger_update(update)
+            processed += 1
+        except Exception as e:
+            failed += 1
+            logger.error(f"Error processing batched update for game {update.game_data.get('game_id')}: {e}")
+
+    return {
+        "status": "success" if failed == 0 else "partial",
+        "message": "Batch broadcast to connected clients",
+        "processed": processed,
+        "failed": failed,
+        "active_connections": len(ws_manager.active_connections)
+    }
+
+
 @app.get("/api/websocket/stats")
 async def websocket_stats():
     """Get WebSocket connection statistics"""
@@ -1188,6 +1456,34 @@ async def websocket_stats():
 # In-memory storage for latest predictions
 latest_predictions = []
 
+def _save_predictions_csv(predictions: List[Dict]) -> None:
+    """Write predictions to the latest predictions CSV (blocking - call via run_blocking)"""
+    predictions_csv = config.DATA_DIR / "predictions" / "latest_predictions.csv"
+    predictions_csv.parent.mkdir(parents=True, exist_ok=True)
+    df = pd.DataFrame(predictions)
+    df.to_csv(predictions_csv, index=False)
+    logger.info(f"Persisted {len(predictions)} predictions to {predictions_csv}")
+
+
+def _load_predictions_csv() -> List[Dict]:
+    """Read the latest predictions CSV (blocking - call via run_blocking)"""
+    predictions_csv = config.DATA_DIR / "predictions" / "latest_predictions.csv"
+    if not predictions_csv.exists():
+        return []
+
+    try:
+        df = pd.read_csv(predictions_csv)
+        # Replace NaN and inf values with None for JSON compliance
+        df = df.replace([np.inf, -np.inf], np.nan)
+        df = df.where(pd.notnull(df), None)
+        predictions = df.to_dict('records')
+        logger.info(f"Loaded {len(predictions)} predictions from CSV")
+        return predictions
+    except Exception as e:
+        logger.error(f"Error loading predictions from CSV: {e}")
+        return []
+
+
 @app.post("/api/predictions/update")
 async def update_predictions(data: dict):
     """Receive and store predictions from prediction system"""
@@ -1199,11 +1495,7 @@ async def update_predictions(data: dict):
 
         # Persist to CSV for reliability (survives API restarts)
         if predictions:
-            predictions_csv = config.DATA_DIR / "predictions" / "latest_predictions.csv"
-            predictions_csv.parent.mkdir(parents=True, exist_ok=True)
-            df = pd.DataFrame(predictions)
-            df.to_csv(predictions_csv, index=False)
-            logger.info(f"Persisted {len(predictions)} predictions to {predictions_csv}")
+            await run_blocking(_save_predictions_csv, predictions)
 
         # Broadcast to WebSocket clients
         await ws_manager.broadcast({
@@ -1231,17 +1523,7 @@ async def get_latest_predictions():
 
     # If in-memory storage is empty, try to load from CSV (handles API restarts)
     if not latest_predictions:
-        predictions_csv = config.DATA_DIR / "predictions" / "latest_predictions.csv"
-        if predictions_csv.exists():
-            try:
-                df = pd.read_csv(predictions_csv)
-                # Replace NaN and inf values with None for JSON compliance
-                df = df.replace([np.inf, -np.inf], np.nan)
-                df = df.where(pd.notnull(df), None)
-                latest_predictions = df.to_dict('records')
-                logger.info(f"Loaded {len(latest_predictions)} predictions from CSV")
-            except Exception as e:
-                logger.error(f"Error loading predictions from CSV: {e}")
+        latest_predictions = await run_blocking(_load_predictions_csv)
 
     # Ensure no NaN/inf values in the response (handles in-memory data too)
     import math
@@ -0,0 +1,62 @@
+"""
+Per-Route Latency Histograms
+
+Fixed-bucket histograms (milliseconds) recorded by HTTP middleware and
+exposed through the admin metrics endpoint.
+"""
+
+import bisect
+from typing import Dict, List, Optional, Sequence
+
+# Upper bounds of the histogram buckets in milliseconds (last bucket is +inf)
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class LatencyHistograms:
+    """Latency histogram per route ("METHOD /path/template")"""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self._routes: Dict[str, dict] = {}
+
+    def observe(self, route: str, seconds: float) -> None:
+        """Record one request"""
+        ms = seconds * 1000
+        histogram = self._routes.get(route)
+        if histogram is None:
+            histogram = {"count": 0, "sum_ms": 0.0, "max_ms": 0.0, "counts": [0] * (len(self.buckets) + 1)}
+            self._routes[route] = histogram
+
+        histogram["count"] += 1
+        histogram["sum_ms"] += ms
+        histogram["max_ms"] = max(histogram["max_ms"], ms)
+        histogram["counts"][bisect.bisect_left(self.buckets, ms)] += 1
+
+    def _percentile(self, counts: List[int], total: int, q: float) -> Optional[float]:
+        """Upper bound of the bucket containing the q-th percentile (None = above the last bucket)"""
+        target = q * total
+        seen = 0
+        for i, count in enumerate(counts):
+            seen += count
+            if seen >= target:
+                return self.buckets[i] if i < len(self.buckets) else None
+        return None
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Counts, averages, bucket percentiles and raw buckets for every route"""
+        labels = [f"le_{b}" for b in self.buckets] + ["le_inf"]
+        result = {}
+
+        for route, h in sorted(self._routes.items()):
+            total = h["count"]
+            result[route] = {
+                "count": total,
+                "avg_ms": round(h["sum_ms"] / total, 2) if total else 0.0,
+                "max_ms": round(h["max_ms"], 2),
+                "p50_ms": self._percentile(h["counts"], total, 0.50),
+                "p95_ms": self._percentile(h["counts"], total, 0.95),
+                "p99_ms": self._percentile(h["counts"], total, 0.99),
+                "buckets": dict(zip(labels, h["counts"]))
+            }
+
+        return result
@@ -0,0 +1,108 @@
+"""
+Response Cache with ETag Support
+
+Caches the encoded JSON body of read-heavy endpoints, keyed on the request
+parameters and invalidated when the underlying data version changes (or
+after a TTL, for responses that also depend on the current date).
+Clients sending a matching If-None-Match get a 304 with no body.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from executor import run_blocking
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    LRU cache of encoded JSON responses.
+
+    Each entry stores the data version it was computed from; a request
+    with a different version, or after ttl seconds, recomputes it.
+    """
+
+    def __init__(self, ttl: float = 60, max_entries: int = 128):
+        """
+        Args:
+            ttl: Max seconds an entry is reused even if the version is unchanged
+            max_entries: Entries kept (keys include user-supplied query params)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, dict]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    async def respond(
+        self,
+        request: Request,
+        key: Hashable,
+        version: str,
+        compute: Callable[[], Any]
+    ) -> Response:
+        """
+        Serve a cached response, recomputing it only when stale.
+
+        Args:
+            request: Incoming request (for If-None-Match)
+            key: Cache key (endpoint name plus parameters)
+            version: Data version token, e.g. a log file's mtime and size
+            compute: Builds the response body when the cache is stale (runs
+                on the blocking executor, so it may read files)
+
+        Returns:
+            200 with the JSON body and ETag, or 304 if the client's copy is current
+        """
+        entry = self._entries.get(key)
+        now = time.monotonic()
+
+        if entry is None or entry["version"] != version or now - entry["created"] > self.ttl:
+            body = await run_blocking(self._encode, compute)
+            entry = {
+                "version": version,
+                "created": now,
+                "body": body,
+                "etag": '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+            }
+            self._entries[key] = entry
+            self.misses += 1
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self.hits += 1
+
+        self._entries.move_to_end(key)
+
+        headers = {"ETag": entry["etag"], "Cache-Control": "no-cache"}
+
+        if_none_match = request.headers.get("if-none-match", "")
+        if entry["etag"] in [tag.strip() for tag in if_none_match.split(",")]:
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+
+        return Response(content=entry["body"], media_type="application/json", headers=headers)
+
+    @staticmethod
+    def _encode(compute: Callable[[], Any]) -> bytes:
+        """Build and encode a response body exactly as FastAPI would"""
+        return JSONResponse(content=jsonable_encoder(compute())).body
+
+    def get_stats(self) -> dict:
+        """Hit/miss counters"""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified
+        }
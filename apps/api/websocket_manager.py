@@ -6,15 +6,223 @@ Provides real-time updates to connected clients and sends high-priority alerts
 for high-confidence betting opportunities.
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Any
+import time
+from collections import deque
+from typing import List, Dict, Any, Callable, Optional, Set
 from fastapi import WebSocket, WebSocketDisconnect
 import json
 from datetime import datetime
+import config
+from game_state import GameStateCache
+
+# Optional fast JSON encoder for broadcast frames
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Message types where only the latest version matters: a newer message
+# replaces a pending one (game_update/game_delta are coalesced per game)
+COALESCE_TYPES = {"game_update", "game_delta", "games_update", "performance_update", "ping"}
+
+
+def encode_message(message: Dict[str, Any]) -> str:
+    """
+    Encode a message to a JSON text frame.
+
+    Uses orjson when installed (NaN/inf become null, datetimes and numpy
+    values are serialized natively) and falls back to the json module.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                message,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(message, separators=(",", ":"), default=str)
+
+
+class ClientChannel:
+    """
+    Outbound queue and sender task for a single WebSocket client.
+
+    Broadcasts only enqueue; a dedicated task drains the queue, so a slow
+    client delays nobody but itself. Policy when a client falls behind:
+    - Pending game/list/performance updates and pings are replaced by newer ones
+      (coalesced); a coalesced game delta is replaced by the full game state
+    - When the queue is full the oldest non-alert message is dropped
+    - A send that takes longer than the send timeout closes the client
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_queue: int,
+        send_timeout: float,
+        on_close: Callable[[WebSocket], None],
+        delta: bool = False
+    ):
+        self.websocket = websocket
+        self.delta = delta  # Client understands game_delta messages
+        self.known_games: Set[str] = set()  # Games the client holds a versioned full state for
+        self.last_resync = 0.0  # monotonic time of the last resync snapshot sent
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self._on_close = on_close
+
+        # Entries are [coalesce_key, message_type, frame, enqueued_at]
+        self._pending: deque = deque()
+        self._by_key: Dict[str, list] = {}
+        self._ready = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+        # Lag metrics (lag = time from enqueue to send completed)
+        self.connected_at = datetime.now()
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._total_lag = 0.0
+
+    @staticmethod
+    def _coalesce_key(message: Dict[str, Any]) -> Optional[str]:
+        """Key under which a newer message replaces a pending one (None = never)"""
+        msg_type = message.get("type")
+        if msg_type not in COALESCE_TYPES:
+            return None
+        if msg_type in ("game_update", "game_delta"):
+            game_id = message.get("game_id") or (message.get("data") or {}).get("game_id")
+            return f"game:{game_id}" if game_id else None
+        return msg_type
+
+    def start(self) -> None:
+        """Start the sender task"""
+        self.task = asyncio.create_task(self._sender())
+
+    def stop(self) -> None:
+        """Cancel the sender task (unless we are running inside it)"""
+        if self.task is not None and self.task is not asyncio.current_task():
+            self.task.cancel()
+
+    def enqueue(
+        self,
+        message: Dict[str, Any],
+        frame: Optional[str] = None,
+        coalesce_frame: Optional[str] = None
+    ) -> None:
+        """
+        Queue a message for this client without waiting on the socket
+
+        Args:
+            message: Message dict (used for the coalesce/drop policy)
+            frame: Pre-encoded JSON frame; encoded here if not given
+            coalesce_frame: Frame to use instead when replacing a pending
+                message (a delta can't replace one the client never got)
+        """
+        if frame is None:
+            frame = encode_message(message)
+
+        key = self._coalesce_key(message)
+
+        if key is not None and key in self._by_key:
+            # Keep the original enqueue time so lag reflects how long the client is behind
+            self._by_key[key][2] = coalesce_frame if coalesce_frame is not None else frame
+            self.coalesced += 1
+            return
+
+        if len(self._pending) >= self.max_queue:
+            self._drop_oldest()
+
+        entry = [key, message.get("type"), frame, time.monotonic()]
+        self._pending.append(entry)
+        if key is not None:
+            self._by_key[key] = entry
+        self._ready.set()
+
+    def _drop_oldest(self) -> None:
+        """Drop the oldest queued non-alert message (or the oldest message if all are alerts)"""
+        index = next(
+            (i for i, entry in enumerate(self._pending) if entry[1] != "alert"),
+            0
+        )
+        key = self._pending[index][0]
+        del self._pending[index]
+        if key is not None:
+            self._by_key.pop(key, None)
+        self.dropped += 1
+
+    async def _sender(self) -> None:
+        """Send queued messages in order until the client goes away"""
+        try:
+            while True:
+                if not self._pending:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+
+                key, _, frame, enqueued_at = self._pending.popleft()
+                if key is not None:
+                    self._by_key.pop(key, None)
+
+                async with asyncio.timeout(self.send_timeout):
+                    await self.websocket.send_text(frame)
+
+                lag = time.monotonic() - enqueued_at
+                self.sent += 1
+                self.last_lag = lag
+                self.max_lag = max(self.max_lag, lag)
+                self._total_lag += lag
+
+        except asyncio.CancelledError:
+            raise
+
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"WebSocket client {self.client} too slow (send took > {self.send_timeout}s), closing"
+            )
+            try:
+                await asyncio.wait_for(self.websocket.close(code=1013), timeout=1.0)
+            except Exception:
+                pass
+
+        except WebSocketDisconnect:
+            logger.warning("Client disconnected during broadcast")
+
+        except Exception as e:
+            logger.error(f"Error broadcasting to client: {e}")
+
+        self._on_close(self.websocket)
+
+    @property
+    def client(self) -> str:
+        """Client address for logs and stats"""
+        client = getattr(self.websocket, "client", None)
+        return f"{client.host}:{client.port}" if client else "unknown"
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-client queue and lag metrics"""
+        return {
+            "client": self.client,
+            "delta": self.delta,
+            "connected_at": self.connected_at.isoformat(),
+            "queued": len(self._pending),
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "last_lag_ms": round(self.last_lag * 1000, 1),
+            "max_lag_ms": round(self.max_lag * 1000, 1),
+            "avg_lag_ms": round(self._total_lag / self.sent * 1000, 1) if self.sent else 0.0
+        }
+
 
 class ConnectionManager:
     """
@@ -22,7 +230,8 @@ class ConnectionManager:
 
     Features:
     - Maintains list of active WebSocket connections
-    - Broadcasts game updates to all connected clients
+    - Broadcasts game updates to all connected clients through per-client
+      queues, so one slow client can't stall the others
     - Sends priority alerts for high-confidence opportunities
     - Handles disconnections gracefully
     - Provides connection statistics
@@ -31,21 +240,35 @@ class ConnectionManager:
     def __init__(self):
         """Initialize the connection manager with an empty connections list."""
         self.active_connections: List[WebSocket] = []
+        self.channels: Dict[WebSocket, ClientChannel] = {}
         self.connection_count = 0  # Total connections since startup
+        self.max_queue = getattr(config, 'WS_CLIENT_QUEUE_SIZE', 100)
+        self.send_timeout = getattr(config, 'WS_SEND_TIMEOUT', 10)
+        self.resync_interval = getattr(config, 'WS_RESYNC_MIN_INTERVAL', 5)
+        self.game_states = GameStateCache(
+            snapshot_every=getattr(config, 'WS_DELTA_SNAPSHOT_EVERY', 20)
+        )
         logger.info("WebSocket ConnectionManager initialized")
 
-    async def connect(self, websocket: WebSocket) -> None:
+    async def connect(self, websocket: WebSocket, delta: bool = False) -> None:
         """
         Accept and register a new WebSocket connection.
 
         Args:
             websocket: The WebSocket connection to register
+            delta: Client opted in to delta-encoded game updates
         """
         try:
             await websocket.accept()
             self.active_connections.append(websocket)
             self.connection_count += 1
 
+            channel = ClientChannel(
+                websocket, self.max_queue, self.send_timeout, self.disconnect, delta=delta
+            )
+            self.channels[websocket] = channel
+            channel.start()
+
             logger.info(
                 f"New WebSocket connection established. "
                 f"Active: {len(self.active_connections)}, "
@@ -75,6 +298,10 @@ class ConnectionManager:
             websocket: The WebSocket connection to remove
         """
         try:
+            channel = self.channels.pop(websocket, None)
+            if channel is not None:
+                channel.stop()
+
             if websocket in self.active_connections:
                 self.active_connections.remove(websocket)
                 logger.info(
@@ -87,16 +314,57 @@ class ConnectionManager:
         except Exception as e:
             logger.error(f"Error disconnecting WebSocket: {e}")
 
+    async def send_games_snapshot(self, message: Dict[str, Any], websocket: WebSocket) -> None:
+        """
+        Send a games_update snapshot to one client.
+
+        For delta clients the snapshot's versions become the set of games the
+        client can apply deltas to; any other game is sent in full on its
+        next update.
+
+        Args:
+            message: games_update message (with "versions" for delta clients)
+            websocket: The target WebSocket connection
+        """
+        channel = self.channels.get(websocket)
+        if channel is not None and channel.delta:
+            channel.known_games = set(message.get("versions", {}))
+        await self.send_personal_message(message, websocket)
+
+    def allow_resync(self, websocket: WebSocket) -> bool:
+        """
+        Whether a client's resync request should be answered now.
+
+        Limits each connection to one resync snapshot per
+        WS_RESYNC_MIN_INTERVAL seconds so a client stuck on a bad base
+        can't make us rebuild the games list on every update.
+        """
+        channel = self.channels.get(websocket)
+        if channel is None:
+            return False
+        now = time.monotonic()
+        if now - channel.last_resync < self.resync_interval:
+            return False
+        channel.last_resync = now
+        return True
+
     async def send_personal_message(self, message: Dict[str, Any], websocket: WebSocket) -> None:
         """
         Send a message to a specific WebSocket connection.
 
+        Goes through the client's queue when it has one, so it stays in
+        order with broadcasts.
+
         Args:
             message: Dictionary containing the message data
             websocket: The target WebSocket connection
         """
         try:
-            await websocket.send_json(message)
+            channel = self.channels.get(websocket)
+            if channel is not None:
+                channel.enqueue(message)
+            else:
+                await websocket.send_json(message)
             logger.debug(f"Sent personal message: {message.get('type', 'unknown')}")
 
         except WebSocketDisconnect:
@@ -111,51 +379,73 @@ class ConnectionManager:
         """
         Broadcast a message to all connected WebSocket clients.
 
+        The message is encoded to JSON once and the same frame is queued
+        on each client's channel; returns without waiting for any socket.
+
         Args:
             message: Dictionary containing the message data
         """
-        disconnected_clients = []
-
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
+        if not self.channels:
+            return
 
-            except WebSocketDisconnect:
-                logger.warning("Client disconnected during broadcast")
-                disconnected_clients.append(connection)
+        frame = encode_message(message)
+        for channel in list(self.channels.values()):
+            channel.enqueue(message, frame)
 
-            except Exception as e:
-                logger.error(f"Error broadcasting to client: {e}")
-                disconnected_clients.append(connection)
-
-        # Clean up disconnected clients
-        for connection in disconnected_clients:
-            self.disconnect(connection)
-
-        if disconnected_clients:
-            logger.info(f"Removed {len(disconnected_clients)} disconnected clients")
+    def is_connected(self, websocket: WebSocket) -> bool:
+        """Whether the connection is still registered (slow clients get dropped)"""
+        return websocket in self.channels
 
     async def broadcast_game_update(self, game_data: Dict[str, Any]) -> None:
         """
         Broadcast game update to all connected clients.
 
-        Formats the game data with timestamp and update type before broadcasting.
+        Each update bumps the game's version in the state cache. Clients
+        that opted in to deltas get a game_delta with only the changed
+        fields; everyone else (and delta clients on snapshot versions) gets
+        the full game_update. Both frames are encoded once.
 
         Args:
             game_data: Dictionary containing game information
         """
         try:
+            version, changed, removed, snapshot_due = self.game_states.update(game_data)
+            timestamp = datetime.now().isoformat()
+
             message = {
                 "type": "game_update",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
+                "version": version,
                 "data": game_data
             }
-
-            await self.broadcast(message)
+            frame = encode_message(message)
+
+            delta_message = None
+            if not snapshot_due and any(c.delta for c in self.channels.values()):
+                delta_message = {
+                    "type": "game_delta",
+                    "timestamp": timestamp,
+                    "game_id": game_data.get("game_id"),
+                    "version": version,
+                    "base_version": version - 1,
+                    "data": changed,
+                    "removed": removed
+                }
+                delta_frame = encode_message(delta_message)
+
+            # A delta needs a base: clients that never got this game's full
+            # state (not in their snapshot) get the full game_update instead
+            game_key = str(game_data.get("game_id"))
+            for channel in list(self.channels.values()):
+                if channel.delta and delta_message is not None and game_key in channel.known_games:
+                    channel.enqueue(delta_message, delta_frame, coalesce_frame=frame)
+                else:
+                    channel.enqueue(message, frame)
+                    channel.known_games.add(game_key)
 
             logger.debug(
                 f"Broadcast game update for {game_data.get('game_id', 'unknown')} "
-                f"to {len(self.active_connections)} clients"
+                f"v{version} ({len(changed)} changed fields) to {len(self.active_connections)} clients"
             )
 
         except Exception as e:
@@ -295,14 +585,22 @@ class ConnectionManager:
 
     def get_stats(self) -> Dict[str, Any]:
         """
-        Get connection statistics.
+        Get connection statistics, including per-client queue depth and lag.
 
         Returns:
             Dictionary containing connection statistics
         """
+        clients = [channel.get_stats() for channel in self.channels.values()]
+
         return {
             "active_connections": len(self.active_connections),
             "total_connections": self.connection_count,
+            "queued_messages": sum(c["queued"] for c in clients),
+            "dropped_messages": sum(c["dropped"] for c in clients),
+            "coalesced_messages": sum(c["coalesced"] for c in clients),
+            "max_lag_ms": max((c["max_lag_ms"] for c in clients), default=0.0),
+            "delta_clients": sum(1 for c in clients if c["delta"]),
+            "clients": clients,
             "timestamp": datetime.now().isoformat()
         }
 
@@ -0,0 +1,158 @@
+"""
+Benchmark team stats aggregation
+Compares the per-team masking loop the stats fetchers used to run with the
+shared groupby engine (utils/team_stats_engine.py) on synthetic box scores,
+and checks both produce the same metrics
+
+Usage: python benchmark_team_stats.py [--teams 360] [--games 10 30] [--repeat 3]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.team_stats_engine import EXTENDED_METRICS, aggregate_team_stats
+
+
+def build_box_scores(teams: int, games_per_team: int, seed: int = 0) -> pd.DataFrame:
+    """Random team box scores with the sportsdataverse column names"""
+    rng = np.random.default_rng(seed)
+    rows = teams * games_per_team
+
+    team_ids = np.repeat(np.arange(teams), games_per_team)
+    rng.shuffle(team_ids)
+
+    fga = rng.integers(45, 70, rows)
+    three_a = rng.integers(12, 32, rows)
+    fta = rng.integers(8, 30, rows)
+    oreb = rng.integers(4, 16, rows)
+    dreb = rng.integers(18, 32, rows)
+
+    return pd.DataFrame({
+        "team_id": team_ids,
+        "team_display_name": [f"Team {i}" for i in team_ids],
+        "team_score": rng.integers(50, 100, rows),
+        "opponent_team_score": rng.integers(50, 100, rows),
+        # ESPN serves shooting columns as strings
+        "field_goals_made": (fga * rng.uniform(0.35, 0.55, rows)).astype(int).astype(str),
+        "field_goals_attempted": fga.astype(str),
+        "three_point_field_goals_made": (three_a * rng.uniform(0.25, 0.45, rows)).astype(int).astype(str),
+        "three_point_field_goals_attempted": three_a.astype(str),
+        "free_throws_made": (fta * rng.uniform(0.6, 0.85, rows)).astype(int).astype(str),
+        "free_throws_attempted": fta.astype(str),
+        "offensive_rebounds": oreb,
+        "defensive_rebounds": dreb,
+        "total_rebounds": oreb + dreb,
+        "turnovers": rng.integers(6, 20, rows),
+        "assists": rng.integers(8, 22, rows).astype(str),
+        "steals": rng.integers(2, 12, rows).astype(str),
+        "blocks": rng.integers(0, 8, rows).astype(str),
+        "fouls": rng.integers(10, 25, rows).astype(str),
+    })
+
+
+def legacy_team_stats(box_scores: pd.DataFrame) -> pd.DataFrame:
+    """The old ESPNStatsFetcher._calculate_team_stats loop (one boolean mask per team)"""
+    team_groups = []
+
+    for team_id in box_scores['team_id'].unique():
+        team_games = box_scores[box_scores['team_id'] == team_id]
+        games_played = len(team_games)
+
+        def total(column):
+            return pd.to_numeric(team_games[column], errors='coerce').fillna(0).sum()
+
+        total_points = team_games['team_score'].sum()
+        total_fgm = total('field_goals_made')
+        total_fga = total('field_goals_attempted')
+        total_3pm = total('three_point_field_goals_made')
+        total_3pa = total('three_point_field_goals_attempted')
+        total_ftm = total('free_throws_made')
+        total_fta = total('free_throws_attempted')
+        total_oreb = team_games['offensive_rebounds'].sum()
+        total_dreb = team_games['defensive_rebounds'].sum()
+        total_reb = team_games['total_rebounds'].sum()
+        total_to = team_games['turnovers'].sum()
+        total_assists = total('assists')
+        opp_points = team_games['opponent_team_score'].sum()
+
+        poss = total_fga + 0.44 * total_fta - total_oreb + total_to
+        off_eff = total_points / poss * 100 if poss > 0 else 0
+        def_eff = opp_points / poss * 100 if poss > 0 else 0
+
+        team_groups.append({
+            'team_id': team_id,
+            'team_name': team_games.iloc[0]['team_display_name'],
+            'games_played': games_played,
+            'pace': poss / games_played,
+            'off_efficiency': off_eff,
+            'def_efficiency': def_eff,
+            'fg_pct': total_fgm / total_fga * 100 if total_fga > 0 else 0,
+            'three_p_rate': total_3pa / total_fga if total_fga > 0 else 0,
+            'three_p_pct': total_3pm / total_3pa * 100 if total_3pa > 0 else 0,
+            'ft_rate': total_fta / games_played,
+            'ft_pct': total_ftm / total_fta * 100 if total_fta > 0 else 0,
+            'oreb_pct': total_oreb / total_reb * 100 if total_reb > 0 else 0,
+            'dreb_pct': total_dreb / total_reb * 100 if total_reb > 0 else 0,
+            'to_rate': total_to / games_played,
+            'efg_pct': (total_fgm + 0.5 * total_3pm) / total_fga * 100 if total_fga > 0 else 0,
+            'ts_pct': total_points / (2 * (total_fga + 0.44 * total_fta)) * 100 if (total_fga + total_fta) > 0 else 0,
+            'two_p_pct': (total_fgm - total_3pm) / (total_fga - total_3pa) * 100 if total_fga - total_3pa > 0 else 0,
+            'efficiency_margin': off_eff - def_eff,
+            'avg_ppm': total_points / (games_played * 40),
+            'avg_ppg': total_points / games_played,
+            'assists_per_game': total_assists / games_played,
+            'steals_per_game': total('steals') / games_played,
+            'blocks_per_game': total('blocks') / games_played,
+            'fouls_per_game': total('fouls') / games_played,
+            'ast_to_ratio': total_assists / total_to if total_to > 0 else 0,
+            'data_source': 'espn'
+        })
+
+    return pd.DataFrame(team_groups)
+
+
+def best_of(func, box_scores: pd.DataFrame, repeat: int) -> float:
+    """Fastest of `repeat` runs, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(box_scores)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(teams: int, game_counts: list, repeat: int):
+    print(f"{teams} teams, best of {repeat} runs\n")
+    print(f"{'Games/team':>10} {'Rows':>8} {'per-team loop':>14} {'groupby':>10} {'speedup':>8}")
+    print("-" * 54)
+
+    for games in game_counts:
+        box_scores = build_box_scores(teams, games)
+
+        # Same numbers from both implementations
+        expected = legacy_team_stats(box_scores).set_index("team_id").sort_index()
+        actual = aggregate_team_stats(box_scores, "espn").set_index("team_id").sort_index()
+        pd.testing.assert_frame_equal(
+            actual[EXTENDED_METRICS[1:]], expected[EXTENDED_METRICS[1:]],
+            check_dtype=False, check_exact=False
+        )
+
+        loop = best_of(legacy_team_stats, box_scores, repeat)
+        vectorized = best_of(lambda df: aggregate_team_stats(df, "espn"), box_scores, repeat)
+        print(f"{games:>10} {len(box_scores):>8} {loop * 1000:>12.1f}ms "
+              f"{vectorized * 1000:>8.1f}ms {loop / vectorized:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark team stats aggregation")
+    parser.add_argument("--teams", type=int, default=360,
+                        help="Number of teams (D1 has ~360)")
+    parser.add_argument("--games", type=int, nargs="+", default=[10, 30],
+                        help="Games per team (early season / full season)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per implementation (fastest is reported)")
+    args = parser.parse_args()
+
+    main(args.teams, args.games, args.repeat)
@@ -47,6 +47,15 @@ SPORT_MODE = os.getenv("SPORT_MODE", "ncaa").lower()
 # Polling interval in seconds
 POLL_INTERVAL = 15  # 15 seconds - faster refresh for ESPN and Odds API
 
+# Concurrent per-game analysis (keeps a busy slate inside one poll interval)
+CONCURRENT_ANALYSIS = os.getenv("CONCURRENT_ANALYSIS", "true").lower() == "true"
+ANALYSIS_CONCURRENCY = int(os.getenv("ANALYSIS_CONCURRENCY", "10"))  # Max games analyzed at once
+
+# Shared async HTTP client pool (ESPN + The Odds API)
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))  # Effectively per-host (ESPN dominates)
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_KEEPALIVE_EXPIRY = 60  # Seconds an idle connection is kept open (> POLL_INTERVAL)
+
 # Game filtering settings
 FILTER_LAST_MINUTE_GAMES = True  # Hide games with ≤1 minute remaining from the site
 MIN_TIME_REMAINING = 1.0  # Minimum minutes remaining to display a game
@@ -78,6 +87,10 @@ MEDIUM_CONF_MIN_PPM = 4.0  # Minimum PPM for medium confidence bets
 # Team stats refresh frequency (in hours)
 STATS_REFRESH_HOURS = 24
 
+# ESPN team stats: keep per-team running box-score totals on disk and fold in only
+# games newer than the last refresh, instead of re-aggregating the whole season
+STATS_INCREMENTAL_REFRESH = os.getenv("STATS_INCREMENTAL_REFRESH", "true").lower() == "true"
+
 # ========== QUIET HOURS (No Games) ==========
 # Don't poll during these hours to save API tokens
 # Times are in Eastern Time (ET)
@@ -173,11 +186,28 @@ DATA_DIR.mkdir(exist_ok=True)
 TEAM_STATS_FILE = DATA_DIR / "team_stats.csv"
 LIVE_LOG_FILE = DATA_DIR / "ncaa_live_log.csv"
 RESULTS_FILE = DATA_DIR / "ncaa_results.csv"
+GAME_HISTORY_DIR = DATA_DIR / "game_history"  # One append-only CSV per game
+
+# Recent live log rows kept in memory for the API's read endpoints
+RECENT_LOG_BUFFER_SIZE = 1000
+
+# Live log rows are buffered and written once per poll cycle; these bound the delay
+LIVE_LOG_FLUSH_INTERVAL = 5  # Max seconds a buffered row waits before being written
+LIVE_LOG_FLUSH_MAX_ROWS = 500  # Flush early if this many rows are buffered
+
+# Log storage backend: "csv" (flat files above) or "sqlite" (WAL database)
+LOG_STORAGE_BACKEND = os.getenv("LOG_STORAGE_BACKEND", "csv").lower()
+SQLITE_DB_FILE = DATA_DIR / "ncaa_monitor.db"
+SQLITE_BUSY_TIMEOUT = 30  # Seconds to wait on a locked database
 
 # Cache directory
 CACHE_DIR = BASE_DIR / "cache"
 CACHE_DIR.mkdir(exist_ok=True)
 
+# Team stats snapshots in CACHE_DIR (Feather when pyarrow is installed, else CSV)
+# are not loaded once older than this
+STATS_SNAPSHOT_MAX_AGE_DAYS = int(os.getenv("STATS_SNAPSHOT_MAX_AGE_DAYS", "14"))
+
 # ========== API CONFIGURATION ==========
 # FastAPI settings
 API_HOST = os.getenv("API_HOST", "0.0.0.0")
@@ -187,6 +217,22 @@ SECRET_KEY = os.getenv("SECRET_KEY", "change-this-in-production-please")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
+# WebSocket fan-out: each client gets its own bounded outbound queue and sender task
+WS_CLIENT_QUEUE_SIZE = int(os.getenv("WS_CLIENT_QUEUE_SIZE", "100"))  # Pending messages per client
+WS_SEND_TIMEOUT = 10  # Seconds a single send may take before the client is dropped
+WS_DELTA_SNAPSHOT_EVERY = 20  # Delta clients get a full game_update every N versions (~5 min at 15s polls)
+WS_RESYNC_MIN_INTERVAL = float(os.getenv("WS_RESYNC_MIN_INTERVAL", "5"))  # Seconds between resync snapshots per client
+
+# Thread pool for blocking work in API handlers (sync HTTP, pandas, OpenAI, log scans)
+API_BLOCKING_WORKERS = int(os.getenv("API_BLOCKING_WORKERS", "8"))
+
+# Cached dashboard responses (performance, PPM analysis, daily summary) are reused
+# until the underlying log changes, but never for longer than this many seconds
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "60"))
+
+# Largest page /api/games/completed will stream (games, each with full history)
+COMPLETED_GAMES_MAX_PAGE = int(os.getenv("COMPLETED_GAMES_MAX_PAGE", "100"))
+
 # CORS settings
 ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "*").split(",") if os.getenv("ALLOWED_ORIGINS") != "*" else ["*"]
 
@@ -204,6 +250,10 @@ IS_PRODUCTION = ENVIRONMENT == "production"
 # Railway backend URL (set in production)
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
 
+# Monitor -> API real-time pushes
+BATCH_REALTIME_UPDATES = os.getenv("BATCH_REALTIME_UPDATES", "true").lower() == "true"  # One POST per poll cycle
+API_SESSION_CONNECTION_LIMIT = 10  # Pooled keep-alive connections to the backend
+
 # Frontend URL (Vercel)
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
 
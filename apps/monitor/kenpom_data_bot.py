@@ -160,20 +160,14 @@ def fetch_espn_data(logger: Logger) -> Optional[pd.DataFrame]:
 
         logger.log("Fetching data from ESPN...")
         fetcher = get_espn_fetcher()
-        fetcher.fetch_team_stats()
+        # Use the fetched stats directly (falls back to the last snapshot on errors)
+        df = fetcher.fetch_team_stats()
 
-        # ESPN fetcher saves to CSV - load that instead
-        cache_dir = Path(__file__).parent / "cache"
-        espn_csv_files = sorted(cache_dir.glob("espn_stats_*.csv"), reverse=True)
-
-        if espn_csv_files:
-            latest_csv = espn_csv_files[0]
-            logger.log(f"Loading ESPN data from {latest_csv.name}")
-            df = pd.read_csv(latest_csv)
+        if df is not None:
             logger.log(f"Loaded {len(df)} teams from ESPN")
             return df
         else:
-            logger.log("No ESPN CSV file found", "ERROR")
+            logger.log("No ESPN stats available", "ERROR")
             return None
 
     except Exception as e:
@@ -6,7 +6,7 @@ import asyncio
 import aiohttp
 import requests
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from loguru import logger
 import sys
 import pytz
@@ -40,6 +40,7 @@ from utils.team_name_matcher import get_team_matcher
 from utils.espn_live_fetcher import get_espn_live_fetcher
 from utils.espn_odds_fetcher import get_espn_odds_fetcher
 from utils.referee_stats import get_referee_stats_manager
+from utils.http_client import get_async_http_client, close_async_http_client
 
 # Configure logging
 logger.remove()
@@ -80,6 +81,18 @@ class NCAABettingMonitor:
         # Track game states for end-of-game logging
         self.game_states = {}
 
+        # Concurrent analysis: cap how many games are analyzed at once
+        self.concurrent_analysis = getattr(config, 'CONCURRENT_ANALYSIS', True)
+        self.analysis_semaphore = asyncio.Semaphore(max(1, getattr(config, 'ANALYSIS_CONCURRENCY', 10)))
+
+        # Real-time pushes to the API: one pooled session for the monitor's lifetime
+        self.api_session: Optional[aiohttp.ClientSession] = None
+        self.batch_realtime_updates = getattr(config, 'BATCH_REALTIME_UPDATES', True)
+        self.pending_updates: List[Dict] = []
+
+        # Odds API <-> ESPN pairings found by fuzzy matching: (espn_away, espn_home) -> "away|home"
+        self.odds_match_cache: Dict[Tuple[str, str], str] = {}
+
         # Kill switch: track last time we had live games
         self.last_live_games_time = None
         self.no_games_timeout = 300  # 5 minutes in seconds
@@ -96,13 +109,12 @@ class NCAABettingMonitor:
         logger.info(f"Using The Odds API for betting odds only")
 
     async def initialize(self):
-        """Initialize team stats (fetch once at startup)"""
-        logger.info("Fetching team statistics...")
+        """Initialize team stats (loaded in the background so polling starts right away)"""
+        logger.info("Fetching team statistics in the background...")
         try:
-            self.stats_manager.fetch_all_stats()
-            logger.success("Team statistics loaded successfully")
+            self.stats_manager.refresh_in_background()
         except Exception as e:
-            logger.error(f"Error loading team stats: {e}")
+            logger.error(f"Error starting team stats refresh: {e}")
             logger.warning("Monitor will attempt to continue without cached stats")
 
     async def run(self):
@@ -110,6 +122,8 @@ class NCAABettingMonitor:
         logger.info("Starting monitoring loop...")
         logger.info(f"Polling interval: {config.POLL_INTERVAL} seconds")
         logger.info(f"PPM threshold: {config.PPM_THRESHOLD}")
+        if self.concurrent_analysis:
+            logger.info(f"Concurrent analysis: up to {getattr(config, 'ANALYSIS_CONCURRENCY', 10)} games at once")
         logger.info(f"Kill switch: Auto-shutdown after {self.no_games_timeout // 60} minutes of no live games")
 
         # Log quiet hours config
@@ -147,11 +161,14 @@ class NCAABettingMonitor:
                 logger.error(f"Error in monitoring loop: {e}")
                 await asyncio.sleep(config.POLL_INTERVAL)
 
+        # Kill switch / shutdown: make sure buffered log rows reach disk
+        self.csv_logger.flush()
+
     async def poll_live_games(self):
         """Poll ESPN for live games and The Odds API for betting odds"""
         try:
             # Step 1: Get live games with scores and time from ESPN (free!)
-            espn_games = self.espn_fetcher.fetch_live_games()
+            espn_games = await self.espn_fetcher.fetch_live_games_async()
 
             # Separate live and completed games
             live_games = [g for g in espn_games if g['is_live']]
@@ -187,7 +204,8 @@ class NCAABettingMonitor:
                     "dateFormat": "iso"
                 }
 
-                odds_response = requests.get(odds_url, params=odds_params, timeout=10)
+                http_client = get_async_http_client()
+                odds_response = await http_client.get(odds_url, params=odds_params, timeout=10)
                 odds_response.raise_for_status()
 
                 # Log quota usage
@@ -197,41 +215,14 @@ class NCAABettingMonitor:
 
                 odds_games = odds_response.json()
 
-                # Create map of team names to bookmakers
-                odds_map = {}
-                for odds_game in odds_games:
-                    home = odds_game.get('home_team')
-                    away = odds_game.get('away_team')
-                    if home and away:
-                        # Use both team names as key
-                        key = f"{away}|{home}"
-                        odds_map[key] = odds_game.get('bookmakers', [])
-
                 # Match ESPN games with odds
-                for espn_game in live_games:
-                    espn_home = espn_game['home_team']
-                    espn_away = espn_game['away_team']
-
-                    # Try to find matching odds
-                    bookmakers = None
-                    for odds_key, odds_bookmakers in odds_map.items():
-                        odds_away, odds_home = odds_key.split('|')
-
-                        # Use team matcher for flexible matching
-                        home_match = self.team_matcher.match_teams(espn_home, odds_home)
-                        away_match = self.team_matcher.match_teams(espn_away, odds_away)
-
-                        if home_match and away_match:
-                            bookmakers = odds_bookmakers
-                            logger.debug(f"Matched odds: {espn_away} @ {espn_home} <-> {odds_away} @ {odds_home}")
-                            break
-
+                for espn_game, bookmakers in self._match_odds_to_games(live_games, odds_games):
                     if bookmakers:
                         # Add bookmakers to ESPN game data
                         espn_game['bookmakers'] = bookmakers
                         games_with_odds.append(espn_game)
                     else:
-                        logger.debug(f"No odds found for {espn_away} @ {espn_home}")
+                        logger.debug(f"No odds found for {espn_game['away_team']} @ {espn_game['home_team']}")
 
             except Exception as e:
                 logger.error(f"Error fetching odds from The Odds API: {e}")
@@ -247,12 +238,104 @@ class NCAABettingMonitor:
             logger.info(f"Monitoring {len(games_with_odds)} live games with odds")
 
             # Analyze each game
-            for game in games_with_odds:
-                await self.analyze_game(game)
+            if self.concurrent_analysis:
+                await asyncio.gather(*(self._analyze_game_bounded(game) for game in games_with_odds))
+            else:
+                for game in games_with_odds:
+                    await self.analyze_game(game)
+
+            # Write this cycle's buffered poll rows in one batch
+            self.csv_logger.flush()
+
+            # Push this cycle's updates to the API in one request
+            await self.flush_realtime_updates()
 
         except Exception as e:
             logger.error(f"Error polling live games: {e}", exc_info=True)
 
+    def _match_odds_to_games(self, live_games: List[Dict], odds_games: List[Dict]) -> List[Tuple[Dict, Optional[List]]]:
+        """
+        Pair each live ESPN game with its bookmakers from The Odds API
+
+        Builds an index keyed on (away, home) team keys once per poll so most
+        games resolve with a dict lookup. Only leftovers go through pairwise
+        fuzzy matching, and those pairings are cached across polls since the
+        teams in a game never change.
+
+        Returns:
+            List of (espn_game, bookmakers or None)
+        """
+        # Forget pairings for games that are no longer live
+        live_keys = {(g['away_team'], g['home_team']) for g in live_games}
+        for cached_key in [k for k in self.odds_match_cache if k not in live_keys]:
+            del self.odds_match_cache[cached_key]
+
+        # Create map of team names to bookmakers, plus an index on team keys
+        odds_map = {}
+        odds_index = {}
+        for odds_game in odds_games:
+            home = odds_game.get('home_team')
+            away = odds_game.get('away_team')
+            if home and away:
+                # Use both team names as key
+                key = f"{away}|{home}"
+                odds_map[key] = odds_game.get('bookmakers', [])
+
+                index_key = (self.team_matcher.get_team_key(away), self.team_matcher.get_team_key(home))
+                odds_index.setdefault(index_key, key)
+
+        matches = []
+        leftovers = []
+        claimed = set()
+
+        for espn_game in live_games:
+            espn_home = espn_game['home_team']
+            espn_away = espn_game['away_team']
+
+            # Fuzzy pairing found on an earlier poll
+            odds_key = self.odds_match_cache.get((espn_away, espn_home))
+            if odds_key is None or odds_key not in odds_map:
+                index_key = (self.team_matcher.get_team_key(espn_away), self.team_matcher.get_team_key(espn_home))
+                odds_key = odds_index.get(index_key)
+
+            if odds_key is not None:
+                claimed.add(odds_key)
+                matches.append((espn_game, odds_key))
+            else:
+                leftovers.append(espn_game)
+
+        # Fuzzy matching only for games the index couldn't resolve
+        unclaimed = [key for key in odds_map if key not in claimed]
+        for espn_game in leftovers:
+            espn_home = espn_game['home_team']
+            espn_away = espn_game['away_team']
+
+            # Try to find matching odds
+            matched_key = None
+            for odds_key in unclaimed:
+                odds_away, odds_home = odds_key.split('|')
+
+                # Use team matcher for flexible matching
+                home_match = self.team_matcher.match_teams(espn_home, odds_home)
+                away_match = self.team_matcher.match_teams(espn_away, odds_away)
+
+                if home_match and away_match:
+                    matched_key = odds_key
+                    logger.debug(f"Matched odds: {espn_away} @ {espn_home} <-> {odds_away} @ {odds_home}")
+                    break
+
+            if matched_key is not None:
+                self.odds_match_cache[(espn_away, espn_home)] = matched_key
+                unclaimed.remove(matched_key)
+            matches.append((espn_game, matched_key))
+
+        return [(espn_game, odds_map[key] if key is not None else None) for espn_game, key in matches]
+
+    async def _analyze_game_bounded(self, game: Dict):
+        """Analyze a game while holding a slot of the analysis concurrency cap"""
+        async with self.analysis_semaphore:
+            await self.analyze_game(game)
+
     def _get_espn_live_games(self) -> Dict[str, Dict]:
         """
         Get list of actually live games from ESPN (authoritative source)
@@ -491,6 +574,23 @@ class NCAABettingMonitor:
             logger.error(f"Error fetching live games from The Odds API: {e}")
             return []
 
+    def _get_api_session(self) -> aiohttp.ClientSession:
+        """Get the long-lived pooled session used for pushes to the API"""
+        if self.api_session is None or self.api_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=getattr(config, 'API_SESSION_CONNECTION_LIMIT', 10),
+                keepalive_timeout=60
+            )
+            self.api_session = aiohttp.ClientSession(connector=connector)
+        return self.api_session
+
+    async def close(self):
+        """Release network resources held by the monitor and flush pending log rows"""
+        self.csv_logger.flush()
+        if self.api_session is not None and not self.api_session.closed:
+            await self.api_session.close()
+        self.api_session = None
+
     async def send_realtime_update(self, game_data: Dict, update_type: str = "game_update"):
         """
         Send real-time update to WebSocket clients via API
@@ -500,22 +600,58 @@ class NCAABettingMonitor:
             update_type: Type of update (game_update, trigger, alert)
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{config.BACKEND_URL}/api/internal/trigger-update",
-                    json={"game_data": game_data, "update_type": update_type},
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as response:
-                    if response.status == 200:
-                        logger.debug(f"Real-time update sent for game {game_data.get('game_id')}")
-                    else:
-                        logger.warning(f"Real-time update failed: {response.status}")
+            session = self._get_api_session()
+            async with session.post(
+                f"{config.BACKEND_URL}/api/internal/trigger-update",
+                json={"game_data": game_data, "update_type": update_type},
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                if response.status == 200:
+                    logger.debug(f"Real-time update sent for game {game_data.get('game_id')}")
+                else:
+                    logger.warning(f"Real-time update failed: {response.status}")
         except asyncio.TimeoutError:
             logger.warning(f"Real-time update timed out for game {game_data.get('game_id')}")
         except Exception as e:
             logger.error(f"Error sending real-time update: {e}")
             # Don't raise - let monitoring continue even if WebSocket update fails
 
+    async def flush_realtime_updates(self):
+        """
+        Send all updates queued during this poll cycle in a single request
+
+        Falls back to per-game pushes if the API doesn't have the batch endpoint.
+        """
+        if not self.pending_updates:
+            return
+
+        updates, self.pending_updates = self.pending_updates, []
+
+        try:
+            session = self._get_api_session()
+            async with session.post(
+                f"{config.BACKEND_URL}/api/internal/trigger-update/batch",
+                json={"updates": updates},
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status == 200:
+                    logger.debug(f"Real-time batch sent ({len(updates)} games)")
+                    return
+                if response.status != 404:
+                    logger.warning(f"Real-time batch update failed: {response.status}")
+                    return
+        except asyncio.TimeoutError:
+            logger.warning(f"Real-time batch update timed out ({len(updates)} games)")
+            return
+        except Exception as e:
+            logger.error(f"Error sending real-time batch update: {e}")
+            return
+
+        # Older API without the batch endpoint
+        logger.debug("Batch endpoint not available - sending updates individually")
+        for update in updates:
+            await self.send_realtime_update(update["game_data"], update["update_type"])
+
     async def analyze_game(self, game: Dict):
         """Analyze a single game for betting opportunities"""
         try:
@@ -686,7 +822,7 @@ class NCAABettingMonitor:
             home_stats = {}
             away_stats = {}
             try:
-                espn_data = self.espn_odds_fetcher.fetch_game_odds(game_id)
+                espn_data = await self.espn_odds_fetcher.fetch_game_odds_async(game_id)
                 if espn_data:
                     espn_closing_total = espn_data.get("closing_total")
                     home_stats = espn_data.get("home_stats", {})
@@ -824,7 +960,10 @@ class NCAABettingMonitor:
 
             # Send real-time update for ALL live games (not just triggered)
             update_type = "trigger" if trigger_flag else "game_update"
-            await self.send_realtime_update(log_data, update_type)
+            if self.batch_realtime_updates:
+                self.pending_updates.append({"game_data": log_data, "update_type": update_type})
+            else:
+                await self.send_realtime_update(log_data, update_type)
 
             # Special alert for exceptional confidence
             if confidence_score >= 85:
@@ -1345,7 +1484,11 @@ async def main():
     await monitor.initialize()
 
     # Run monitoring loop
-    await monitor.run()
+    try:
+        await monitor.run()
+    finally:
+        await monitor.close()
+        await close_async_http_client()
 
 
 if __name__ == "__main__":
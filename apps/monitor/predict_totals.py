@@ -26,6 +26,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
 from models.data_pipeline.historical_games_processor import normalize_team_name
+from utils.team_name_matcher import get_team_matcher
 
 
 # ============================================================================
@@ -146,24 +147,47 @@ def load_kenpom_ratings():
     return df
 
 
-def find_team_in_kenpom(team_name: str, kenpom_df: pd.DataFrame):
-    """Find team in KenPom data with flexible matching"""
-    team_normalized = normalize_team_name(team_name)
-
-    # Try exact match
-    exact_match = kenpom_df[kenpom_df['team_normalized'] == team_normalized]
-    if not exact_match.empty:
-        return exact_match.iloc[0]
-
-    # Try partial match
-    for idx, row in kenpom_df.iterrows():
-        kp_name = row['team_normalized'].lower()
-        tm_name = team_normalized.lower()
+def match_teams_in_kenpom(team_names, kenpom_df: pd.DataFrame) -> dict:
+    """
+    Find many teams in KenPom data at once
 
-        if kp_name in tm_name or tm_name in kp_name:
-            return row
+    Exact normalized-name matches first, then one batch fuzzy pass
+    (TeamNameMatcher.match_many) for the rest, then the old substring rule
+    for anything still unmatched.
 
-    return None
+    Returns:
+        Dict mapping each team name to its KenPom row, or None
+    """
+    rows_by_normalized = {}
+    rows_by_team = {}
+    for _, row in kenpom_df.iterrows():
+        rows_by_normalized.setdefault(row['team_normalized'], row)
+        rows_by_team.setdefault(row['team'], row)
+
+    results = {}
+    remaining = []
+    for team_name in dict.fromkeys(team_names):
+        row = rows_by_normalized.get(normalize_team_name(team_name))
+        results[team_name] = row
+        if row is None:
+            remaining.append(team_name)
+
+    if remaining:
+        best = get_team_matcher().match_many(remaining, list(rows_by_team))
+        for team_name in remaining:
+            if best[team_name] is not None:
+                results[team_name] = rows_by_team[best[team_name]]
+                continue
+
+            # Try partial match
+            tm_name = normalize_team_name(team_name).lower()
+            for kp_normalized, row in rows_by_normalized.items():
+                kp_name = kp_normalized.lower()
+                if kp_name in tm_name or tm_name in kp_name:
+                    results[team_name] = row
+                    break
+
+    return results
 
 
 # ============================================================================
@@ -184,16 +208,22 @@ def load_model():
     return ensemble
 
 
-def prepare_game_features(home_team, away_team, kenpom_df):
+def prepare_game_features(home_team, away_team, kenpom_df, kenpom_rows=None):
     """
     Prepare features for a single game.
 
+    Args:
+        kenpom_rows: Team name -> KenPom row from match_teams_in_kenpom
+            (matched here if not given)
+
     Returns:
         DataFrame with features, or None if teams not found
     """
     # Find teams in KenPom data
-    home_kenpom = find_team_in_kenpom(home_team, kenpom_df)
-    away_kenpom = find_team_in_kenpom(away_team, kenpom_df)
+    if kenpom_rows is None:
+        kenpom_rows = match_teams_in_kenpom([home_team, away_team], kenpom_df)
+    home_kenpom = kenpom_rows.get(home_team)
+    away_kenpom = kenpom_rows.get(away_team)
 
     if home_kenpom is None or away_kenpom is None:
         return None
@@ -228,12 +258,16 @@ def predict_games(games, ensemble, kenpom_df):
 
     predictions = []
 
+    # Match every team against KenPom in one batch
+    team_names = [game[side] for game in games for side in ('home_team', 'away_team')]
+    kenpom_rows = match_teams_in_kenpom(team_names, kenpom_df)
+
     for game in games:
         home_team = game['home_team']
         away_team = game['away_team']
 
         # Prepare features
-        features = prepare_game_features(home_team, away_team, kenpom_df)
+        features = prepare_game_features(home_team, away_team, kenpom_df, kenpom_rows)
 
         if features is None:
             print(f"  ⚠️  Skipping {home_team} vs {away_team} (teams not found in KenPom)")
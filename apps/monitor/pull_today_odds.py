@@ -10,7 +10,7 @@ Usage:
 
 Requires:
     - ODDS_API_KEY in .env file
-    - pip install requests python-dotenv
+    - pip install -r requirements.txt (team name matching uses utils/team_name_matcher)
 """
 
 import os
@@ -21,6 +21,8 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from dotenv import load_dotenv
 
+from utils.team_name_matcher import get_team_matcher
+
 # Load environment variables
 load_dotenv()
 
@@ -228,7 +230,12 @@ def extract_best_odds(bookmakers: list) -> dict:
 
 
 def match_games(odds_games: list, espn_games: list) -> list:
-    """Match games between Odds API and ESPN by team names."""
+    """
+    Match games between Odds API and ESPN by team names.
+
+    Games whose normalized names agree are paired directly; the rest go
+    through one TeamNameMatcher.match_many pass over all leftover teams.
+    """
     matched = []
 
     # Create lookup by normalized team names
@@ -279,12 +286,44 @@ def match_games(odds_games: list, espn_games: list) -> list:
             key = f"{normalize(game['away_team'])}@{normalize(game['home_team'])}"
             espn_lookup[key] = game
 
-    for odds_game in odds_games:
+    # Exact matches on the normalized names first
+    pairs = {}
+    for i, odds_game in enumerate(odds_games):
+        key = f"{normalize(odds_game.get('away_team', ''))}@{normalize(odds_game.get('home_team', ''))}"
+        if key in espn_lookup:
+            pairs[i] = espn_lookup[key]
+
+    # Batch fuzzy match the leftovers: both teams must resolve to the same ESPN game
+    paired_ids = {id(game) for game in pairs.values()}
+    leftover_espn = [g for g in espn_games if g and id(g) not in paired_ids]
+    leftover_odds = [i for i in range(len(odds_games)) if i not in pairs]
+    if leftover_espn and leftover_odds:
+        team_games = {}
+        for game in leftover_espn:
+            team_games.setdefault(game["away_team"], game)
+            team_games.setdefault(game["home_team"], game)
+
+        targets = set()
+        for i in leftover_odds:
+            targets.update(filter(None, (odds_games[i].get("away_team"), odds_games[i].get("home_team"))))
+        best = get_team_matcher().match_many(sorted(targets), list(team_games))
+
+        for i in leftover_odds:
+            away_match = best.get(odds_games[i].get("away_team"))
+            home_match = best.get(odds_games[i].get("home_team"))
+            if away_match is None or home_match is None:
+                continue
+            game = team_games[away_match]
+            if game is team_games[home_match] and id(game) not in paired_ids and \
+                    game["away_team"] == away_match and game["home_team"] == home_match:
+                pairs[i] = game
+                paired_ids.add(id(game))
+
+    for i, odds_game in enumerate(odds_games):
         home = odds_game.get("home_team", "")
         away = odds_game.get("away_team", "")
-        key = f"{normalize(away)}@{normalize(home)}"
 
-        espn_game = espn_lookup.get(key)
+        espn_game = pairs.get(i)
         espn_odds = espn_game.get("espn_odds", {}) if espn_game else {}
 
         # Get ESPN total if available
@@ -318,16 +357,10 @@ def match_games(odds_games: list, espn_games: list) -> list:
         })
 
     # Add ESPN-only games (no odds available)
-    odds_keys = set()
-    for g in odds_games:
-        key = f"{normalize(g.get('away_team', ''))}@{normalize(g.get('home_team', ''))}"
-        odds_keys.add(key)
-
     for game in espn_games:
         if not game:
             continue
-        key = f"{normalize(game['away_team'])}@{normalize(game['home_team'])}"
-        if key not in odds_keys:
+        if id(game) not in paired_ids:
             espn_odds = game.get("espn_odds", {})
             espn_total = None
             for provider, data in espn_odds.items():
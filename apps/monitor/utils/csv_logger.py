@@ -2,13 +2,399 @@
 CSV Logging System
 Logs live game polls and end-of-game results
 """
+import atexit
 import csv
+import heapq
+import io
+import os
+import threading
+import time
+from collections import defaultdict, deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from loguru import logger
 import config
 
+# Block size for reverse (seek-from-EOF) reads of the live log
+TAIL_READ_BLOCK_SIZE = 64 * 1024
+
+LIVE_LOG_HEADERS = [
+    "Team 1",
+    "Score 1",
+    "Team 2",
+    "Score 2",
+    "Period",
+    "Mins Remaining",
+    "Secs Remaining",
+    "Status",
+    "OU Line",
+    "Sportsbook",
+    "ESPN Closing Total",
+    "Home Moneyline",
+    "Away Moneyline",
+    "Moneyline Book",
+    "Home Spread",
+    "Home Spread Odds",
+    "Away Spread",
+    "Away Spread Odds",
+    "Spread Book",
+    "Home Fouls",
+    "Away Fouls",
+    "Referees",
+    # Live shooting stats - Home
+    "Home FGM",
+    "Home FGA",
+    "Home FG%",
+    "Home 3PM",
+    "Home 3PA",
+    "Home 3P%",
+    "Home FTM",
+    "Home FTA",
+    "Home FT%",
+    # Live shooting stats - Away
+    "Away FGM",
+    "Away FGA",
+    "Away FG%",
+    "Away 3PM",
+    "Away 3PA",
+    "Away 3P%",
+    "Away FTM",
+    "Away FTA",
+    "Away FT%",
+    # Live possession stats - Home
+    "Home Rebounds",
+    "Home Off Rebounds",
+    "Home Def Rebounds",
+    "Home Assists",
+    "Home Steals",
+    "Home Blocks",
+    "Home Turnovers",
+    # Live possession stats - Away
+    "Away Rebounds",
+    "Away Off Rebounds",
+    "Away Def Rebounds",
+    "Away Assists",
+    "Away Steals",
+    "Away Blocks",
+    "Away Turnovers",
+    # Calculated live metrics
+    "Home Live eFG%",
+    "Home Live TS%",
+    "Away Live eFG%",
+    "Away Live TS%",
+    "Required PPM",
+    "Time Weighted Threshold",
+    "Current PPM",
+    "PPM Diff",
+    "Projected Final",
+    "Total Time Left",
+    "Bet Type",
+    "Trigger",
+    "Trigger Reasons",
+    "Confidence",
+    "Units",
+    "Bet Recommendation",
+    "Bet Status Reason",
+    "Home Pace",
+    "Home Off Eff",
+    "Home Def Eff",
+    "Home AdjEM",
+    "Home Avg PPM",
+    "Home Avg PPG",
+    "Home KenPom Rank",
+    "Home eFG%",         # NEW
+    "Home TS%",          # NEW
+    "Home 2P%",          # NEW
+    "Home Eff Margin",   # NEW
+    "Home Assists/G",    # Phase 2
+    "Home Steals/G",     # Phase 2
+    "Home Blocks/G",     # Phase 2
+    "Home Fouls/G",      # Phase 2
+    "Home A/TO Ratio",   # Phase 2
+    "Home DReb%",        # Phase 2
+    "Away Pace",
+    "Away Off Eff",
+    "Away Def Eff",
+    "Away AdjEM",
+    "Away Avg PPM",
+    "Away Avg PPG",
+    "Away KenPom Rank",
+    "Away eFG%",         # NEW
+    "Away TS%",          # NEW
+    "Away 2P%",          # NEW
+    "Away Eff Margin",   # NEW
+    "Away Assists/G",    # Phase 2
+    "Away Steals/G",     # Phase 2
+    "Away Blocks/G",     # Phase 2
+    "Away Fouls/G",      # Phase 2
+    "Away A/TO Ratio",   # Phase 2
+    "Away DReb%",        # Phase 2
+    "Timestamp",
+    "Game ID"
+]
+
+RESULTS_HEADERS = [
+    "game_id",
+    "date",
+    "home_team",
+    "away_team",
+    "final_home_score",
+    "final_away_score",
+    "final_total",
+    "ou_line",
+    "ou_open",
+    "ou_result",
+    "went_to_ot",
+    "our_trigger",
+    "max_confidence",
+    "max_units",
+    "trigger_timestamp",
+    "outcome",
+    "unit_profit",
+    "notes"
+]
+
+
+# (timestamp/date column, game ID column) iter_rows filters on, per log kind
+FILTER_COLUMNS = {
+    "live_log": ("Timestamp", "Game ID"),
+    "results": ("date", "game_id"),
+}
+
+
+def build_live_log_row(game_data: Dict) -> list:
+    """Build a live log row (in LIVE_LOG_HEADERS order) from monitor game data"""
+    # Format: Team 1 (Away), Score 1, Team 2 (Home), Score 2, Period, etc.
+    status = "In Progress" if game_data.get("period", 0) > 0 else "Not Started"
+
+    row = [
+        game_data.get("away_team"),           # Team 1 (Away)
+        game_data.get("away_score"),          # Score 1
+        game_data.get("home_team"),           # Team 2 (Home)
+        game_data.get("home_score"),          # Score 2
+        game_data.get("period"),              # Period
+        game_data.get("minutes_remaining"),   # Mins Remaining
+        game_data.get("seconds_remaining"),   # Secs Remaining
+        status,                                # Status
+        game_data.get("ou_line"),             # OU Line
+        game_data.get("sportsbook", ""),      # Sportsbook
+        game_data.get("espn_closing_total", ""),  # ESPN Closing Total
+        game_data.get("home_moneyline", ""),  # Home Moneyline
+        game_data.get("away_moneyline", ""),  # Away Moneyline
+        game_data.get("moneyline_book", ""),  # Moneyline Book
+        game_data.get("home_spread", ""),     # Home Spread
+        game_data.get("home_spread_odds", ""),  # Home Spread Odds
+        game_data.get("away_spread", ""),     # Away Spread
+        game_data.get("away_spread_odds", ""),  # Away Spread Odds
+        game_data.get("spread_book", ""),     # Spread Book
+        game_data.get("home_fouls", ""),      # Home Fouls
+        game_data.get("away_fouls", ""),      # Away Fouls
+        "; ".join(game_data.get("referees", [])),  # Referees
+        # Live shooting stats - Home
+        game_data.get("home_stats", {}).get("fg_made", ""),
+        game_data.get("home_stats", {}).get("fg_attempted", ""),
+        game_data.get("home_stats", {}).get("fg_pct", ""),
+        game_data.get("home_stats", {}).get("three_made", ""),
+        game_data.get("home_stats", {}).get("three_attempted", ""),
+        game_data.get("home_stats", {}).get("three_pct", ""),
+        game_data.get("home_stats", {}).get("ft_made", ""),
+        game_data.get("home_stats", {}).get("ft_attempted", ""),
+        game_data.get("home_stats", {}).get("ft_pct", ""),
+        # Live shooting stats - Away
+        game_data.get("away_stats", {}).get("fg_made", ""),
+        game_data.get("away_stats", {}).get("fg_attempted", ""),
+        game_data.get("away_stats", {}).get("fg_pct", ""),
+        game_data.get("away_stats", {}).get("three_made", ""),
+        game_data.get("away_stats", {}).get("three_attempted", ""),
+        game_data.get("away_stats", {}).get("three_pct", ""),
+        game_data.get("away_stats", {}).get("ft_made", ""),
+        game_data.get("away_stats", {}).get("ft_attempted", ""),
+        game_data.get("away_stats", {}).get("ft_pct", ""),
+        # Live possession stats - Home
+        game_data.get("home_stats", {}).get("rebounds_total", ""),
+        game_data.get("home_stats", {}).get("rebounds_offensive", ""),
+        game_data.get("home_stats", {}).get("rebounds_defensive", ""),
+        game_data.get("home_stats", {}).get("assists", ""),
+        game_data.get("home_stats", {}).get("steals", ""),
+        game_data.get("home_stats", {}).get("blocks", ""),
+        game_data.get("home_stats", {}).get("turnovers", ""),
+        # Live possession stats - Away
+        game_data.get("away_stats", {}).get("rebounds_total", ""),
+        game_data.get("away_stats", {}).get("rebounds_offensive", ""),
+        game_data.get("away_stats", {}).get("rebounds_defensive", ""),
+        game_data.get("away_stats", {}).get("assists", ""),
+        game_data.get("away_stats", {}).get("steals", ""),
+        game_data.get("away_stats", {}).get("blocks", ""),
+        game_data.get("away_stats", {}).get("turnovers", ""),
+        # Calculated live metrics
+        game_data.get("home_stats", {}).get("effective_fg_pct", ""),
+        game_data.get("home_stats", {}).get("true_shooting_pct", ""),
+        game_data.get("away_stats", {}).get("effective_fg_pct", ""),
+        game_data.get("away_stats", {}).get("true_shooting_pct", ""),
+        round(game_data.get("required_ppm", 0), 2),      # Required PPM
+        round(game_data.get("time_weighted_threshold", 0), 2),  # Time Weighted Threshold
+        round(game_data.get("current_ppm", 0), 2),       # Current PPM
+        round(game_data.get("ppm_difference", 0), 2),    # PPM Diff
+        round(game_data.get("projected_final_score", 0), 1),  # Projected Final
+        round(game_data.get("total_time_remaining", 0), 1),   # Total Time Left
+        game_data.get("bet_type", "").upper(),           # Bet Type
+        "YES" if game_data.get("trigger_flag") else "NO",  # Trigger
+        game_data.get("trigger_reasons", ""),            # Trigger Reasons
+        round(game_data.get("confidence_score", 0), 1),  # Confidence
+        game_data.get("unit_size", 0),                   # Units
+        game_data.get("bet_recommendation", "MONITOR"),  # Bet Recommendation
+        game_data.get("bet_status_reason", ""),          # Bet Status Reason
+        game_data.get("home_metrics", {}).get("pace_per_game", ""),     # Home Pace
+        game_data.get("home_metrics", {}).get("off_efficiency", ""),    # Home Off Eff
+        game_data.get("home_metrics", {}).get("def_efficiency", ""),    # Home Def Eff
+        game_data.get("home_metrics", {}).get("adj_em", ""),            # Home AdjEM
+        game_data.get("home_metrics", {}).get("avg_ppm", ""),           # Home Avg PPM
+        game_data.get("home_metrics", {}).get("avg_ppg", ""),           # Home Avg PPG
+        game_data.get("home_metrics", {}).get("kenpom_rank") or game_data.get("home_metrics", {}).get("espn_rank", ""),  # Home Rank (KenPom or ESPN)
+        game_data.get("home_metrics", {}).get("efg_pct", ""),           # Home eFG% (NEW)
+        game_data.get("home_metrics", {}).get("ts_pct", ""),            # Home TS% (NEW)
+        game_data.get("home_metrics", {}).get("two_p_pct", ""),         # Home 2P% (NEW)
+        game_data.get("home_metrics", {}).get("efficiency_margin", ""), # Home Eff Margin (NEW)
+        game_data.get("home_metrics", {}).get("assists_per_game", ""),  # Home Assists/G (Phase 2)
+        game_data.get("home_metrics", {}).get("steals_per_game", ""),   # Home Steals/G (Phase 2)
+        game_data.get("home_metrics", {}).get("blocks_per_game", ""),   # Home Blocks/G (Phase 2)
+        game_data.get("home_metrics", {}).get("fouls_per_game", ""),    # Home Fouls/G (Phase 2)
+        game_data.get("home_metrics", {}).get("ast_to_ratio", ""),      # Home A/TO Ratio (Phase 2)
+        game_data.get("home_metrics", {}).get("dreb_pct", ""),          # Home DReb% (Phase 2)
+        game_data.get("away_metrics", {}).get("pace_per_game", ""),     # Away Pace
+        game_data.get("away_metrics", {}).get("off_efficiency", ""),    # Away Off Eff
+        game_data.get("away_metrics", {}).get("def_efficiency", ""),    # Away Def Eff
+        game_data.get("away_metrics", {}).get("adj_em", ""),            # Away AdjEM
+        game_data.get("away_metrics", {}).get("avg_ppm", ""),           # Away Avg PPM
+        game_data.get("away_metrics", {}).get("avg_ppg", ""),           # Away Avg PPG
+        game_data.get("away_metrics", {}).get("kenpom_rank") or game_data.get("away_metrics", {}).get("espn_rank", ""),  # Away Rank (KenPom or ESPN)
+        game_data.get("away_metrics", {}).get("efg_pct", ""),           # Away eFG% (NEW)
+        game_data.get("away_metrics", {}).get("ts_pct", ""),            # Away TS% (NEW)
+        game_data.get("away_metrics", {}).get("two_p_pct", ""),         # Away 2P% (NEW)
+        game_data.get("away_metrics", {}).get("efficiency_margin", ""), # Away Eff Margin (NEW)
+        game_data.get("away_metrics", {}).get("assists_per_game", ""),  # Away Assists/G (Phase 2)
+        game_data.get("away_metrics", {}).get("steals_per_game", ""),   # Away Steals/G (Phase 2)
+        game_data.get("away_metrics", {}).get("blocks_per_game", ""),   # Away Blocks/G (Phase 2)
+        game_data.get("away_metrics", {}).get("fouls_per_game", ""),    # Away Fouls/G (Phase 2)
+        game_data.get("away_metrics", {}).get("ast_to_ratio", ""),      # Away A/TO Ratio (Phase 2)
+        game_data.get("away_metrics", {}).get("dreb_pct", ""),          # Away DReb% (Phase 2)
+        game_data.get("timestamp", datetime.now().isoformat()),         # Timestamp
+        game_data.get("game_id")                                        # Game ID
+    ]
+    return row
+
+
+def build_result_row(result_data: Dict) -> list:
+    """Build a results row (in RESULTS_HEADERS order) from a game result"""
+    row = [
+        result_data.get("game_id"),
+        result_data.get("date"),
+        result_data.get("home_team"),
+        result_data.get("away_team"),
+        result_data.get("final_home_score"),
+        result_data.get("final_away_score"),
+        result_data.get("final_total"),
+        result_data.get("ou_line"),
+        result_data.get("ou_open"),
+        result_data.get("ou_result"),  # "over" or "under" or "push"
+        result_data.get("went_to_ot", False),
+        result_data.get("our_trigger", False),
+        result_data.get("max_confidence", 0),
+        result_data.get("max_units", 0),
+        result_data.get("trigger_timestamp", ""),
+        result_data.get("outcome", ""),  # "win", "loss", "push", or ""
+        result_data.get("unit_profit", 0),
+        result_data.get("notes", "")
+    ]
+    return row
+
+
+def calculate_performance_stats(results: List[Dict]) -> Dict:
+    """
+    Calculate win rates, ROI and per-confidence-tier stats from result rows
+
+    Args:
+        results: Result rows (as read back from storage, values are strings)
+
+    Returns:
+        Dict with win rates, ROI, etc.
+    """
+    if not results:
+        return {
+            "total_bets": 0,
+            "wins": 0,
+            "losses": 0,
+            "pushes": 0,
+            "win_rate": 0,
+            "total_units_wagered": 0,
+            "total_unit_profit": 0,
+            "roi": 0,
+            "by_confidence": {}
+        }
+
+    # Filter to only games we bet on
+    bets = [r for r in results if r.get("our_trigger") == "True"]
+
+    total_bets = len(bets)
+    wins = len([r for r in bets if r.get("outcome") == "win"])
+    losses = len([r for r in bets if r.get("outcome") == "loss"])
+    pushes = len([r for r in bets if r.get("outcome") == "push"])
+
+    win_rate = (wins / total_bets * 100) if total_bets > 0 else 0
+
+    total_units_wagered = sum(float(r.get("max_units", 0)) for r in bets)
+    total_unit_profit = sum(float(r.get("unit_profit", 0)) for r in bets)
+
+    roi = (total_unit_profit / total_units_wagered * 100) if total_units_wagered > 0 else 0
+
+    # Performance by confidence tier
+    by_confidence = {
+        "low (41-60)": {"bets": 0, "wins": 0, "profit": 0},
+        "medium (61-75)": {"bets": 0, "wins": 0, "profit": 0},
+        "high (76-85)": {"bets": 0, "wins": 0, "profit": 0},
+        "max (86-100)": {"bets": 0, "wins": 0, "profit": 0}
+    }
+
+    for bet in bets:
+        conf = float(bet.get("max_confidence", 0))
+        tier = None
+
+        if 41 <= conf <= 60:
+            tier = "low (41-60)"
+        elif 61 <= conf <= 75:
+            tier = "medium (61-75)"
+        elif 76 <= conf <= 85:
+            tier = "high (76-85)"
+        elif 86 <= conf <= 100:
+            tier = "max (86-100)"
+
+        if tier:
+            by_confidence[tier]["bets"] += 1
+            if bet.get("outcome") == "win":
+                by_confidence[tier]["wins"] += 1
+            by_confidence[tier]["profit"] += float(bet.get("unit_profit", 0))
+
+    # Calculate win rates for each tier
+    for tier in by_confidence:
+        bets_count = by_confidence[tier]["bets"]
+        if bets_count > 0:
+            by_confidence[tier]["win_rate"] = by_confidence[tier]["wins"] / bets_count * 100
+        else:
+            by_confidence[tier]["win_rate"] = 0
+
+    return {
+        "total_bets": total_bets,
+        "wins": wins,
+        "losses": losses,
+        "pushes": pushes,
+        "win_rate": win_rate,
+        "total_units_wagered": total_units_wagered,
+        "total_unit_profit": total_unit_profit,
+        "roi": roi,
+        "by_confidence": by_confidence
+    }
+
 
 class CSVLogger:
     """Handles CSV logging for live polls and game results"""
@@ -17,127 +403,42 @@ class CSVLogger:
         self.live_log_path = config.LIVE_LOG_FILE
         self.results_path = config.RESULTS_FILE
 
+        # Ring buffer of recent live log rows, synced to the file by byte offset
+        # (the API and monitor run in separate processes, so new rows are
+        # picked up incrementally from the file as well as on write)
+        self._recent_rows = deque(maxlen=getattr(config, 'RECENT_LOG_BUFFER_SIZE', 1000))
+        self._recent_offset = None  # Byte offset the buffer is synced up to
+        self._live_headers = None
+        self._recent_lock = threading.Lock()
+
+        # Per-game append-only side files for full game history
+        self.game_history_dir = config.GAME_HISTORY_DIR
+        self.game_history_dir.mkdir(parents=True, exist_ok=True)
+
+        # Latest timestamp seen for each game (its end time once it is over),
+        # synced from the live log by byte offset like the ring buffer
+        self._game_end_times: Dict[str, str] = {}
+        self._index_offset = None
+        self._index_lock = threading.Lock()
+
+        # Write-behind buffer of (game_id, formatted row) for the live log,
+        # flushed once per poll cycle and at most flush_interval seconds late
+        self._pending_lines = []
+        self._pending_since = 0.0
+        self._pending_lock = threading.Lock()
+        self.flush_interval = getattr(config, 'LIVE_LOG_FLUSH_INTERVAL', 5)
+        self.flush_max_rows = getattr(config, 'LIVE_LOG_FLUSH_MAX_ROWS', 500)
+
         # Initialize CSV files with headers if they don't exist
         self._init_live_log()
         self._init_results_log()
 
+        atexit.register(self.flush)
+
     def _init_live_log(self):
         """Initialize live log CSV with headers"""
         if not self.live_log_path.exists():
-            headers = [
-                "Team 1",
-                "Score 1",
-                "Team 2",
-                "Score 2",
-                "Period",
-                "Mins Remaining",
-                "Secs Remaining",
-                "Status",
-                "OU Line",
-                "Sportsbook",
-                "ESPN Closing Total",
-                "Home Moneyline",
-                "Away Moneyline",
-                "Moneyline Book",
-                "Home Spread",
-                "Home Spread Odds",
-                "Away Spread",
-                "Away Spread Odds",
-                "Spread Book",
-                "Home Fouls",
-                "Away Fouls",
-                "Referees",
-                # Live shooting stats - Home
-                "Home FGM",
-                "Home FGA",
-                "Home FG%",
-                "Home 3PM",
-                "Home 3PA",
-                "Home 3P%",
-                "Home FTM",
-                "Home FTA",
-                "Home FT%",
-                # Live shooting stats - Away
-                "Away FGM",
-                "Away FGA",
-                "Away FG%",
-                "Away 3PM",
-                "Away 3PA",
-                "Away 3P%",
-                "Away FTM",
-                "Away FTA",
-                "Away FT%",
-                # Live possession stats - Home
-                "Home Rebounds",
-                "Home Off Rebounds",
-                "Home Def Rebounds",
-                "Home Assists",
-                "Home Steals",
-                "Home Blocks",
-                "Home Turnovers",
-                # Live possession stats - Away
-                "Away Rebounds",
-                "Away Off Rebounds",
-                "Away Def Rebounds",
-                "Away Assists",
-                "Away Steals",
-                "Away Blocks",
-                "Away Turnovers",
-                # Calculated live metrics
-                "Home Live eFG%",
-                "Home Live TS%",
-                "Away Live eFG%",
-                "Away Live TS%",
-                "Required PPM",
-                "Time Weighted Threshold",
-                "Current PPM",
-                "PPM Diff",
-                "Projected Final",
-                "Total Time Left",
-                "Bet Type",
-                "Trigger",
-                "Trigger Reasons",
-                "Confidence",
-                "Units",
-                "Bet Recommendation",
-                "Bet Status Reason",
-                "Home Pace",
-                "Home Off Eff",
-                "Home Def Eff",
-                "Home AdjEM",
-                "Home Avg PPM",
-                "Home Avg PPG",
-                "Home KenPom Rank",
-                "Home eFG%",         # NEW
-                "Home TS%",          # NEW
-                "Home 2P%",          # NEW
-                "Home Eff Margin",   # NEW
-                "Home Assists/G",    # Phase 2
-                "Home Steals/G",     # Phase 2
-                "Home Blocks/G",     # Phase 2
-                "Home Fouls/G",      # Phase 2
-                "Home A/TO Ratio",   # Phase 2
-                "Home DReb%",        # Phase 2
-                "Away Pace",
-                "Away Off Eff",
-                "Away Def Eff",
-                "Away AdjEM",
-                "Away Avg PPM",
-                "Away Avg PPG",
-                "Away KenPom Rank",
-                "Away eFG%",         # NEW
-                "Away TS%",          # NEW
-                "Away 2P%",          # NEW
-                "Away Eff Margin",   # NEW
-                "Away Assists/G",    # Phase 2
-                "Away Steals/G",     # Phase 2
-                "Away Blocks/G",     # Phase 2
-                "Away Fouls/G",      # Phase 2
-                "Away A/TO Ratio",   # Phase 2
-                "Away DReb%",        # Phase 2
-                "Timestamp",
-                "Game ID"
-            ]
+            headers = LIVE_LOG_HEADERS
 
             with open(self.live_log_path, 'w', newline='') as f:
                 writer = csv.writer(f)
@@ -148,26 +449,7 @@ class CSVLogger:
     def _init_results_log(self):
         """Initialize results log CSV with headers"""
         if not self.results_path.exists():
-            headers = [
-                "game_id",
-                "date",
-                "home_team",
-                "away_team",
-                "final_home_score",
-                "final_away_score",
-                "final_total",
-                "ou_line",
-                "ou_open",
-                "ou_result",
-                "went_to_ot",
-                "our_trigger",
-                "max_confidence",
-                "max_units",
-                "trigger_timestamp",
-                "outcome",
-                "unit_profit",
-                "notes"
-            ]
+            headers = RESULTS_HEADERS
 
             with open(self.results_path, 'w', newline='') as f:
                 writer = csv.writer(f)
@@ -177,7 +459,7 @@ class CSVLogger:
 
     def log_live_poll(self, game_data: Dict):
         """
-        Log a live game poll to CSV
+        Buffer a live game poll for the CSV live log (written by flush())
 
         Args:
             game_data: Dict containing:
@@ -194,131 +476,116 @@ class CSVLogger:
                 - notes (optional)
         """
         try:
-            # Format: Team 1 (Away), Score 1, Team 2 (Home), Score 2, Period, etc.
-            status = "In Progress" if game_data.get("period", 0) > 0 else "Not Started"
-
-            row = [
-                game_data.get("away_team"),           # Team 1 (Away)
-                game_data.get("away_score"),          # Score 1
-                game_data.get("home_team"),           # Team 2 (Home)
-                game_data.get("home_score"),          # Score 2
-                game_data.get("period"),              # Period
-                game_data.get("minutes_remaining"),   # Mins Remaining
-                game_data.get("seconds_remaining"),   # Secs Remaining
-                status,                                # Status
-                game_data.get("ou_line"),             # OU Line
-                game_data.get("sportsbook", ""),      # Sportsbook
-                game_data.get("espn_closing_total", ""),  # ESPN Closing Total
-                game_data.get("home_moneyline", ""),  # Home Moneyline
-                game_data.get("away_moneyline", ""),  # Away Moneyline
-                game_data.get("moneyline_book", ""),  # Moneyline Book
-                game_data.get("home_spread", ""),     # Home Spread
-                game_data.get("home_spread_odds", ""),  # Home Spread Odds
-                game_data.get("away_spread", ""),     # Away Spread
-                game_data.get("away_spread_odds", ""),  # Away Spread Odds
-                game_data.get("spread_book", ""),     # Spread Book
-                game_data.get("home_fouls", ""),      # Home Fouls
-                game_data.get("away_fouls", ""),      # Away Fouls
-                "; ".join(game_data.get("referees", [])),  # Referees
-                # Live shooting stats - Home
-                game_data.get("home_stats", {}).get("fg_made", ""),
-                game_data.get("home_stats", {}).get("fg_attempted", ""),
-                game_data.get("home_stats", {}).get("fg_pct", ""),
-                game_data.get("home_stats", {}).get("three_made", ""),
-                game_data.get("home_stats", {}).get("three_attempted", ""),
-                game_data.get("home_stats", {}).get("three_pct", ""),
-                game_data.get("home_stats", {}).get("ft_made", ""),
-                game_data.get("home_stats", {}).get("ft_attempted", ""),
-                game_data.get("home_stats", {}).get("ft_pct", ""),
-                # Live shooting stats - Away
-                game_data.get("away_stats", {}).get("fg_made", ""),
-                game_data.get("away_stats", {}).get("fg_attempted", ""),
-                game_data.get("away_stats", {}).get("fg_pct", ""),
-                game_data.get("away_stats", {}).get("three_made", ""),
-                game_data.get("away_stats", {}).get("three_attempted", ""),
-                game_data.get("away_stats", {}).get("three_pct", ""),
-                game_data.get("away_stats", {}).get("ft_made", ""),
-                game_data.get("away_stats", {}).get("ft_attempted", ""),
-                game_data.get("away_stats", {}).get("ft_pct", ""),
-                # Live possession stats - Home
-                game_data.get("home_stats", {}).get("rebounds_total", ""),
-                game_data.get("home_stats", {}).get("rebounds_offensive", ""),
-                game_data.get("home_stats", {}).get("rebounds_defensive", ""),
-                game_data.get("home_stats", {}).get("assists", ""),
-                game_data.get("home_stats", {}).get("steals", ""),
-                game_data.get("home_stats", {}).get("blocks", ""),
-                game_data.get("home_stats", {}).get("turnovers", ""),
-                # Live possession stats - Away
-                game_data.get("away_stats", {}).get("rebounds_total", ""),
-                game_data.get("away_stats", {}).get("rebounds_offensive", ""),
-                game_data.get("away_stats", {}).get("rebounds_defensive", ""),
-                game_data.get("away_stats", {}).get("assists", ""),
-                game_data.get("away_stats", {}).get("steals", ""),
-                game_data.get("away_stats", {}).get("blocks", ""),
-                game_data.get("away_stats", {}).get("turnovers", ""),
-                # Calculated live metrics
-                game_data.get("home_stats", {}).get("effective_fg_pct", ""),
-                game_data.get("home_stats", {}).get("true_shooting_pct", ""),
-                game_data.get("away_stats", {}).get("effective_fg_pct", ""),
-                game_data.get("away_stats", {}).get("true_shooting_pct", ""),
-                round(game_data.get("required_ppm", 0), 2),      # Required PPM
-                round(game_data.get("time_weighted_threshold", 0), 2),  # Time Weighted Threshold
-                round(game_data.get("current_ppm", 0), 2),       # Current PPM
-                round(game_data.get("ppm_difference", 0), 2),    # PPM Diff
-                round(game_data.get("projected_final_score", 0), 1),  # Projected Final
-                round(game_data.get("total_time_remaining", 0), 1),   # Total Time Left
-                game_data.get("bet_type", "").upper(),           # Bet Type
-                "YES" if game_data.get("trigger_flag") else "NO",  # Trigger
-                game_data.get("trigger_reasons", ""),            # Trigger Reasons
-                round(game_data.get("confidence_score", 0), 1),  # Confidence
-                game_data.get("unit_size", 0),                   # Units
-                game_data.get("bet_recommendation", "MONITOR"),  # Bet Recommendation
-                game_data.get("bet_status_reason", ""),          # Bet Status Reason
-                game_data.get("home_metrics", {}).get("pace_per_game", ""),     # Home Pace
-                game_data.get("home_metrics", {}).get("off_efficiency", ""),    # Home Off Eff
-                game_data.get("home_metrics", {}).get("def_efficiency", ""),    # Home Def Eff
-                game_data.get("home_metrics", {}).get("adj_em", ""),            # Home AdjEM
-                game_data.get("home_metrics", {}).get("avg_ppm", ""),           # Home Avg PPM
-                game_data.get("home_metrics", {}).get("avg_ppg", ""),           # Home Avg PPG
-                game_data.get("home_metrics", {}).get("kenpom_rank") or game_data.get("home_metrics", {}).get("espn_rank", ""),  # Home Rank (KenPom or ESPN)
-                game_data.get("home_metrics", {}).get("efg_pct", ""),           # Home eFG% (NEW)
-                game_data.get("home_metrics", {}).get("ts_pct", ""),            # Home TS% (NEW)
-                game_data.get("home_metrics", {}).get("two_p_pct", ""),         # Home 2P% (NEW)
-                game_data.get("home_metrics", {}).get("efficiency_margin", ""), # Home Eff Margin (NEW)
-                game_data.get("home_metrics", {}).get("assists_per_game", ""),  # Home Assists/G (Phase 2)
-                game_data.get("home_metrics", {}).get("steals_per_game", ""),   # Home Steals/G (Phase 2)
-                game_data.get("home_metrics", {}).get("blocks_per_game", ""),   # Home Blocks/G (Phase 2)
-                game_data.get("home_metrics", {}).get("fouls_per_game", ""),    # Home Fouls/G (Phase 2)
-                game_data.get("home_metrics", {}).get("ast_to_ratio", ""),      # Home A/TO Ratio (Phase 2)
-                game_data.get("home_metrics", {}).get("dreb_pct", ""),          # Home DReb% (Phase 2)
-                game_data.get("away_metrics", {}).get("pace_per_game", ""),     # Away Pace
-                game_data.get("away_metrics", {}).get("off_efficiency", ""),    # Away Off Eff
-                game_data.get("away_metrics", {}).get("def_efficiency", ""),    # Away Def Eff
-                game_data.get("away_metrics", {}).get("adj_em", ""),            # Away AdjEM
-                game_data.get("away_metrics", {}).get("avg_ppm", ""),           # Away Avg PPM
-                game_data.get("away_metrics", {}).get("avg_ppg", ""),           # Away Avg PPG
-                game_data.get("away_metrics", {}).get("kenpom_rank") or game_data.get("away_metrics", {}).get("espn_rank", ""),  # Away Rank (KenPom or ESPN)
-                game_data.get("away_metrics", {}).get("efg_pct", ""),           # Away eFG% (NEW)
-                game_data.get("away_metrics", {}).get("ts_pct", ""),            # Away TS% (NEW)
-                game_data.get("away_metrics", {}).get("two_p_pct", ""),         # Away 2P% (NEW)
-                game_data.get("away_metrics", {}).get("efficiency_margin", ""), # Away Eff Margin (NEW)
-                game_data.get("away_metrics", {}).get("assists_per_game", ""),  # Away Assists/G (Phase 2)
-                game_data.get("away_metrics", {}).get("steals_per_game", ""),   # Away Steals/G (Phase 2)
-                game_data.get("away_metrics", {}).get("blocks_per_game", ""),   # Away Blocks/G (Phase 2)
-                game_data.get("away_metrics", {}).get("fouls_per_game", ""),    # Away Fouls/G (Phase 2)
-                game_data.get("away_metrics", {}).get("ast_to_ratio", ""),      # Away A/TO Ratio (Phase 2)
-                game_data.get("away_metrics", {}).get("dreb_pct", ""),          # Away DReb% (Phase 2)
-                game_data.get("timestamp", datetime.now().isoformat()),         # Timestamp
-                game_data.get("game_id")                                        # Game ID
-            ]
+            row = build_live_log_row(game_data)
 
-            with open(self.live_log_path, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(row)
+            line = io.StringIO()
+            csv.writer(line).writerow(row)
+
+            with self._pending_lock:
+                if not self._pending_lines:
+                    self._pending_since = time.monotonic()
+                self._pending_lines.append((game_data.get("game_id"), line.getvalue()))
+                overdue = (
+                    len(self._pending_lines) >= self.flush_max_rows
+                    or time.monotonic() - self._pending_since >= self.flush_interval
+                )
+
+            # Normally flushed once per poll cycle; this bounds how long rows wait
+            if overdue:
+                self.flush()
 
         except Exception as e:
             logger.error(f"Error logging live poll: {e}")
 
+    def flush(self):
+        """Write all buffered live poll rows to the live log in one write"""
+        with self._pending_lock:
+            if not self._pending_lines:
+                return
+            pending = self._pending_lines
+            self._pending_lines = []
+
+        written = False
+        try:
+            data = "".join(line for _, line in pending)
+
+            with self._recent_lock:
+                # Games already in the live log but without a side file yet
+                # (e.g. in progress at deploy) get their earlier rows copied over
+                new_games = {
+                    str(game_id) for game_id, _ in pending
+                    if game_id and not self._game_history_path(game_id).exists()
+                }
+                if new_games:
+                    with self._index_lock:
+                        self._sync_game_index()
+                        backfill = {g for g in new_games if g in self._game_end_times}
+                else:
+                    backfill = set()
+
+                start, end = self._append_live_log(data)
+                written = True
+
+                # Keep the ring buffer current without re-reading the file
+                if self._recent_offset == start and self._live_headers:
+                    reader = csv.reader(io.StringIO(data, newline=''))
+                    for values in reader:
+                        self._recent_rows.append(dict(zip(self._live_headers, values)))
+                    self._recent_offset = end
+
+                if backfill:
+                    try:
+                        self._backfill_game_history(backfill, start)
+                    except OSError as e:
+                        logger.error(f"Error backfilling game history: {e}")
+                        for game_id in backfill:
+                            self._game_history_path(game_id).unlink(missing_ok=True)
+
+                by_game = defaultdict(list)
+                for game_id, line in pending:
+                    by_game[game_id].append(line)
+                for game_id, lines in by_game.items():
+                    try:
+                        self._append_game_history(game_id, "".join(lines))
+                    except OSError as e:
+                        # The rows are in the live log; drop the side file so it is rebuilt from there
+                        logger.error(f"Error writing history for game {game_id}: {e}")
+                        self._game_history_path(game_id).unlink(missing_ok=True)
+
+            logger.debug(f"Flushed {len(pending)} live poll rows to {self.live_log_path}")
+
+        except Exception as e:
+            logger.error(f"Error flushing live polls: {e}")
+            if not written:
+                # Put the rows back so the next flush retries them
+                with self._pending_lock:
+                    self._pending_lines = pending + self._pending_lines
+
+    def _append_live_log(self, data: str) -> Tuple[int, int]:
+        """
+        Append rows to the live log
+
+        A failed write is truncated back to where it started, so a retry
+        never leaves a partial or duplicated row behind.
+
+        Returns:
+            (start, end) byte offsets of the appended data
+        """
+        start = None
+        try:
+            with open(self.live_log_path, 'a', newline='') as f:
+                start = f.tell()
+                f.write(data)
+                f.flush()
+                return start, f.tell()
+        except Exception:
+            if start is not None:
+                try:
+                    os.truncate(self.live_log_path, start)
+                except OSError as e:
+                    logger.error(f"Could not roll back partial live log write: {e}")
+            raise
+
     def log_game_result(self, result_data: Dict):
         """
         Log final game result to CSV
@@ -339,26 +606,7 @@ class CSVLogger:
                 - notes
         """
         try:
-            row = [
-                result_data.get("game_id"),
-                result_data.get("date"),
-                result_data.get("home_team"),
-                result_data.get("away_team"),
-                result_data.get("final_home_score"),
-                result_data.get("final_away_score"),
-                result_data.get("final_total"),
-                result_data.get("ou_line"),
-                result_data.get("ou_open"),
-                result_data.get("ou_result"),  # "over" or "under" or "push"
-                result_data.get("went_to_ot", False),
-                result_data.get("our_trigger", False),
-                result_data.get("max_confidence", 0),
-                result_data.get("max_units", 0),
-                result_data.get("trigger_timestamp", ""),
-                result_data.get("outcome", ""),  # "win", "loss", "push", or ""
-                result_data.get("unit_profit", 0),
-                result_data.get("notes", "")
-            ]
+            row = build_result_row(result_data)
 
             with open(self.results_path, 'a', newline='') as f:
                 writer = csv.writer(f)
@@ -370,16 +618,311 @@ class CSVLogger:
             logger.error(f"Error logging game result: {e}")
 
     def get_recent_logs(self, limit: int = 100) -> list:
-        """Get recent live log entries"""
+        """
+        Get recent live log entries (oldest first)
+
+        Served from the in-memory ring buffer when it is large enough,
+        otherwise by reading backwards from the end of the file. Neither
+        path scans the whole season's log.
+        """
         try:
-            with open(self.live_log_path, 'r') as f:
-                reader = csv.DictReader(f)
-                logs = list(reader)
-                return logs[-limit:] if len(logs) > limit else logs
+            if limit <= 0:
+                return []
+
+            self.flush()
+
+            with self._recent_lock:
+                if limit <= self._recent_rows.maxlen:
+                    self._sync_recent_rows()
+                    rows = list(self._recent_rows)
+                    return rows[-limit:] if len(rows) > limit else rows
+
+                rows, _ = self._tail_rows(limit)
+                return rows
+
         except Exception as e:
             logger.error(f"Error reading live logs: {e}")
             return []
 
+    def _game_history_path(self, game_id) -> Path:
+        """Path of the per-game history side file"""
+        safe_id = "".join(c for c in str(game_id) if c.isalnum() or c in "-_")
+        return self.game_history_dir / f"{safe_id}.csv"
+
+    def _append_game_history(self, game_id, lines: str):
+        """Append already-formatted live log rows to the game's side file"""
+        if not game_id:
+            return
+
+        path = self._game_history_path(game_id)
+        is_new = not path.exists()
+
+        with open(path, 'a', newline='') as f:
+            if is_new:
+                if not self._live_headers:
+                    self._live_headers = self._read_live_headers()
+                csv.writer(f).writerow(self._live_headers)
+            f.write(lines)
+
+    def _collect_game_lines(self, game_ids: set, end_offset: int) -> Dict[str, List[str]]:
+        """
+        Live log rows of the given games, up to end_offset, in one pass
+
+        Returns:
+            game_id -> formatted rows (oldest first); games without rows are left out
+        """
+        lines_by_game = defaultdict(list)
+
+        with open(self.live_log_path, 'rb') as f:
+            headers = next(csv.reader([f.readline().decode('utf-8', errors='replace')]), [])
+            id_col = headers.index("Game ID")
+            needles = [game_id.encode() for game_id in game_ids]
+
+            while f.tell() < end_offset:
+                line = f.readline()
+                # A partially written row is left for the writer's own backfill
+                if not line.endswith(b'\n'):
+                    break
+                # Cheap substring check before parsing the row
+                if not any(needle in line for needle in needles):
+                    continue
+                text = line.decode('utf-8', errors='replace')
+                values = next(csv.reader([text]), None)
+                if values and len(values) > id_col and values[id_col] in game_ids:
+                    lines_by_game[values[id_col]].append(text.rstrip('\r\n') + '\r\n')
+
+        return lines_by_game
+
+    def _backfill_game_history(self, game_ids: set, end_offset: int):
+        """
+        Start side files for games with rows already in the live log
+
+        One pass over the live log up to end_offset copies each game's
+        earlier rows, so its side file holds the full history.
+        """
+        for game_id, lines in self._collect_game_lines(game_ids, end_offset).items():
+            self._append_game_history(game_id, "".join(lines))
+            logger.debug(f"Backfilled {len(lines)} rows of history for game {game_id}")
+
+    def prepare_game_histories(self, game_ids: List[str]):
+        """
+        Create side files for games logged before side files existed
+
+        One pass over the live log covers every game passed in, so paging
+        through old games costs one scan per page, and only the first time.
+        Side files are created atomically; if the monitor starts one for the
+        same game first, its copy (which it backfills itself) is kept.
+        """
+        missing = {str(g) for g in game_ids if g and not self._game_history_path(g).exists()}
+        if not missing:
+            return
+
+        try:
+            self.flush()
+            end_offset = os.path.getsize(self.live_log_path)
+            if not self._live_headers:
+                self._live_headers = self._read_live_headers()
+
+            for game_id, lines in self._collect_game_lines(missing, end_offset).items():
+                path = self._game_history_path(game_id)
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                try:
+                    with open(tmp_path, 'w', newline='') as f:
+                        csv.writer(f).writerow(self._live_headers)
+                        f.write("".join(lines))
+                    os.link(tmp_path, path)
+                except FileExistsError:
+                    pass
+                finally:
+                    tmp_path.unlink(missing_ok=True)
+
+            logger.debug(f"Created history side files for {len(missing)} games")
+
+        except Exception as e:
+            logger.error(f"Error creating game history side files: {e}")
+
+    def get_game_history(self, game_id: str) -> List[Dict]:
+        """
+        Get every live log row for a single game (oldest first)
+
+        Reads only the game's side file. Games logged before side files
+        existed get theirs created from one pass over the live log on
+        first request (see prepare_game_histories).
+        """
+        try:
+            self.flush()
+
+            path = self._game_history_path(game_id)
+            if not path.exists():
+                self.prepare_game_histories([game_id])
+            if not path.exists():
+                return []  # No rows for this game
+
+            with open(path, 'r', newline='') as f:
+                return list(csv.DictReader(f))
+
+        except Exception as e:
+            logger.error(f"Error reading history for game {game_id}: {e}")
+            return []
+
+    def get_games_by_end_time(
+        self,
+        limit: int,
+        before: Optional[Tuple[str, str]] = None
+    ) -> List[Tuple[str, str]]:
+        """
+        Page through games newest-first by the time of their last live log row
+
+        Args:
+            limit: Max games to return
+            before: Only games ordered strictly after this (end timestamp, game_id)
+                cursor, i.e. the last entry of the previous page
+
+        Returns:
+            [(end timestamp, game_id), ...] newest first
+        """
+        try:
+            self.flush()
+
+            with self._index_lock:
+                self._sync_game_index()
+                entries = ((ended, game_id) for game_id, ended in self._game_end_times.items())
+                if before is not None:
+                    entries = (entry for entry in entries if entry < before)
+                return heapq.nlargest(limit, entries)
+
+        except Exception as e:
+            logger.error(f"Error reading game index: {e}")
+            return []
+
+    def _sync_game_index(self):
+        """
+        Fold rows appended to the live log since the last sync into the game index
+
+        The first call streams the whole file once; later calls only read
+        the bytes appended since, so memory stays at one entry per game.
+        """
+        size = os.path.getsize(self.live_log_path)
+
+        # File was replaced/truncated - rebuild
+        if self._index_offset is not None and size < self._index_offset:
+            self._game_end_times = {}
+            self._index_offset = None
+
+        if size == self._index_offset:
+            return
+
+        with open(self.live_log_path, 'rb') as f:
+            headers = next(csv.reader([f.readline().decode('utf-8', errors='replace')]), [])
+            id_col = headers.index("Game ID")
+            ts_col = headers.index("Timestamp")
+
+            if self._index_offset is None:
+                self._index_offset = f.tell()
+            else:
+                f.seek(self._index_offset)
+
+            for line in f:
+                # A partially written row waits for the next sync
+                if not line.endswith(b'\n'):
+                    break
+                self._index_offset += len(line)
+
+                values = next(csv.reader([line.decode('utf-8', errors='replace')]), None)
+                if not values or len(values) <= max(id_col, ts_col):
+                    continue
+                game_id, timestamp = values[id_col], values[ts_col]
+                if game_id and timestamp > self._game_end_times.get(game_id, ""):
+                    self._game_end_times[game_id] = timestamp
+
+    def _read_live_headers(self) -> List[str]:
+        """Read the header row of the live log"""
+        with open(self.live_log_path, 'r', newline='') as f:
+            return next(csv.reader(f), [])
+
+    def _sync_recent_rows(self):
+        """Bring the ring buffer up to date with rows appended since the last sync"""
+        size = os.path.getsize(self.live_log_path)
+
+        # First use, or the file was replaced/truncated - reload from the tail
+        if self._recent_offset is None or size < self._recent_offset:
+            rows, end = self._tail_rows(self._recent_rows.maxlen)
+            self._recent_rows.clear()
+            self._recent_rows.extend(rows)
+            self._recent_offset = end
+            return
+
+        if size == self._recent_offset:
+            return
+
+        with open(self.live_log_path, 'rb') as f:
+            f.seek(self._recent_offset)
+            new_bytes = f.read()
+
+        # Only consume complete lines; a partially written row waits for the next sync
+        complete = new_bytes[:new_bytes.rfind(b'\n') + 1]
+        if not complete:
+            return
+
+        reader = csv.reader(io.StringIO(complete.decode('utf-8', errors='replace'), newline=''))
+        for values in reader:
+            if values:
+                self._recent_rows.append(dict(zip(self._live_headers, values)))
+        self._recent_offset += len(complete)
+
+    def _tail_rows(self, limit: int) -> Tuple[List[Dict], int]:
+        """
+        Read the last `limit` rows of the live log by seeking backwards from EOF
+
+        Assumes one row per line (no embedded newlines), which holds for
+        everything log_live_poll writes.
+
+        Returns:
+            (rows oldest first, byte offset just past the last complete row)
+        """
+        self._live_headers = self._read_live_headers()
+
+        with open(self.live_log_path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            end = f.tell()
+
+            # Skip the header line so it is never returned as a row
+            f.seek(0)
+            f.readline()
+            data_start = f.tell()
+
+            position = end
+            chunks = []
+            newlines = 0
+
+            # Read blocks until we have limit + 1 line breaks (first line may be partial)
+            while position > data_start and newlines <= limit:
+                read_size = min(TAIL_READ_BLOCK_SIZE, position - data_start)
+                position -= read_size
+                f.seek(position)
+                chunk = f.read(read_size)
+                chunks.append(chunk)
+                newlines += chunk.count(b'\n')
+
+        data = b''.join(reversed(chunks))
+
+        # Ignore a trailing row that is still being written
+        data = data[:data.rfind(b'\n') + 1]
+        data_end = position + len(data)
+
+        lines = data.split(b'\n')
+
+        # Drop the leading partial line unless we read all the way to the data start
+        if position > data_start:
+            lines = lines[1:]
+
+        lines = [line for line in lines if line.strip()][-limit:]
+        text = b'\n'.join(lines).decode('utf-8', errors='replace')
+
+        reader = csv.reader(io.StringIO(text, newline=''))
+        rows = [dict(zip(self._live_headers, values)) for values in reader if values]
+        return rows, max(data_end, data_start)
+
     def get_results(self, limit: Optional[int] = None) -> list:
         """Get game results"""
         try:
@@ -409,88 +952,89 @@ class CSVLogger:
         if date_filter:
             results = [r for r in results if r.get("date", "").startswith(date_filter)]
 
-        if not results:
-            return {
-                "total_bets": 0,
-                "wins": 0,
-                "losses": 0,
-                "pushes": 0,
-                "win_rate": 0,
-                "total_units_wagered": 0,
-                "total_unit_profit": 0,
-                "roi": 0,
-                "by_confidence": {}
-            }
-
-        # Filter to only games we bet on
-        bets = [r for r in results if r.get("our_trigger") == "True"]
-
-        total_bets = len(bets)
-        wins = len([r for r in bets if r.get("outcome") == "win"])
-        losses = len([r for r in bets if r.get("outcome") == "loss"])
-        pushes = len([r for r in bets if r.get("outcome") == "push"])
-
-        win_rate = (wins / total_bets * 100) if total_bets > 0 else 0
-
-        total_units_wagered = sum(float(r.get("max_units", 0)) for r in bets)
-        total_unit_profit = sum(float(r.get("unit_profit", 0)) for r in bets)
-
-        roi = (total_unit_profit / total_units_wagered * 100) if total_units_wagered > 0 else 0
-
-        # Performance by confidence tier
-        by_confidence = {
-            "low (41-60)": {"bets": 0, "wins": 0, "profit": 0},
-            "medium (61-75)": {"bets": 0, "wins": 0, "profit": 0},
-            "high (76-85)": {"bets": 0, "wins": 0, "profit": 0},
-            "max (86-100)": {"bets": 0, "wins": 0, "profit": 0}
-        }
+        return calculate_performance_stats(results)
 
-        for bet in bets:
-            conf = float(bet.get("max_confidence", 0))
-            tier = None
-
-            if 41 <= conf <= 60:
-                tier = "low (41-60)"
-            elif 61 <= conf <= 75:
-                tier = "medium (61-75)"
-            elif 76 <= conf <= 85:
-                tier = "high (76-85)"
-            elif 86 <= conf <= 100:
-                tier = "max (86-100)"
-
-            if tier:
-                by_confidence[tier]["bets"] += 1
-                if bet.get("outcome") == "win":
-                    by_confidence[tier]["wins"] += 1
-                by_confidence[tier]["profit"] += float(bet.get("unit_profit", 0))
-
-        # Calculate win rates for each tier
-        for tier in by_confidence:
-            bets_count = by_confidence[tier]["bets"]
-            if bets_count > 0:
-                by_confidence[tier]["win_rate"] = by_confidence[tier]["wins"] / bets_count * 100
-            else:
-                by_confidence[tier]["win_rate"] = 0
+    def data_version(self, kind: str) -> str:
+        """
+        Cheap token that changes whenever a log ("live_log" or "results") is written
 
-        return {
-            "total_bets": total_bets,
-            "wins": wins,
-            "losses": losses,
-            "pushes": pushes,
-            "win_rate": win_rate,
-            "total_units_wagered": total_units_wagered,
-            "total_unit_profit": total_unit_profit,
-            "roi": roi,
-            "by_confidence": by_confidence
-        }
+        Used by the API to key response caches without reading the file.
+        """
+        path = self.live_log_path if kind == "live_log" else self.results_path
+        try:
+            stat = os.stat(path)
+            return f"{stat.st_mtime_ns}-{stat.st_size}"
+        except FileNotFoundError:
+            return "missing"
+
+    def iter_rows(
+        self,
+        kind: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        game_id: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Stream the rows of a log ("live_log" or "results") as dicts
+
+        Args:
+            since: Only rows whose timestamp (live_log) or date (results) is >= this ISO string
+            until: Only rows whose timestamp/date is < this ISO string
+            game_id: Only rows of this game
+        """
+        self.flush()
+        path = self.live_log_path if kind == "live_log" else self.results_path
+        key_column, id_column = FILTER_COLUMNS[kind]
+
+        with open(path, 'r', newline='') as f:
+            reader = csv.reader(f)
+            headers = next(reader, [])
+            if not (since or until or game_id):
+                for values in reader:
+                    yield dict(zip(headers, values))
+                return
+
+            key_col = headers.index(key_column)
+            id_col = headers.index(id_column)
+
+            # Check the filter columns before building a dict for the row
+            for values in reader:
+                if len(values) <= max(key_col, id_col):
+                    continue
+                if game_id and values[id_col] != game_id:
+                    continue
+                key = values[key_col]
+                if (since and key < since) or (until and key >= until):
+                    continue
+                yield dict(zip(headers, values))
+
+    def iter_csv(self, kind: str) -> Iterator[str]:
+        """Stream a log as CSV text, for on-demand exports"""
+        self.flush()
+        path = self.live_log_path if kind == "live_log" else self.results_path
+        with open(path, 'r', newline='') as f:
+            while True:
+                chunk = f.read(64 * 1024)
+                if not chunk:
+                    break
+                yield chunk
 
 
 # Singleton instance
 _csv_logger = None
 
 def get_csv_logger() -> CSVLogger:
-    """Get singleton CSV logger instance"""
+    """
+    Get singleton log store instance
+
+    Returns a CSVLogger, or a SQLiteLogger (same interface) when
+    LOG_STORAGE_BACKEND is "sqlite".
+    """
     global _csv_logger
     if _csv_logger is None:
-        _csv_logger = CSVLogger()
+        if config.LOG_STORAGE_BACKEND == "sqlite":
+            from utils.sqlite_logger import SQLiteLogger
+            _csv_logger = SQLiteLogger()
+        else:
+            _csv_logger = CSVLogger()
     return _csv_logger
@@ -2,6 +2,7 @@
 Daily Performance Report Generator
 Analyzes betting performance and sends email summary
 """
+import io
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List
@@ -10,6 +11,7 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from loguru import logger
 import config
+from utils.csv_logger import get_csv_logger
 
 
 class DailyReportGenerator:
@@ -41,11 +43,14 @@ class DailyReportGenerator:
 
         try:
             # Load results data
-            if not self.results_file.exists():
+            if config.LOG_STORAGE_BACKEND == "sqlite":
+                csv_text = "".join(get_csv_logger().iter_csv("results"))
+                results_df = pd.read_csv(io.StringIO(csv_text))
+            elif not self.results_file.exists():
                 logger.warning(f"Results file not found: {self.results_file}")
                 return self._empty_analysis()
-
-            results_df = pd.read_csv(self.results_file)
+            else:
+                results_df = pd.read_csv(self.results_file)
 
             # Filter to yesterday's games
             results_df['date'] = pd.to_datetime(results_df['date'])
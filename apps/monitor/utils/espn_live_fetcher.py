@@ -2,11 +2,14 @@
 ESPN Live Game Fetcher
 Fetches live scores and game time directly from ESPN's unofficial scoreboard API
 """
+import asyncio
 import requests
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from loguru import logger
 
+from utils.http_client import get_async_http_client
+
 
 class ESPNLiveFetcher:
     """Fetches live game data from ESPN scoreboard API"""
@@ -51,26 +54,64 @@ class ESPNLiveFetcher:
             response = self.session.get(self.BASE_URL, params=params, timeout=10)
             response.raise_for_status()
 
+            return self._parse_live_events(response.json())
+
+        except Exception as e:
+            logger.error(f"Error fetching ESPN scoreboard: {e}")
+            return []
+
+    async def fetch_live_games_async(self) -> List[Dict]:
+        """
+        Async variant of fetch_live_games using the shared pooled HTTP client
+
+        Referee lookups for games not yet cached are fetched concurrently
+        before the events are parsed.
+
+        Returns:
+            Same list of game dicts as fetch_live_games
+        """
+        try:
+            params = {
+                'limit': 500,
+                'groups': 50
+            }
+
+            client = get_async_http_client()
+            response = await client.get(self.BASE_URL, params=params, timeout=10)
+            response.raise_for_status()
+
             data = response.json()
-            games = []
 
-            # Parse events
-            for event in data.get('events', []):
-                try:
-                    game = self._parse_game(event)
-                    if game:
-                        games.append(game)
-                except Exception as e:
-                    logger.warning(f"Error parsing ESPN game: {e}")
-                    continue
+            # Warm the referee cache so _parse_game never blocks on the network
+            uncached_ids = [
+                event.get('id') for event in data.get('events', [])
+                if event.get('id') and event.get('id') not in self.referee_cache
+            ]
+            if uncached_ids:
+                await asyncio.gather(*(self._fetch_referees_async(game_id) for game_id in uncached_ids))
 
-            logger.info(f"Fetched {len(games)} games from ESPN scoreboard")
-            return games
+            return self._parse_live_events(data)
 
         except Exception as e:
             logger.error(f"Error fetching ESPN scoreboard: {e}")
             return []
 
+    def _parse_live_events(self, data: Dict) -> List[Dict]:
+        """Parse all events from an ESPN scoreboard response"""
+        games = []
+
+        for event in data.get('events', []):
+            try:
+                game = self._parse_game(event)
+                if game:
+                    games.append(game)
+            except Exception as e:
+                logger.warning(f"Error parsing ESPN game: {e}")
+                continue
+
+        logger.info(f"Fetched {len(games)} games from ESPN scoreboard")
+        return games
+
     def fetch_scheduled_games(self, date: str = None, include_odds: bool = True) -> List[Dict]:
         """
         Fetch scheduled NCAA Division 1 basketball games with betting odds
@@ -112,26 +153,61 @@ class ESPNLiveFetcher:
             response = self.session.get(self.BASE_URL, params=params, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
-            games = []
+            return self._parse_scheduled_events(response.json(), date, include_odds)
 
-            # Parse events
-            for event in data.get('events', []):
-                try:
-                    game = self._parse_scheduled_game(event, include_odds)
-                    if game:
-                        games.append(game)
-                except Exception as e:
-                    logger.warning(f"Error parsing scheduled game: {e}")
-                    continue
+        except Exception as e:
+            logger.error(f"Error fetching scheduled games: {e}")
+            return []
+
+    async def fetch_scheduled_games_async(self, date: str = None, include_odds: bool = True) -> List[Dict]:
+        """
+        Async variant of fetch_scheduled_games using the shared pooled HTTP client
+
+        Args:
+            date: Date string in YYYYMMDD format (default: tomorrow)
+            include_odds: Whether to include betting odds data (default: True)
+
+        Returns:
+            Same list of game dicts as fetch_scheduled_games
+        """
+        try:
+            if date is None:
+                tomorrow = datetime.now() + timedelta(days=1)
+                date = tomorrow.strftime("%Y%m%d")
 
-            logger.info(f"Fetched {len(games)} scheduled games for {date}")
-            return games
+            params = {
+                'dates': date,
+                'limit': 500,
+                'groups': 50
+            }
+
+            logger.info(f"Fetching scheduled games for date: {date}")
+            client = get_async_http_client()
+            response = await client.get(self.BASE_URL, params=params, timeout=10)
+            response.raise_for_status()
+
+            return self._parse_scheduled_events(response.json(), date, include_odds)
 
         except Exception as e:
             logger.error(f"Error fetching scheduled games: {e}")
             return []
 
+    def _parse_scheduled_events(self, data: Dict, date: str, include_odds: bool) -> List[Dict]:
+        """Parse all scheduled events from an ESPN scoreboard response"""
+        games = []
+
+        for event in data.get('events', []):
+            try:
+                game = self._parse_scheduled_game(event, include_odds)
+                if game:
+                    games.append(game)
+            except Exception as e:
+                logger.warning(f"Error parsing scheduled game: {e}")
+                continue
+
+        logger.info(f"Fetched {len(games)} scheduled games for {date}")
+        return games
+
     def _parse_scheduled_game(self, event: Dict, include_odds: bool = True) -> Optional[Dict]:
         """Parse a single scheduled game event from ESPN API with odds"""
         try:
@@ -400,17 +476,7 @@ class ESPNLiveFetcher:
                 timeout=5
             )
             response.raise_for_status()
-            data = response.json()
-
-            # Extract referee names from gameInfo.officials
-            referees = []
-            if 'gameInfo' in data and 'officials' in data['gameInfo']:
-                officials = data['gameInfo']['officials']
-                referees = [
-                    official.get('displayName', '')
-                    for official in officials
-                    if official.get('displayName')
-                ]
+            referees = self._parse_referees(response.json())
 
             # Cache the result
             self.referee_cache[game_id] = referees
@@ -422,6 +488,37 @@ class ESPNLiveFetcher:
             self.referee_cache[game_id] = []
             return []
 
+    async def _fetch_referees_async(self, game_id: str) -> List[str]:
+        """Async variant of _fetch_referees using the shared pooled HTTP client"""
+        if game_id in self.referee_cache:
+            return self.referee_cache[game_id]
+
+        try:
+            client = get_async_http_client()
+            response = await client.get(self.SUMMARY_URL, params={'event': game_id}, timeout=5)
+            response.raise_for_status()
+            referees = self._parse_referees(response.json())
+
+            self.referee_cache[game_id] = referees
+            return referees
+
+        except Exception as e:
+            logger.debug(f"Could not fetch referees for game {game_id}: {e}")
+            self.referee_cache[game_id] = []
+            return []
+
+    def _parse_referees(self, data: Dict) -> List[str]:
+        """Extract referee names from gameInfo.officials in a summary response"""
+        referees = []
+        if 'gameInfo' in data and 'officials' in data['gameInfo']:
+            officials = data['gameInfo']['officials']
+            referees = [
+                official.get('displayName', '')
+                for official in officials
+                if official.get('displayName')
+            ]
+        return referees
+
     def get_game_by_teams(self, home_team: str, away_team: str, all_games: List[Dict]) -> Optional[Dict]:
         """
         Find a specific game by team names from a list of games
@@ -6,6 +6,8 @@ import requests
 from typing import Dict, Optional
 from loguru import logger
 
+from utils.http_client import get_async_http_client
+
 
 class ESPNOddsFetcher:
     """Fetches betting odds from ESPN game summary API"""
@@ -39,8 +41,36 @@ class ESPNOddsFetcher:
             response = self.session.get(self.SUMMARY_URL, params=params, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            return self._parse_game_odds(game_id, response.json())
+
+        except Exception as e:
+            logger.warning(f"Error fetching ESPN odds for game {game_id}: {e}")
+            return None
+
+    async def fetch_game_odds_async(self, game_id: str) -> Optional[Dict]:
+        """
+        Async variant of fetch_game_odds using the shared pooled HTTP client
+
+        Args:
+            game_id: ESPN game ID
+
+        Returns:
+            Same dict as fetch_game_odds, or None
+        """
+        try:
+            client = get_async_http_client()
+            response = await client.get(self.SUMMARY_URL, params={'event': game_id}, timeout=10)
+            response.raise_for_status()
+
+            return self._parse_game_odds(game_id, response.json())
 
+        except Exception as e:
+            logger.warning(f"Error fetching ESPN odds for game {game_id}: {e}")
+            return None
+
+    def _parse_game_odds(self, game_id: str, data: Dict) -> Optional[Dict]:
+        """Parse odds and team statistics out of an ESPN game summary response"""
+        try:
             # Extract odds from pickcenter
             pickcenter = data.get('pickcenter', [])
             if not pickcenter or len(pickcenter) == 0:
@@ -118,7 +148,7 @@ class ESPNOddsFetcher:
             return result
 
         except Exception as e:
-            logger.warning(f"Error fetching ESPN odds for game {game_id}: {e}")
+            logger.warning(f"Error parsing ESPN odds for game {game_id}: {e}")
             return None
 
     def _extract_team_stats(self, statistics: list) -> Dict:
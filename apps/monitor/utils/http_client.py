@@ -0,0 +1,55 @@
+"""
+Shared Async HTTP Client
+Pooled httpx client used by the async ESPN fetchers and the monitor poll loop
+"""
+import httpx
+from loguru import logger
+
+import config
+
+# HTTP/2 needs the optional h2 package (installed via httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+}
+
+
+# Singleton instance
+_async_http_client = None
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Get singleton pooled async HTTP client
+
+    Connections are kept alive between polls. Nearly all traffic goes to
+    site.api.espn.com, so the pool limit doubles as the per-host limit.
+    """
+    global _async_http_client
+    if _async_http_client is None or _async_http_client.is_closed:
+        limits = httpx.Limits(
+            max_connections=config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY
+        )
+        _async_http_client = httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            limits=limits,
+            timeout=httpx.Timeout(10.0),
+            http2=HTTP2_AVAILABLE
+        )
+        logger.debug(f"Created pooled async HTTP client (http2={HTTP2_AVAILABLE}, "
+                     f"max_connections={config.HTTP_MAX_CONNECTIONS})")
+    return _async_http_client
+
+
+async def close_async_http_client():
+    """Close the shared async HTTP client (call on shutdown)"""
+    global _async_http_client
+    if _async_http_client is not None and not _async_http_client.is_closed:
+        await _async_http_client.aclose()
+    _async_http_client = None
@@ -2,13 +2,13 @@
 PPM Threshold Analysis System
 Analyzes performance at different PPM trigger thresholds to optimize the model
 """
-import csv
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 from collections import defaultdict
 from loguru import logger
 import config
+from utils.csv_logger import get_csv_logger
 
 
 class PPMAnalyzer:
@@ -25,6 +25,7 @@ class PPMAnalyzer:
     def __init__(self):
         self.live_log_path = config.LIVE_LOG_FILE
         self.results_path = config.RESULTS_FILE
+        self.log_store = get_csv_logger()  # CSV or SQLite, per LOG_STORAGE_BACKEND
 
         # PPM thresholds to analyze (0.5 to 10.0 in 0.1 increments)
         self.ppm_buckets = [round(x * 0.1, 1) for x in range(5, 101)]  # 0.5 to 10.0
@@ -210,18 +211,19 @@ class PPMAnalyzer:
         if date is None:
             date = datetime.now()
 
-        # Get all logs for this date
+        # Get all logs for this date (the log store filters on its timestamp column)
+        day = date.date()
         logs = []
         try:
-            with open(self.live_log_path, 'r') as f:
-                reader = csv.DictReader(f)
-                for log in reader:
-                    try:
-                        log_date = datetime.fromisoformat(log['timestamp']).date()
-                        if log_date == date.date():
-                            logs.append(log)
-                    except:
-                        continue
+            for log in self.log_store.iter_rows(
+                "live_log", since=day.isoformat(), until=(day + timedelta(days=1)).isoformat()
+            ):
+                try:
+                    log_date = datetime.fromisoformat(log['timestamp']).date()
+                    if log_date == date.date():
+                        logs.append(log)
+                except:
+                    continue
         except FileNotFoundError:
             logger.warning(f"Live log file not found: {self.live_log_path}")
             return {}
@@ -349,15 +351,14 @@ class PPMAnalyzer:
         """Load all logs since cutoff date"""
         logs = []
         try:
-            with open(self.live_log_path, 'r') as f:
-                reader = csv.DictReader(f)
-                for log in reader:
-                    try:
-                        log_date = datetime.fromisoformat(log['timestamp'])
-                        if log_date >= cutoff_date:
-                            logs.append(log)
-                    except:
-                        continue
+            # Day-level range in the log store, exact cutoff below
+            for log in self.log_store.iter_rows("live_log", since=cutoff_date.date().isoformat()):
+                try:
+                    log_date = datetime.fromisoformat(log['timestamp'])
+                    if log_date >= cutoff_date:
+                        logs.append(log)
+                except:
+                    continue
         except FileNotFoundError:
             logger.warning(f"Live log file not found: {self.live_log_path}")
 
@@ -367,15 +368,13 @@ class PPMAnalyzer:
         """Load all results since cutoff date"""
         results = []
         try:
-            with open(self.results_path, 'r') as f:
-                reader = csv.DictReader(f)
-                for result in reader:
-                    try:
-                        result_date = datetime.fromisoformat(result['date'])
-                        if result_date >= cutoff_date:
-                            results.append(result)
-                    except:
-                        continue
+            for result in self.log_store.iter_rows("results", since=cutoff_date.date().isoformat()):
+                try:
+                    result_date = datetime.fromisoformat(result['date'])
+                    if result_date >= cutoff_date:
+                        results.append(result)
+                except:
+                    continue
         except FileNotFoundError:
             logger.warning(f"Results file not found: {self.results_path}")
 
@@ -7,11 +7,29 @@ Loads referee data from RefMetrics CSV and provides methods to:
 - Analyze referee tendencies for live games
 """
 
+import re
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from loguru import logger
 
+# Max distinct crews whose aggregate stats are memoized
+CREW_CACHE_SIZE = 4096
+
+
+def normalize_referee_name(name: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace ("John D.  Smith" -> "john d smith")"""
+    return " ".join(re.sub(r"[.,]", " ", str(name)).lower().split())
+
+
+def strip_middle_initials(normalized_name: str) -> str:
+    """Drop single-letter middle tokens from a normalized name ("john d smith" -> "john smith")"""
+    tokens = normalized_name.split()
+    if len(tokens) <= 2:
+        return normalized_name
+    middle = [t for t in tokens[1:-1] if len(t) > 1]
+    return " ".join([tokens[0], *middle, tokens[-1]])
+
 
 class RefereeStatsManager:
     """Manages referee statistics from RefMetrics data"""
@@ -32,6 +50,13 @@ class RefereeStatsManager:
         self.stats_cache: Dict[str, Dict] = {}
         self.last_loaded = None
 
+        # Normalized name / middle-initial alias -> stats_cache key, built at load time
+        self._name_index: Dict[str, str] = {}
+        # Lookup results (including misses) for names that needed the fallback scan
+        self._lookup_cache: Dict[str, Optional[str]] = {}
+        # Crew aggregates keyed by the sorted crew tuple
+        self._crew_cache: Dict[Tuple[str, ...], Dict] = {}
+
         # Load stats on init
         self._load_stats()
 
@@ -62,12 +87,43 @@ class RefereeStatsManager:
                     'profile_url': row['profile_url']
                 }
 
+            self._build_name_index()
+
             self.last_loaded = pd.Timestamp.now()
             logger.success(f"Cached stats for {len(self.stats_cache)} referees")
 
         except Exception as e:
             logger.error(f"Error loading referee stats: {e}")
 
+    def _build_name_index(self):
+        """
+        Index every referee by normalized name and by name without middle initials
+
+        Aliases shared by two different referees are left out so a lookup
+        never silently picks the wrong one.
+        """
+        index = {}
+        aliases = {}
+        ambiguous = set()
+
+        for name in self.stats_cache:
+            normalized = normalize_referee_name(name)
+            index.setdefault(normalized, name)
+
+            alias = strip_middle_initials(normalized)
+            if alias != normalized:
+                if alias in aliases and aliases[alias] != name:
+                    ambiguous.add(alias)
+                aliases[alias] = name
+
+        for alias, name in aliases.items():
+            if alias not in ambiguous:
+                index.setdefault(alias, name)
+
+        self._name_index = index
+        self._lookup_cache = {}
+        self._crew_cache = {}
+
     def get_referee_stats(self, referee_name: str) -> Optional[Dict]:
         """
         Get stats for a specific referee
@@ -82,18 +138,29 @@ class RefereeStatsManager:
         if referee_name in self.stats_cache:
             return self.stats_cache[referee_name]
 
-        # Try case-insensitive match
-        referee_lower = referee_name.lower()
-        for name, stats in self.stats_cache.items():
-            if name.lower() == referee_lower:
-                return stats
-
-        # Try partial match (e.g., "John Smith" matches "John D. Smith")
-        for name, stats in self.stats_cache.items():
-            if referee_lower in name.lower() or name.lower() in referee_lower:
-                return stats
-
-        logger.debug(f"No stats found for referee: {referee_name}")
+        # Normalized name, then with middle initials dropped on either side
+        # (e.g., "John Smith" matches "John D. Smith" and vice versa)
+        normalized = normalize_referee_name(referee_name)
+        key = self._name_index.get(normalized) or self._name_index.get(strip_middle_initials(normalized))
+        if key is not None:
+            return self.stats_cache[key]
+
+        # Partial match as a last resort; remembered so each unknown name is scanned once
+        if normalized not in self._lookup_cache:
+            self._lookup_cache[normalized] = self._find_partial_match(normalized)
+            if self._lookup_cache[normalized] is None:
+                logger.debug(f"No stats found for referee: {referee_name}")
+
+        key = self._lookup_cache[normalized]
+        return self.stats_cache[key] if key is not None else None
+
+    def _find_partial_match(self, normalized: str) -> Optional[str]:
+        """Key of the first referee whose normalized name contains, or is contained in, the given one"""
+        if not normalized:
+            return None
+        for indexed_name, name in self._name_index.items():
+            if normalized in indexed_name or indexed_name in normalized:
+                return name
         return None
 
     def get_crew_stats(self, referee_names: List[str]) -> Dict:
@@ -106,6 +173,27 @@ class RefereeStatsManager:
         Returns:
             Dictionary with crew aggregate stats
         """
+        # Same crew in any order shares one cache entry
+        crew = tuple(sorted(referee_names))
+
+        cached = self._crew_cache.get(crew)
+        if cached is None:
+            cached = self._calculate_crew_stats(crew)
+            if len(self._crew_cache) >= CREW_CACHE_SIZE:
+                self._crew_cache.clear()
+            self._crew_cache[crew] = cached
+
+        # Copy so callers can annotate the result without touching the cache
+        result = dict(cached)
+        if 'referees' in result:
+            # Per-referee stats in the caller's order, not the sorted key's
+            result['referees'] = [
+                dict(stats) for stats in map(self.get_referee_stats, referee_names) if stats
+            ]
+        return result
+
+    def _calculate_crew_stats(self, referee_names: Tuple[str, ...]) -> Dict:
+        """Aggregate stats for a crew (uncached)"""
         crew_stats = []
         found_refs = []
 
@@ -0,0 +1,464 @@
+"""
+SQLite Logging Backend
+Stores live game polls and end-of-game results in an embedded SQLite
+database (WAL mode) with the same interface as CSVLogger
+"""
+import atexit
+import csv
+import io
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+from loguru import logger
+import config
+from utils.csv_logger import (
+    LIVE_LOG_HEADERS,
+    RESULTS_HEADERS,
+    build_live_log_row,
+    build_result_row,
+    calculate_performance_stats,
+)
+
+# Rows per executemany() batch when importing existing CSV logs
+IMPORT_BATCH_SIZE = 5000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS live_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    game_id TEXT,
+    timestamp TEXT,
+    row TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_live_log_game_ts ON live_log (game_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_live_log_ts ON live_log (timestamp);
+
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    game_id TEXT,
+    date TEXT,
+    row TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_date ON results (date);
+
+-- Latest live log timestamp per game, for paging games newest-first
+CREATE TABLE IF NOT EXISTS game_index (
+    game_id TEXT PRIMARY KEY,
+    ended TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_game_index_ended ON game_index (ended, game_id);
+"""
+
+UPSERT_GAME_INDEX = """
+INSERT INTO game_index (game_id, ended) VALUES (?, ?)
+ON CONFLICT (game_id) DO UPDATE SET ended = MAX(ended, excluded.ended)
+"""
+
+# Table and CSV headers for each log kind
+LOG_KINDS = {
+    "live_log": ("live_log", LIVE_LOG_HEADERS),
+    "results": ("results", RESULTS_HEADERS),
+}
+
+
+def _row_to_json(headers: List[str], values: list) -> str:
+    """Serialize a row as {header: value} with CSV string semantics"""
+    return json.dumps({h: "" if v is None else str(v) for h, v in zip(headers, values)})
+
+
+class SQLiteLogger:
+    """
+    Logs live polls and game results to SQLite
+
+    Drop-in replacement for CSVLogger. WAL mode lets the API process read
+    while the monitor writes; live poll rows are buffered in memory and
+    written in one transaction per poll cycle via flush().
+    """
+
+    def __init__(self):
+        self.db_path = config.SQLITE_DB_FILE
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection per thread (FastAPI runs sync handlers in a threadpool)
+        self._local = threading.local()
+
+        # Live poll rows waiting for the next flush
+        self._pending_live = []
+        self._pending_since = 0.0
+        self._pending_lock = threading.Lock()
+        self.flush_interval = getattr(config, 'LIVE_LOG_FLUSH_INTERVAL', 5)
+        self.flush_max_rows = getattr(config, 'LIVE_LOG_FLUSH_MAX_ROWS', 500)
+
+        self._init_db()
+        self._import_csv_logs()
+        self._build_game_index()
+
+        atexit.register(self.flush)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's database connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=config.SQLITE_BUSY_TIMEOUT,
+                isolation_level=None  # Explicit BEGIN/COMMIT below
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self):
+        """Create tables and indexes if they don't exist"""
+        self._connect().executescript(SCHEMA)
+        logger.info(f"Initialized SQLite log store: {self.db_path}")
+
+    def _import_csv_logs(self):
+        """One-time import of existing CSV logs into an empty database"""
+        sources = {
+            "live_log": config.LIVE_LOG_FILE,
+            "results": config.RESULTS_FILE,
+        }
+        conn = self._connect()
+
+        for kind, path in sources.items():
+            table, _ = LOG_KINDS[kind]
+            if not path.exists():
+                continue
+
+            try:
+                # IMMEDIATE takes the write lock so two processes can't both import
+                conn.execute("BEGIN IMMEDIATE")
+                if conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone():
+                    conn.execute("COMMIT")
+                    continue
+
+                count = 0
+                with open(path, 'r', newline='') as f:
+                    reader = csv.reader(f)
+                    headers = next(reader, [])
+                    batch = []
+                    for values in reader:
+                        if not values:
+                            continue
+                        batch.append(self._import_params(kind, headers, values))
+                        if len(batch) >= IMPORT_BATCH_SIZE:
+                            self._insert(conn, table, batch)
+                            count += len(batch)
+                            batch = []
+                    if batch:
+                        self._insert(conn, table, batch)
+                        count += len(batch)
+
+                conn.execute("COMMIT")
+                if count:
+                    logger.info(f"Imported {count} rows from {path} into {table}")
+
+            except Exception as e:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                logger.error(f"Error importing {path} into SQLite: {e}")
+
+    def _build_game_index(self):
+        """Populate the game index from live_log if it is empty (new or pre-index database)"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            if not conn.execute("SELECT 1 FROM game_index LIMIT 1").fetchone():
+                conn.execute(
+                    "INSERT INTO game_index (game_id, ended) "
+                    "SELECT game_id, MAX(timestamp) FROM live_log "
+                    "WHERE game_id != '' GROUP BY game_id"
+                )
+            conn.execute("COMMIT")
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.error(f"Error building game index: {e}")
+
+    @staticmethod
+    def _import_params(kind: str, headers: List[str], values: list) -> tuple:
+        """Build insert parameters for a row read back from a CSV log"""
+        row = dict(zip(headers, values))
+        if kind == "live_log":
+            return (row.get("Game ID", ""), row.get("Timestamp", ""), json.dumps(row))
+        return (row.get("game_id", ""), row.get("date", ""), json.dumps(row))
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, table: str, params: List[tuple]):
+        """Insert (game_id, timestamp/date, row) tuples"""
+        key_column = "timestamp" if table == "live_log" else "date"
+        conn.executemany(
+            f"INSERT INTO {table} (game_id, {key_column}, row) VALUES (?, ?, ?)",
+            params
+        )
+
+    def log_live_poll(self, game_data: Dict):
+        """
+        Queue a live game poll for the next flush
+
+        Args:
+            game_data: Same fields as CSVLogger.log_live_poll
+        """
+        try:
+            row = build_live_log_row(game_data)
+            params = (
+                str(game_data.get("game_id") or ""),
+                str(game_data.get("timestamp") or ""),
+                _row_to_json(LIVE_LOG_HEADERS, row)
+            )
+            with self._pending_lock:
+                if not self._pending_live:
+                    self._pending_since = time.monotonic()
+                self._pending_live.append(params)
+                overdue = (
+                    len(self._pending_live) >= self.flush_max_rows
+                    or time.monotonic() - self._pending_since >= self.flush_interval
+                )
+
+            logger.debug(f"Queued poll for game {game_data.get('game_id')}")
+
+            if overdue:
+                self.flush()
+
+        except Exception as e:
+            logger.error(f"Error logging live poll: {e}")
+
+    def flush(self):
+        """Write all queued live poll rows in a single transaction"""
+        with self._pending_lock:
+            if not self._pending_live:
+                return
+            batch = self._pending_live
+            self._pending_live = []
+
+        conn = self._connect()
+        try:
+            # Latest timestamp per game in this batch
+            ended = {}
+            for game_id, timestamp, _ in batch:
+                if game_id and timestamp > ended.get(game_id, ""):
+                    ended[game_id] = timestamp
+
+            conn.execute("BEGIN")
+            self._insert(conn, "live_log", batch)
+            conn.executemany(UPSERT_GAME_INDEX, list(ended.items()))
+            conn.execute("COMMIT")
+            logger.debug(f"Flushed {len(batch)} live poll rows to SQLite")
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.error(f"Error flushing live polls to SQLite: {e}")
+            # Put the rows back so the next flush retries them
+            with self._pending_lock:
+                self._pending_live = batch + self._pending_live
+
+    def log_game_result(self, result_data: Dict):
+        """
+        Log final game result
+
+        Args:
+            result_data: Same fields as CSVLogger.log_game_result
+        """
+        try:
+            row = build_result_row(result_data)
+            params = (
+                str(result_data.get("game_id") or ""),
+                str(result_data.get("date") or ""),
+                _row_to_json(RESULTS_HEADERS, row)
+            )
+            self._insert(self._connect(), "results", [params])
+
+            logger.info(f"Logged game result: {result_data.get('game_id')}")
+
+        except Exception as e:
+            logger.error(f"Error logging game result: {e}")
+
+    def get_recent_logs(self, limit: int = 100) -> list:
+        """Get recent live log entries (oldest first)"""
+        try:
+            if limit <= 0:
+                return []
+
+            self.flush()
+            rows = self._connect().execute(
+                "SELECT row FROM live_log ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+            return [json.loads(r[0]) for r in reversed(rows)]
+
+        except Exception as e:
+            logger.error(f"Error reading live logs: {e}")
+            return []
+
+    def prepare_game_histories(self, game_ids: List[str]):
+        """No-op: history is read through the game_id index"""
+
+    def get_game_history(self, game_id: str) -> List[Dict]:
+        """Get every live log row for a single game (oldest first)"""
+        try:
+            self.flush()
+            rows = self._connect().execute(
+                "SELECT row FROM live_log WHERE game_id = ? ORDER BY timestamp, id",
+                (str(game_id),)
+            ).fetchall()
+            return [json.loads(r[0]) for r in rows]
+
+        except Exception as e:
+            logger.error(f"Error reading history for game {game_id}: {e}")
+            return []
+
+    def get_games_by_end_time(
+        self,
+        limit: int,
+        before: Optional[Tuple[str, str]] = None
+    ) -> List[Tuple[str, str]]:
+        """
+        Page through games newest-first by the time of their last live log row
+
+        Args:
+            limit: Max games to return
+            before: Only games ordered strictly after this (end timestamp, game_id)
+                cursor, i.e. the last entry of the previous page
+
+        Returns:
+            [(end timestamp, game_id), ...] newest first
+        """
+        try:
+            self.flush()
+            conn = self._connect()
+            if before is None:
+                rows = conn.execute(
+                    "SELECT ended, game_id FROM game_index "
+                    "ORDER BY ended DESC, game_id DESC LIMIT ?",
+                    (limit,)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT ended, game_id FROM game_index WHERE (ended, game_id) < (?, ?) "
+                    "ORDER BY ended DESC, game_id DESC LIMIT ?",
+                    (before[0], before[1], limit)
+                ).fetchall()
+            return [tuple(row) for row in rows]
+
+        except Exception as e:
+            logger.error(f"Error reading game index: {e}")
+            return []
+
+    def get_results(self, limit: Optional[int] = None) -> list:
+        """Get game results"""
+        try:
+            conn = self._connect()
+            if limit:
+                rows = conn.execute(
+                    "SELECT row FROM results ORDER BY id DESC LIMIT ?", (limit,)
+                ).fetchall()
+                rows.reverse()
+            else:
+                rows = conn.execute("SELECT row FROM results ORDER BY id").fetchall()
+            return [json.loads(r[0]) for r in rows]
+
+        except Exception as e:
+            logger.error(f"Error reading results: {e}")
+            return []
+
+    def get_performance_stats(self, date_filter: str = None) -> Dict:
+        """
+        Calculate performance statistics from results
+
+        Args:
+            date_filter: Optional date string (YYYY-MM-DD) to filter results. If None, returns all-time stats.
+
+        Returns:
+            Dict with win rates, ROI, etc.
+        """
+        if date_filter:
+            try:
+                rows = self._connect().execute(
+                    "SELECT row FROM results WHERE date LIKE ? ORDER BY id",
+                    (f"{date_filter}%",)
+                ).fetchall()
+                results = [json.loads(r[0]) for r in rows]
+            except Exception as e:
+                logger.error(f"Error reading results: {e}")
+                results = []
+        else:
+            results = self.get_results()
+
+        return calculate_performance_stats(results)
+
+    def data_version(self, kind: str) -> str:
+        """
+        Cheap token that changes whenever a log ("live_log" or "results") is written
+
+        Both tables are append-only, so the highest row id identifies the data.
+        """
+        table, _ = LOG_KINDS[kind]
+        try:
+            (max_id,) = self._connect().execute(f"SELECT MAX(id) FROM {table}").fetchone()
+        except Exception as e:
+            logger.error(f"Error reading {table} version: {e}")
+            return "error"
+
+        pending = len(self._pending_live) if kind == "live_log" else 0
+        return f"{max_id or 0}-{pending}"
+
+    def iter_rows(
+        self,
+        kind: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        game_id: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Stream the rows of a log ("live_log" or "results") as dicts
+
+        Args:
+            since: Only rows whose timestamp (live_log) or date (results) is >= this ISO string
+            until: Only rows whose timestamp/date is < this ISO string
+            game_id: Only rows of this game
+
+        Filters run as WHERE clauses on the indexed columns.
+        """
+        table, _ = LOG_KINDS[kind]
+        key_column = "timestamp" if kind == "live_log" else "date"
+        if kind == "live_log":
+            self.flush()
+
+        clauses, params = [], []
+        if since:
+            clauses.append(f"{key_column} >= ?")
+            params.append(since)
+        if until:
+            clauses.append(f"{key_column} < ?")
+            params.append(until)
+        if game_id:
+            clauses.append("game_id = ?")
+            params.append(str(game_id))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        # Dedicated connection so a long read doesn't hold this thread's cursor
+        conn = sqlite3.connect(self.db_path, timeout=config.SQLITE_BUSY_TIMEOUT)
+        try:
+            for (row,) in conn.execute(f"SELECT row FROM {table}{where} ORDER BY id", params):
+                yield json.loads(row)
+        finally:
+            conn.close()
+
+    def iter_csv(self, kind: str) -> Iterator[str]:
+        """Stream a log as CSV text (header first), for on-demand exports"""
+        _, headers = LOG_KINDS[kind]
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        writer.writerow(headers)
+        for row in self.iter_rows(kind):
+            writer.writerow([row.get(h, "") for h in headers])
+            if buffer.tell() >= 64 * 1024:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue()
@@ -0,0 +1,168 @@
+"""
+Team Stats Snapshot Cache
+Persists each stats fetcher's latest DataFrame to config.CACHE_DIR with an
+explicit column schema, as uncompressed Feather (Arrow IPC) so it loads via
+a memory map without CSV parsing or dtype inference. Falls back to CSV when
+pyarrow isn't installed. Fetchers whose stats are read outside Python can
+also keep a CSV export next to the snapshot.
+"""
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+import pandas as pd
+from loguru import logger
+import config
+
+# Optional Arrow support for binary snapshots
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Column types a schema may use
+COLUMN_TYPES = ("string", "float64", "int64")
+
+
+class StatsSnapshotCache:
+    """
+    Latest stats snapshot for one fetcher, at a fixed path
+
+    Cold start reads one known file (no directory scan) and ignores it once
+    it is older than STATS_SNAPSHOT_MAX_AGE_DAYS. Each save prunes the
+    snapshots it supersedes, including the dated CSVs earlier versions wrote.
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        schema: Dict[str, str],
+        cache_dir: Optional[Path] = None,
+        csv_export: bool = False
+    ):
+        """
+        Args:
+            prefix: File name prefix ("espn", "kenpom", "nba")
+            schema: Column -> "string" / "float64" / "int64"; other columns are stored as strings
+            cache_dir: Directory for snapshots (default: config.CACHE_DIR)
+            csv_export: Also write {prefix}_stats_latest.csv on every save, for
+                readers of the old dated {prefix}_stats_*.csv files
+        """
+        self.prefix = prefix
+        self.schema = schema
+        self.cache_dir = Path(cache_dir or config.CACHE_DIR)
+        self.max_age_days = getattr(config, 'STATS_SNAPSHOT_MAX_AGE_DAYS', 14)
+        self.saved_at: Optional[datetime] = None  # When the last saved/loaded snapshot was written
+
+        extension = "feather" if PYARROW_AVAILABLE else "csv"
+        self.path = self.cache_dir / f"{prefix}_stats.{extension}"
+        # Matches the {prefix}_stats_*.csv pattern and sorts after the dated names
+        self.export_path = self.cache_dir / f"{prefix}_stats_latest.csv" if csv_export else None
+
+    def _apply_schema(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cast every column to its declared type"""
+        typed = {}
+        for column in df.columns:
+            kind = self.schema.get(column, "string")
+            if kind == "float64":
+                typed[column] = pd.to_numeric(df[column], errors="coerce").astype("float64")
+            elif kind == "int64":
+                typed[column] = pd.to_numeric(df[column], errors="coerce").fillna(0).astype("int64")
+            else:
+                typed[column] = df[column].astype("string")
+        return pd.DataFrame(typed)
+
+    def save(self, df: pd.DataFrame):
+        """Write the snapshot (atomically) and prune stale ones"""
+        try:
+            typed = self._apply_schema(df.reset_index(drop=True))
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+
+            if PYARROW_AVAILABLE:
+                arrow_types = {"string": pa.string(), "float64": pa.float64(), "int64": pa.int64()}
+                arrow_schema = pa.schema([
+                    (column, arrow_types[self.schema.get(column, "string")]) for column in typed.columns
+                ])
+                table = pa.Table.from_pandas(typed, schema=arrow_schema, preserve_index=False)
+                # Uncompressed so loads can memory-map the file
+                feather.write_feather(table, tmp_path, compression="uncompressed")
+            else:
+                typed.to_csv(tmp_path, index=False)
+
+            os.replace(tmp_path, self.path)
+            self.saved_at = datetime.now()
+            logger.info(f"Saved {self.prefix} stats snapshot to {self.path}")
+
+            if self.export_path is not None:
+                tmp_export = self.export_path.with_name(self.export_path.name + ".tmp")
+                typed.to_csv(tmp_export, index=False)
+                os.replace(tmp_export, self.export_path)
+
+        except Exception as e:
+            logger.error(f"Error saving {self.prefix} stats snapshot: {e}")
+            return
+
+        self.prune()
+
+    def load(self) -> Optional[pd.DataFrame]:
+        """Load the latest snapshot, or None if there is none that isn't stale"""
+        try:
+            if not self.path.exists():
+                return self._load_legacy_csv()
+
+            if self._is_stale(self.path):
+                logger.info(f"Ignoring stale {self.prefix} stats snapshot: {self.path}")
+                return None
+
+            if PYARROW_AVAILABLE:
+                df = feather.read_table(self.path, memory_map=True).to_pandas()
+            else:
+                dtypes = {c: k for c, k in self.schema.items() if k in COLUMN_TYPES}
+                df = pd.read_csv(self.path, dtype=dtypes)
+
+            self.saved_at = datetime.fromtimestamp(self.path.stat().st_mtime)
+            logger.info(f"Loaded {self.prefix} stats snapshot: {self.path}")
+            return df
+
+        except Exception as e:
+            logger.error(f"Error loading {self.prefix} stats snapshot: {e}")
+            return None
+
+    def _load_legacy_csv(self) -> Optional[pd.DataFrame]:
+        """Newest dated CSV written before snapshots existed (one-time migration)"""
+        legacy = sorted(self.cache_dir.glob(f"{self.prefix}_stats_*.csv"), reverse=True)
+        legacy = [p for p in legacy if not self._is_stale(p)]
+        if not legacy:
+            return None
+
+        logger.info(f"Loading {self.prefix} stats from legacy backup: {legacy[0]}")
+        df = self._apply_schema(pd.read_csv(legacy[0]))
+        self.saved_at = datetime.fromtimestamp(legacy[0].stat().st_mtime)
+        return df
+
+    def prune(self):
+        """Delete snapshots superseded by self.path (dated legacy CSVs, other-format snapshot), keeping the CSV export"""
+        candidates = list(self.cache_dir.glob(f"{self.prefix}_stats_*.csv"))
+        candidates += [
+            self.cache_dir / f"{self.prefix}_stats.{ext}" for ext in ("feather", "csv")
+        ]
+
+        removed = 0
+        for path in candidates:
+            if path in (self.path, self.export_path) or not path.exists():
+                continue
+            try:
+                path.unlink()
+                removed += 1
+            except OSError as e:
+                logger.warning(f"Could not remove old snapshot {path}: {e}")
+
+        if removed:
+            logger.info(f"Pruned {removed} old {self.prefix} stats snapshots")
+
+    def _is_stale(self, path: Path) -> bool:
+        """Whether a file is older than max_age_days"""
+        return time.time() - path.stat().st_mtime > self.max_age_days * 86400
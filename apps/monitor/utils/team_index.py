@@ -0,0 +1,113 @@
+"""
+Team Lookup Index
+Maps team names (exact, lowercase, normalized, and every known alias from
+the team name matcher) to precomputed metric dicts, so stats fetchers can
+answer get_team_metrics with a dict lookup instead of scanning a DataFrame
+"""
+from typing import Callable, Dict, List, Optional, Tuple
+import pandas as pd
+from loguru import logger
+from utils.team_name_matcher import get_team_matcher
+
+
+class TeamIndex:
+    """
+    Name -> metrics index over one stats_cache DataFrame
+
+    Built once whenever a fetcher's stats_cache is replaced. Lookups try the
+    exact name, lowercase name, normalized name and aliases, then fall back
+    to the old substring match (remembered per name, so it runs once).
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        name_column: str,
+        build_metrics: Callable[[Dict], Dict]
+    ):
+        """
+        Args:
+            df: Stats DataFrame, one row per team
+            name_column: Column holding the team name
+            build_metrics: Turns a row (as a dict) into the fetcher's metrics dict
+        """
+        self.matcher = get_team_matcher()
+        self._by_name: Dict[str, Dict] = {}
+        self._rows: List[Tuple[str, Dict]] = []  # (lowercase name, metrics) in row order
+        self._partial_cache: Dict[str, Optional[Dict]] = {}
+
+        normalized_names: Dict[str, Dict] = {}
+        ambiguous = set()
+
+        for row in df.to_dict("records"):
+            name = row.get(name_column)
+            if not isinstance(name, str):
+                continue
+            try:
+                metrics = build_metrics(row)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"Skipping team {name} in lookup index: {e}")
+                continue
+
+            self._rows.append((name.lower(), metrics))
+            self._by_name.setdefault(name, metrics)
+            self._by_name.setdefault(name.lower(), metrics)
+
+            # Normalized names can collide ("Miami (FL)" / "Miami (OH)") - leave those out
+            normalized = self.matcher.normalize_name(name)
+            if normalized in normalized_names and normalized_names[normalized] is not metrics:
+                ambiguous.add(normalized)
+            normalized_names.setdefault(normalized, metrics)
+
+        for normalized, metrics in normalized_names.items():
+            if normalized and normalized not in ambiguous:
+                self._by_name.setdefault(normalized, metrics)
+
+        self._add_aliases()
+
+    def _add_aliases(self):
+        """Index Odds API names and saved name variations that resolve to an indexed team"""
+        # Odds API name (lowercase) -> ESPN name
+        for alias, target in self.matcher.odds_espn_map.items():
+            metrics = self._by_name.get(target) or self._by_name.get(target.lower())
+            if metrics is not None:
+                self._by_name.setdefault(alias, metrics)
+
+        # Canonical name -> known variations (raw and normalized)
+        for canonical, variations in self.matcher.mappings.items():
+            names = [canonical, *variations]
+            metrics = next((self._by_name[n] for n in names if n in self._by_name), None)
+            if metrics is None:
+                continue
+            for name in names:
+                self._by_name.setdefault(name, metrics)
+                self._by_name.setdefault(name.lower(), metrics)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def lookup(self, team_name: str) -> Optional[Dict]:
+        """
+        Metrics for a team, or None if not found
+
+        Returns the shared precomputed dict - copy it before modifying.
+        """
+        if not team_name:
+            return None
+
+        metrics = self._by_name.get(team_name)
+        if metrics is not None:
+            return metrics
+
+        team_lower = team_name.lower()
+        metrics = self._by_name.get(team_lower) or self._by_name.get(self.matcher.normalize_name(team_name))
+        if metrics is not None:
+            return metrics
+
+        # Partial match (contains), e.g. "Lakers" vs "Los Angeles Lakers"
+        if team_lower not in self._partial_cache:
+            self._partial_cache[team_lower] = next(
+                (m for name, m in self._rows if team_lower in name or name in team_lower),
+                None
+            )
+        return self._partial_cache[team_lower]
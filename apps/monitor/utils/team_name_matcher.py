@@ -2,12 +2,24 @@
 NCAA Team Name Matching System
 Handles name variations across ESPN, The Odds API, and KenPom
 """
-from typing import Optional, Dict, Set
+from typing import Optional, Dict, Set, List
+from functools import lru_cache
 from fuzzywuzzy import fuzz
 from loguru import logger
+import numpy as np
 import json
 from pathlib import Path
 
+# rapidfuzz gives vectorized, multi-core scoring for match_many (optional)
+try:
+    from rapidfuzz import process as rf_process, fuzz as rf_fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Max entries per memoization cache (names and name pairs seen in a process)
+MATCH_CACHE_SIZE = 8192
+
 
 class TeamNameMatcher:
     """
@@ -71,6 +83,14 @@ class TeamNameMatcher:
             "hoosiers", "terrapins", "nittany lions", "scarlet knights"
         }
 
+        # Qualifier words that indicate different teams ("Michigan" vs "Michigan State")
+        self.qualifiers = ["state", "tech", "christian", "methodist", "wesleyan"]
+
+        # Memoized lookups - results only change when the mapping set changes
+        self._normalize_cached = lru_cache(maxsize=MATCH_CACHE_SIZE)(self._normalize_name)
+        self._canonical_cached = lru_cache(maxsize=MATCH_CACHE_SIZE)(self._get_canonical_name)
+        self._match_cached = lru_cache(maxsize=MATCH_CACHE_SIZE)(self._match_teams)
+
     def _load_mappings(self) -> Dict[str, Set[str]]:
         """Load team name mappings from JSON file"""
         if self.mappings_file.exists():
@@ -122,6 +142,9 @@ class TeamNameMatcher:
 
     def _save_mappings(self):
         """Save team name mappings to JSON file"""
+        # Mappings changed - cached canonical names and verdicts may be stale
+        self.invalidate_caches()
+
         try:
             self.mappings_file.parent.mkdir(parents=True, exist_ok=True)
             # Convert sets to lists for JSON serialization
@@ -132,6 +155,31 @@ class TeamNameMatcher:
         except Exception as e:
             logger.error(f"Error saving team mappings: {e}")
 
+    def invalidate_caches(self):
+        """Clear memoized canonical names and match verdicts"""
+        self._canonical_cached.cache_clear()
+        self._match_cached.cache_clear()
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get hit/miss counters for the memoization caches
+
+        Returns:
+            Dict mapping cache name to hits, misses, size and maxsize
+        """
+        stats = {}
+        for name, cached in (("normalize", self._normalize_cached),
+                             ("canonical", self._canonical_cached),
+                             ("match", self._match_cached)):
+            info = cached.cache_info()
+            stats[name] = {
+                "hits": info.hits,
+                "misses": info.misses,
+                "size": info.currsize,
+                "maxsize": info.maxsize
+            }
+        return stats
+
     def normalize_name(self, team_name: str) -> str:
         """
         Normalize team name for comparison
@@ -142,6 +190,10 @@ class TeamNameMatcher:
         Returns:
             Normalized name (lowercase, no punctuation, no mascots)
         """
+        return self._normalize_cached(team_name)
+
+    def _normalize_name(self, team_name: str) -> str:
+        """Uncached implementation of normalize_name"""
         if not team_name:
             return ""
 
@@ -176,6 +228,10 @@ class TeamNameMatcher:
         Returns:
             Canonical name if known, otherwise normalized name
         """
+        return self._canonical_cached(team_name)
+
+    def _get_canonical_name(self, team_name: str) -> str:
+        """Uncached implementation of get_canonical_name"""
         normalized = self.normalize_name(team_name)
 
         # Check if we already have a mapping
@@ -186,6 +242,30 @@ class TeamNameMatcher:
         # Return normalized name as new canonical
         return normalized
 
+    def get_team_key(self, team_name: str) -> str:
+        """
+        Get a stable team identifier for indexing (e.g. matching odds to ESPN games)
+
+        Uses the CSV-mapped ESPN name when the team is in the Odds API <-> ESPN
+        mapping, otherwise the canonical name. Equal keys are treated as a match
+        by the odds index; they usually, but not always, agree with match_teams
+        (a CSV-mapped ESPN name and a canonical name are compared as-is).
+
+        Args:
+            team_name: Any variation of team name
+
+        Returns:
+            Lowercase ESPN name or canonical name
+        """
+        if not team_name:
+            return ""
+
+        name_lower = team_name.lower().strip()
+        if name_lower in self.odds_espn_map:
+            return self.odds_espn_map[name_lower].lower()
+
+        return self.get_canonical_name(team_name)
+
     def add_mapping(self, canonical_name: str, variation: str):
         """
         Add a new team name variation to the mapping
@@ -213,6 +293,10 @@ class TeamNameMatcher:
         Returns:
             True if names match, False otherwise
         """
+        return self._match_cached(name1, name2, threshold)
+
+    def _match_teams(self, name1: str, name2: str, threshold: int) -> bool:
+        """Uncached implementation of match_teams"""
         if not name1 or not name2:
             return False
 
@@ -249,9 +333,8 @@ class TeamNameMatcher:
         fuzzy_score = fuzz.ratio(norm1, norm2)
         if fuzzy_score >= threshold:
             # Check for qualifier words that indicate different teams
-            qualifiers = ["state", "tech", "christian", "methodist", "wesleyan"]
-            norm1_has_qualifier = any(q in norm1 for q in qualifiers)
-            norm2_has_qualifier = any(q in norm2 for q in qualifiers)
+            norm1_has_qualifier = self._has_qualifier(norm1)
+            norm2_has_qualifier = self._has_qualifier(norm2)
 
             # If one has a qualifier and the other doesn't, they're different teams
             if norm1_has_qualifier != norm2_has_qualifier:
@@ -319,6 +402,75 @@ class TeamNameMatcher:
 
         return None
 
+    def match_many(self, targets: List[str], candidates: List[str], threshold: int = 80) -> Dict[str, Optional[str]]:
+        """
+        Find the best matching candidate for every target in one call
+
+        Scores the full targets x candidates matrix at once (rapidfuzz cdist on
+        all cores when installed, otherwise fuzzywuzzy). Exact and canonical
+        matches win outright. Fuzzy matches must reach the threshold and pass
+        the same qualifier guard as match_teams ("Michigan" never matches
+        "Michigan State"); mascots are stripped by normalize_name first.
+
+        Args:
+            targets: Team names to match
+            candidates: List of potential matches
+            threshold: Minimum fuzzy match score
+
+        Returns:
+            Dict mapping each target to its best candidate, or None
+        """
+        results = {target: None for target in targets}
+        if not targets or not candidates:
+            return results
+
+        # Exact and canonical lookups (first candidate wins, like find_best_match)
+        exact_lookup = {}
+        canonical_lookup = {}
+        for candidate in candidates:
+            exact_lookup.setdefault(candidate.lower(), candidate)
+            canonical_lookup.setdefault(self.get_canonical_name(candidate), candidate)
+
+        remaining = []
+        for target in targets:
+            match = exact_lookup.get(target.lower()) or canonical_lookup.get(self.get_canonical_name(target))
+            if match is not None:
+                results[target] = match
+            else:
+                remaining.append(target)
+
+        if not remaining:
+            return results
+
+        # Fuzzy score matrix for everything left over
+        target_norms = [self.normalize_name(t) for t in remaining]
+        candidate_norms = [self.normalize_name(c) for c in candidates]
+
+        if RAPIDFUZZ_AVAILABLE:
+            scores = rf_process.cdist(target_norms, candidate_norms, scorer=rf_fuzz.ratio, workers=-1)
+            scores = np.rint(scores)
+        else:
+            scores = np.array([[fuzz.ratio(t, c) for c in candidate_norms] for t in target_norms], dtype=float)
+
+        # Qualifier guard - mask pairs where only one side has a qualifier
+        target_qualified = np.array([self._has_qualifier(t) for t in target_norms])
+        candidate_qualified = np.array([self._has_qualifier(c) for c in candidate_norms])
+        scores[target_qualified[:, None] != candidate_qualified[None, :]] = -1
+
+        best_idx = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(remaining)), best_idx]
+
+        for target, idx, score in zip(remaining, best_idx, best_scores):
+            if score >= threshold:
+                results[target] = candidates[idx]
+                logger.debug(f"Best match for '{target}': '{candidates[idx]}' (score: {score:.0f})")
+
+        return results
+
+    def _has_qualifier(self, normalized_name: str) -> bool:
+        """Check if a normalized name contains a team qualifier word"""
+        return any(q in normalized_name for q in self.qualifiers)
+
 
 # Singleton instance
 _team_matcher = None
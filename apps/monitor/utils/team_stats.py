@@ -2,6 +2,9 @@
 Unified Team Stats Manager
 Switches between KenPom, ESPN (NCAA), and NBA based on configuration
 """
+import threading
+import time
+from datetime import datetime, timedelta
 from typing import Dict, Optional
 from loguru import logger
 import config
@@ -11,6 +14,9 @@ from utils.team_stats_kenpom import get_kenpom_fetcher
 from utils.team_stats_espn import get_espn_fetcher
 from utils.team_stats_nba import get_nba_fetcher
 
+# Min seconds between automatic refresh attempts after a failed refresh
+REFRESH_RETRY_SECONDS = 300
+
 
 class TeamStatsManager:
     """Unified interface for team statistics regardless of sport/data source"""
@@ -34,10 +40,106 @@ class TeamStatsManager:
             self.fetcher = get_espn_fetcher()
             logger.info(f"Initialized TeamStatsManager for NCAA (ESPN)")
 
+        # Background refresh state (one refresh at a time)
+        self._refresh_lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self.last_refresh_started: Optional[datetime] = None
+        self.last_refresh_finished: Optional[datetime] = None
+        self.last_refresh_duration: Optional[float] = None
+        self.last_refresh_error: Optional[str] = None
+
     def fetch_all_stats(self, force_refresh: bool = False):
-        """Fetch team statistics from configured source"""
+        """Fetch team statistics from configured source (blocking)"""
         logger.info(f"Fetching team stats from {self.data_source}...")
-        return self.fetcher.fetch_team_stats(force_refresh=force_refresh)
+        with self._refresh_lock:
+            return self.fetcher.fetch_team_stats(force_refresh=force_refresh)
+
+    def refresh_in_background(self, force_refresh: bool = False) -> bool:
+        """
+        Refresh team stats on a background thread
+
+        Lookups keep using the current snapshot until the fetcher swaps in
+        the new one. With no snapshot yet, the last saved stats are loaded
+        first so lookups work while the fetch runs.
+
+        Returns:
+            False if a refresh is already running
+        """
+        with self._thread_lock:
+            if self.is_refreshing():
+                return False
+
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_worker,
+                args=(force_refresh,),
+                name="team-stats-refresh",
+                daemon=True
+            )
+            self._refresh_thread.start()
+            return True
+
+    def is_refreshing(self) -> bool:
+        """Whether a background refresh is running"""
+        return self._refresh_thread is not None and self._refresh_thread.is_alive()
+
+    def _refresh_worker(self, force_refresh: bool):
+        """Run one refresh and record its timing"""
+        self.last_refresh_started = datetime.now()
+        start = time.monotonic()
+
+        try:
+            if self.fetcher.stats_cache is None and self.fetcher.load_cached_snapshot():
+                logger.info("Serving saved team stats while refreshing")
+
+            self.fetch_all_stats(force_refresh=force_refresh)
+
+            # Fetchers fall back to the saved snapshot instead of raising
+            self.last_refresh_error = getattr(self.fetcher, "last_error", None)
+            if self.last_refresh_error:
+                logger.error(f"Team stats refresh failed, serving saved snapshot: {self.last_refresh_error}")
+            else:
+                logger.success(f"Team stats refreshed in {time.monotonic() - start:.1f}s")
+
+        except Exception as e:
+            self.last_refresh_error = str(e)
+            logger.error(f"Error refreshing team stats: {e}")
+
+        finally:
+            self.last_refresh_duration = time.monotonic() - start
+            self.last_refresh_finished = datetime.now()
+
+    def _refresh_if_stale(self):
+        """Start a background refresh when the snapshot is missing or older than STATS_REFRESH_HOURS"""
+        loaded_at = getattr(self.fetcher, "last_fetch", None)
+        if loaded_at is not None and datetime.now() - loaded_at < timedelta(hours=config.STATS_REFRESH_HOURS):
+            return
+
+        # Don't retry a failing source on every lookup
+        if (self.last_refresh_error is not None
+                and self.last_refresh_finished is not None
+                and (datetime.now() - self.last_refresh_finished).total_seconds() < REFRESH_RETRY_SECONDS):
+            return
+
+        self.refresh_in_background()
+
+    def get_refresh_status(self) -> Dict:
+        """Refresh timing and snapshot age, for status endpoints"""
+        loaded_at = getattr(self.fetcher, "last_fetch", None)
+        snapshot = self.fetcher.stats_cache
+
+        return {
+            "data_source": self.data_source,
+            "refreshing": self.is_refreshing(),
+            "snapshot_loaded": snapshot is not None,
+            "snapshot_teams": len(snapshot) if snapshot is not None else 0,
+            "snapshot_fetched_at": loaded_at.isoformat() if loaded_at else None,
+            "snapshot_age_seconds": round((datetime.now() - loaded_at).total_seconds(), 1) if loaded_at else None,
+            "last_refresh_started": self.last_refresh_started.isoformat() if self.last_refresh_started else None,
+            "last_refresh_finished": self.last_refresh_finished.isoformat() if self.last_refresh_finished else None,
+            "last_refresh_duration_seconds": round(self.last_refresh_duration, 2) if self.last_refresh_duration is not None else None,
+            "last_refresh_error": self.last_refresh_error
+        }
 
     def get_team_metrics(self, team_name: str) -> Optional[Dict]:
         """
@@ -54,6 +156,12 @@ class TeamStatsManager:
         - to_rate: Turnover rate (if available)
         - data_source: "kenpom" or "espn"
         """
+        # Never block a lookup on a fetch - stats arrive from the background refresh
+        self._refresh_if_stale()
+        if self.fetcher.stats_cache is None:
+            logger.debug(f"Team stats still loading, no metrics for: {team_name}")
+            return None
+
         metrics = self.fetcher.get_team_metrics(team_name)
 
         if metrics is None:
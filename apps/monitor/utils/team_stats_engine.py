@@ -0,0 +1,191 @@
+"""
+Team Stats Aggregation Engine
+Turns per-game team box scores into season team metrics (pace, efficiencies,
+shooting splits, per-game rates) with one groupby pass over the box scores.
+Shared by the ESPN (NCAA) and NBA stats fetchers.
+"""
+import pandas as pd
+
+# Box score columns summed per team (coerced to numbers, missing values count as 0)
+COUNTING_COLUMNS = [
+    "team_score",
+    "opponent_team_score",
+    "field_goals_made",
+    "field_goals_attempted",
+    "three_point_field_goals_made",
+    "three_point_field_goals_attempted",
+    "free_throws_made",
+    "free_throws_attempted",
+    "offensive_rebounds",
+    "defensive_rebounds",
+    "total_rebounds",
+    "turnovers",
+]
+
+# Extra counting columns for the extended (NCAA) metrics
+EXTENDED_COUNTING_COLUMNS = ["assists", "steals", "blocks", "fouls"]
+
+# Output columns, in the order the fetchers have always saved them
+BASE_METRICS = [
+    "team_id",
+    "team_name",
+    "games_played",
+    "pace",
+    "off_efficiency",
+    "def_efficiency",
+    "fg_pct",
+    "three_p_rate",
+    "three_p_pct",
+    "ft_rate",
+    "ft_pct",
+    "oreb_pct",
+    "to_rate",
+]
+
+EXTENDED_METRICS = [
+    "team_id",
+    "team_name",
+    "games_played",
+    "pace",
+    "off_efficiency",
+    "def_efficiency",
+    "fg_pct",
+    "three_p_rate",
+    "three_p_pct",
+    "ft_rate",
+    "ft_pct",
+    "oreb_pct",
+    "dreb_pct",
+    "to_rate",
+    "efg_pct",
+    "ts_pct",
+    "two_p_pct",
+    "efficiency_margin",
+    "avg_ppm",
+    "avg_ppg",
+    "assists_per_game",
+    "steals_per_game",
+    "blocks_per_game",
+    "fouls_per_game",
+    "ast_to_ratio",
+]
+
+# Regulation minutes per game (NCAA: 2 x 20 min halves)
+GAME_MINUTES = 40
+
+
+def _ratio(numerator: pd.Series, denominator: pd.Series, scale: float = 1.0) -> pd.Series:
+    """numerator / denominator * scale, or 0 where the denominator isn't positive"""
+    return (numerator / denominator * scale).where(denominator > 0, 0.0)
+
+
+def sum_box_scores(box_scores: pd.DataFrame, extended: bool = True) -> pd.DataFrame:
+    """
+    Per-team season totals from team box scores
+
+    Args:
+        box_scores: One row per team per game (sportsdataverse team box score schema)
+        extended: Also total assists, steals, blocks and fouls
+
+    Returns:
+        DataFrame indexed by team_id with team_name, games_played and one
+        total_<column> per counting column
+    """
+    columns = COUNTING_COLUMNS + (EXTENDED_COUNTING_COLUMNS if extended else [])
+
+    numeric = box_scores[columns].apply(pd.to_numeric, errors="coerce").fillna(0)
+    numeric.columns = [f"total_{c}" for c in columns]
+    numeric["team_id"] = box_scores["team_id"]
+    numeric["team_name"] = box_scores["team_display_name"]
+
+    grouped = numeric.groupby("team_id", sort=False)
+    totals = grouped[[f"total_{c}" for c in columns]].sum()
+    totals.insert(0, "games_played", grouped.size())
+    totals.insert(0, "team_name", grouped["team_name"].first())
+    return totals
+
+
+def calculate_metrics(totals: pd.DataFrame, extended: bool = True) -> pd.DataFrame:
+    """
+    Team metrics from season totals (output of sum_box_scores)
+
+    Returns:
+        One row per team with BASE_METRICS (or EXTENDED_METRICS) columns
+    """
+    t = totals
+    games = t["games_played"]
+    points = t["total_team_score"]
+    fgm = t["total_field_goals_made"]
+    fga = t["total_field_goals_attempted"]
+    three_m = t["total_three_point_field_goals_made"]
+    three_a = t["total_three_point_field_goals_attempted"]
+    ftm = t["total_free_throws_made"]
+    fta = t["total_free_throws_attempted"]
+    oreb = t["total_offensive_rebounds"]
+    reb = t["total_total_rebounds"]
+    turnovers = t["total_turnovers"]
+
+    # Possessions estimate: FGA + 0.44*FTA - OReb + TO
+    possessions = fga + 0.44 * fta - oreb + turnovers
+
+    metrics = pd.DataFrame({
+        "team_id": t.index,
+        "team_name": t["team_name"].values,
+        "games_played": games.values,
+    })
+
+    def put(name: str, values: pd.Series):
+        metrics[name] = values.values
+
+    put("pace", _ratio(possessions, games))
+    put("off_efficiency", _ratio(points, possessions, 100))
+    # Opponent points per 100 of our possessions (approximation)
+    put("def_efficiency", _ratio(t["total_opponent_team_score"], possessions, 100))
+    put("fg_pct", _ratio(fgm, fga, 100))
+    put("three_p_rate", _ratio(three_a, fga))
+    put("three_p_pct", _ratio(three_m, three_a, 100))
+    put("ft_rate", _ratio(fta, games))
+    put("ft_pct", _ratio(ftm, fta, 100))
+    # Share of our own rebounds (true OReb%/DReb% would need opponent rebounds)
+    put("oreb_pct", _ratio(oreb, reb, 100))
+    put("to_rate", _ratio(turnovers, games))
+
+    if not extended:
+        return metrics[BASE_METRICS]
+
+    assists = t["total_assists"]
+
+    put("dreb_pct", _ratio(t["total_defensive_rebounds"], reb, 100))
+    # eFG% = (FGM + 0.5 x 3PM) / FGA
+    put("efg_pct", _ratio(fgm + 0.5 * three_m, fga, 100))
+    # TS% = PTS / (2 x (FGA + 0.44 x FTA))
+    put("ts_pct", (points / (2 * (fga + 0.44 * fta)) * 100).where((fga + fta) > 0, 0.0))
+    put("two_p_pct", _ratio(fgm - three_m, fga - three_a, 100))
+    metrics["efficiency_margin"] = metrics["off_efficiency"] - metrics["def_efficiency"]
+    put("avg_ppm", _ratio(points, games * GAME_MINUTES))
+    put("avg_ppg", _ratio(points, games))
+    put("assists_per_game", _ratio(assists, games))
+    put("steals_per_game", _ratio(t["total_steals"], games))
+    put("blocks_per_game", _ratio(t["total_blocks"], games))
+    put("fouls_per_game", _ratio(t["total_fouls"], games))
+    put("ast_to_ratio", _ratio(assists, turnovers))
+
+    return metrics[EXTENDED_METRICS]
+
+
+def aggregate_team_stats(box_scores: pd.DataFrame, data_source: str, extended: bool = True) -> pd.DataFrame:
+    """
+    Season team metrics from team box scores in a single vectorized pass
+
+    Args:
+        box_scores: One row per team per game
+        data_source: Value for the data_source column (e.g. "espn", "nba_espn")
+        extended: Include the NCAA advanced metrics (eFG%, TS%, per-game
+            assists/steals/blocks/fouls, ...)
+
+    Returns:
+        One row per team, teams in order of first appearance
+    """
+    metrics = calculate_metrics(sum_box_scores(box_scores, extended), extended)
+    metrics["data_source"] = data_source
+    return metrics
@@ -5,22 +5,56 @@ No subscription required
 """
 import pandas as pd
 import polars as pl
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from sportsdataverse.mbb import load_mbb_team_boxscore
 from loguru import logger
 import config
+from utils.stats_snapshot import StatsSnapshotCache
+from utils.team_index import TeamIndex
+from utils.team_stats_engine import EXTENDED_METRICS, aggregate_team_stats, calculate_metrics
+from utils.team_stats_store import TeamTotalsStore
+
+# Snapshot column types (metrics are floats)
+SNAPSHOT_SCHEMA = {
+    **{column: "float64" for column in EXTENDED_METRICS[3:]},
+    "team_id": "int64",
+    "team_name": "string",
+    "games_played": "int64",
+    "data_source": "string",
+    "espn_rank": "int64",
+}
 
 
 class ESPNStatsFetcher:
     """Fetches and calculates team statistics from ESPN data"""
 
     def __init__(self):
-        self.stats_cache = None
+        # (stats DataFrame, its TeamIndex), replaced as one object so readers never mix snapshots
+        self._snapshot: Tuple[Optional[pd.DataFrame], Optional[TeamIndex]] = (None, None)
         self.last_fetch = None
+        self.last_error: Optional[str] = None  # Why the last fetch fell back to the saved snapshot
         self.current_season = datetime.now().year if datetime.now().month >= 10 else datetime.now().year
         # Load team name mappings from CSV (Odds API -> ESPN)
         self.name_mapping = self._load_name_mapping()
+        # Per-team running totals for incremental refreshes
+        self.totals_store = TeamTotalsStore(
+            config.CACHE_DIR / f"espn_team_totals_{self.current_season}.json",
+            self.current_season
+        )
+        # CSV export keeps the product site's matchups route (reads espn_stats_*.csv) working
+        self.snapshot_cache = StatsSnapshotCache("espn", SNAPSHOT_SCHEMA, csv_export=True)
+
+    @property
+    def stats_cache(self) -> Optional[pd.DataFrame]:
+        """Team stats DataFrame (setting it rebuilds the team lookup index)"""
+        return self._snapshot[0]
+
+    @stats_cache.setter
+    def stats_cache(self, df: Optional[pd.DataFrame]):
+        # Build the new index first, then swap DataFrame and index in one assignment
+        team_index = TeamIndex(df, "team_name", self._build_metrics) if df is not None else None
+        self._snapshot = (df, team_index)
 
     def fetch_team_stats(self, force_refresh: bool = False) -> pd.DataFrame:
         """
@@ -50,11 +84,17 @@ class ESPNStatsFetcher:
         - fouls_per_game: Fouls per game (Phase 2)
         - ast_to_ratio: Assist-to-Turnover Ratio (Phase 2)
         """
+        self.last_error = None
+
         # Check if we have recent cached data
         if not force_refresh and self._is_cache_valid():
             logger.info("Using cached ESPN stats")
             return self.stats_cache
 
+        # Startup: running totals saved by a recent refresh make the download unnecessary
+        if not force_refresh and self.stats_cache is None and self._load_from_totals_store():
+            return self.stats_cache
+
         try:
             logger.info(f"Fetching team box scores from ESPN for {self.current_season} season...")
 
@@ -66,8 +106,11 @@ class ESPNStatsFetcher:
 
             logger.info(f"Processing {len(box_scores)} team box scores...")
 
-            # Aggregate stats by team
-            team_stats = self._calculate_team_stats(box_scores)
+            # Aggregate stats by team (incrementally when running totals are kept)
+            if config.STATS_INCREMENTAL_REFRESH:
+                team_stats = self._refresh_incremental(box_scores)
+            else:
+                team_stats = self._calculate_team_stats(box_scores)
 
             logger.success(f"Calculated stats for {len(team_stats)} teams from ESPN")
 
@@ -75,157 +118,71 @@ class ESPNStatsFetcher:
             self.stats_cache = team_stats
             self.last_fetch = datetime.now()
 
-            # Save to CSV for persistence
-            self._save_to_csv(team_stats)
+            # Save a snapshot for persistence
+            self._save_snapshot(team_stats)
 
             return team_stats
 
         except Exception as e:
             logger.error(f"Error fetching ESPN stats: {e}")
-            # Try to load from CSV backup
-            return self._load_from_csv()
+            self.last_error = str(e)
+            # Fall back to the last snapshot
+            return self._load_snapshot()
 
     def _calculate_team_stats(self, box_scores: pd.DataFrame) -> pd.DataFrame:
         """Calculate advanced metrics from box score data"""
+        return self._rank_teams(aggregate_team_stats(box_scores, data_source='espn', extended=True))
+
+    def _refresh_incremental(self, box_scores: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fold box scores newer than the totals store's watermark into the
+        running totals and derive metrics from them
+
+        Aggregation work is proportional to the games played since the last
+        refresh; the first refresh of a season builds the totals from scratch.
+        """
+        store = self.totals_store
+        if store.totals is None:
+            store.load()
 
-        # Group by team
-        team_groups = []
-
-        for team_id in box_scores['team_id'].unique():
-            team_games = box_scores[box_scores['team_id'] == team_id]
-
-            if len(team_games) == 0:
-                continue
-
-            # Get team name
-            team_name = team_games.iloc[0]['team_display_name']
-            games_played = len(team_games)
-
-            # Parse shooting stats (columns are already separated in new ESPN API)
-            fgm = pd.to_numeric(team_games['field_goals_made'], errors='coerce').fillna(0)
-            fga = pd.to_numeric(team_games['field_goals_attempted'], errors='coerce').fillna(0)
-            three_m = pd.to_numeric(team_games['three_point_field_goals_made'], errors='coerce').fillna(0)
-            three_a = pd.to_numeric(team_games['three_point_field_goals_attempted'], errors='coerce').fillna(0)
-            ftm = pd.to_numeric(team_games['free_throws_made'], errors='coerce').fillna(0)
-            fta = pd.to_numeric(team_games['free_throws_attempted'], errors='coerce').fillna(0)
-
-            # Calculate totals
-            total_points = team_games['team_score'].sum()
-            total_fgm = fgm.sum()
-            total_fga = fga.sum()
-            total_3pm = three_m.sum()
-            total_3pa = three_a.sum()
-            total_ftm = ftm.sum()
-            total_fta = fta.sum()
-            total_oreb = team_games['offensive_rebounds'].sum()
-            total_dreb = team_games['defensive_rebounds'].sum()
-            total_reb = team_games['total_rebounds'].sum()
-            total_to = team_games['turnovers'].sum()
-
-            # NEW: Assists, Steals, Blocks, Fouls
-            total_assists = pd.to_numeric(team_games['assists'], errors='coerce').fillna(0).sum()
-            total_steals = pd.to_numeric(team_games['steals'], errors='coerce').fillna(0).sum()
-            total_blocks = pd.to_numeric(team_games['blocks'], errors='coerce').fillna(0).sum()
-            total_fouls = pd.to_numeric(team_games['fouls'], errors='coerce').fillna(0).sum()
-
-            # Opponent stats (for defensive metrics)
-            opp_points = team_games['opponent_team_score'].sum()
-
-            # Calculate pace (estimate using formula: FGA + 0.44*FTA - OReb + TO)
-            poss_estimate = (total_fga + 0.44 * total_fta - total_oreb + total_to)
-            pace = poss_estimate / games_played if games_played > 0 else 0
-
-            # Offensive efficiency (points per 100 possessions)
-            off_eff = (total_points / poss_estimate * 100) if poss_estimate > 0 else 0
-
-            # Defensive efficiency (opponent points per 100 possessions - approximation)
-            def_eff = (opp_points / poss_estimate * 100) if poss_estimate > 0 else 0
-
-            # Shooting percentages
-            fg_pct = (total_fgm / total_fga * 100) if total_fga > 0 else 0
-            three_p_rate = (total_3pa / total_fga) if total_fga > 0 else 0
-            three_p_pct = (total_3pm / total_3pa * 100) if total_3pa > 0 else 0
-            ft_rate = total_fta / games_played if games_played > 0 else 0
-            ft_pct = (total_ftm / total_fta * 100) if total_fta > 0 else 0
-
-            # Rebounding (simplified - would need opponent reb for true OReb%)
-            # OReb% = Offensive Rebounds / Total Rebounds (approximation)
-            # True formula would be: OReb / (OReb + Opp DReb), requires opponent data
-            oreb_pct = (total_oreb / total_reb * 100) if total_reb > 0 else 0
-
-            # DReb% = Defensive Rebounds / Total Rebounds (approximation)
-            # True formula would be: DReb / (DReb + Opp OReb), requires opponent data
-            dreb_pct = (total_dreb / total_reb * 100) if total_reb > 0 else 0
-
-            # Turnover rate
-            to_rate = total_to / games_played if games_played > 0 else 0
-
-            # NEW: Per-game stats for assists, steals, blocks, fouls
-            assists_per_game = total_assists / games_played if games_played > 0 else 0
-            steals_per_game = total_steals / games_played if games_played > 0 else 0
-            blocks_per_game = total_blocks / games_played if games_played > 0 else 0
-            fouls_per_game = total_fouls / games_played if games_played > 0 else 0
-
-            # NEW: Assist-to-Turnover Ratio (superior to raw turnover rate)
-            ast_to_ratio = total_assists / total_to if total_to > 0 else 0
-
-            # NEW ADVANCED METRICS (Phase 1)
-            # 1. Effective Field Goal % (eFG%) = (FGM + 0.5 × 3PM) / FGA
-            efg_pct = ((total_fgm + 0.5 * total_3pm) / total_fga * 100) if total_fga > 0 else 0
-
-            # 2. True Shooting % (TS%) = PTS / (2 × (FGA + 0.44 × FTA))
-            ts_pct = (total_points / (2 * (total_fga + 0.44 * total_fta)) * 100) if (total_fga + total_fta) > 0 else 0
-
-            # 3. 2-Point Field Goal %
-            two_point_m = total_fgm - total_3pm
-            two_point_a = total_fga - total_3pa
-            two_p_pct = (two_point_m / two_point_a * 100) if two_point_a > 0 else 0
-
-            # 4. Efficiency Margin (replaces AdjEM from KenPom)
-            efficiency_margin = off_eff - def_eff
-
-            # 5. Average PPM (Points Per Minute)
-            # NCAA games are 40 minutes (2 x 20 min halves)
-            total_minutes = games_played * 40
-            avg_ppm = total_points / total_minutes if total_minutes > 0 else 0
-
-            # 6. Average PPG (Points Per Game)
-            avg_ppg = total_points / games_played if games_played > 0 else 0
-
-            team_groups.append({
-                'team_id': team_id,
-                'team_name': team_name,
-                'games_played': games_played,
-                'pace': pace,
-                'off_efficiency': off_eff,
-                'def_efficiency': def_eff,
-                'fg_pct': fg_pct,
-                'three_p_rate': three_p_rate,
-                'three_p_pct': three_p_pct,
-                'ft_rate': ft_rate,
-                'ft_pct': ft_pct,
-                'oreb_pct': oreb_pct,
-                'dreb_pct': dreb_pct,  # Defensive rebounding % (Phase 2)
-                'to_rate': to_rate,
-                # New advanced metrics
-                'efg_pct': efg_pct,
-                'ts_pct': ts_pct,
-                'two_p_pct': two_p_pct,
-                'efficiency_margin': efficiency_margin,
-                'avg_ppm': avg_ppm,  # Average points per minute
-                'avg_ppg': avg_ppg,  # Average points per game
-                # NEW: Assists, Steals, Blocks, Fouls (Phase 2)
-                'assists_per_game': assists_per_game,
-                'steals_per_game': steals_per_game,
-                'blocks_per_game': blocks_per_game,
-                'fouls_per_game': fouls_per_game,
-                'ast_to_ratio': ast_to_ratio,  # Assist-to-Turnover Ratio
-                'data_source': 'espn'
-            })
-
-        # Create DataFrame
-        df = pd.DataFrame(team_groups)
+        try:
+            new_rows = store.fold(box_scores)
+        except KeyError as e:
+            # Box scores without game_date/game_id can't be watermarked
+            logger.warning(f"Incremental refresh unavailable ({e}), aggregating full season")
+            return self._calculate_team_stats(box_scores)
 
+        store.save()
+        logger.info(f"Folded {new_rows} new team box scores into running totals "
+                    f"(through {store.watermark_date})")
+
+        return self._stats_from_totals(store.totals)
+
+    def _load_from_totals_store(self) -> bool:
+        """Use saved running totals if they are fresher than STATS_REFRESH_HOURS"""
+        if not config.STATS_INCREMENTAL_REFRESH:
+            return False
+
+        store = self.totals_store
+        if store.totals is None and not store.load():
+            return False
+
+        if datetime.now() - store.updated_at >= timedelta(hours=config.STATS_REFRESH_HOURS):
+            return False
+
+        self.stats_cache = self._stats_from_totals(store.totals)
+        self.last_fetch = store.updated_at
+        logger.success(f"Loaded stats for {len(self.stats_cache)} teams from running totals")
+        return True
+
+    def _stats_from_totals(self, totals: pd.DataFrame) -> pd.DataFrame:
+        """Team metrics from per-team season totals"""
+        df = calculate_metrics(totals, extended=True)
+        df['data_source'] = 'espn'
+        return self._rank_teams(df)
+
+    def _rank_teams(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Add espn_rank and sort by team name"""
         # Calculate rankings based on efficiency margin (best teams first)
         # Sort by efficiency margin descending, then assign rank 1, 2, 3, etc.
         df = df.sort_values('efficiency_margin', ascending=False)
@@ -270,12 +227,18 @@ class ESPNStatsFetcher:
             logger.debug(f"Translated team name: '{team_name}' -> '{name_to_lookup}'")
 
         # Try to find team
-        team_row = self._find_team(name_to_lookup)
+        metrics = self._find_team(name_to_lookup)
 
-        if team_row is None:
+        if metrics is None:
             logger.warning(f"Team not found in ESPN data: {team_name}")
             return None
 
+        # Copy - callers add fields to the result
+        return dict(metrics)
+
+    @staticmethod
+    def _build_metrics(team_row: Dict) -> Dict:
+        """Metrics dict for one stats_cache row"""
         return {
             "team_name": team_row["team_name"],
             "pace": float(team_row["pace"]),
@@ -304,28 +267,17 @@ class ESPNStatsFetcher:
             "data_source": "espn"
         }
 
-    def _find_team(self, team_name: str) -> Optional[pd.Series]:
-        """Find team in stats cache with flexible matching"""
-        if self.stats_cache is None:
+    def _find_team(self, team_name: str) -> Optional[Dict]:
+        """Find team metrics by name, alias or partial match (dict lookups via the team index)"""
+        team_index = self._snapshot[1]
+        if team_index is None:
             return None
 
-        # Direct match
-        direct = self.stats_cache[self.stats_cache["team_name"] == team_name]
-        if not direct.empty:
-            return direct.iloc[0]
-
-        # Case-insensitive match
-        team_lower = team_name.lower()
-        for idx, row in self.stats_cache.iterrows():
-            if row["team_name"].lower() == team_lower:
-                return row
-
-        # Partial match (contains)
-        for idx, row in self.stats_cache.iterrows():
-            if team_lower in row["team_name"].lower() or row["team_name"].lower() in team_lower:
-                return row
+        return team_index.lookup(team_name)
 
-        return None
+    def load_cached_snapshot(self) -> bool:
+        """Load the last saved stats without fetching (served while a refresh runs)"""
+        return self._load_from_totals_store() or self._load_snapshot() is not None
 
     def _is_cache_valid(self) -> bool:
         """Check if cached stats are still valid"""
@@ -337,29 +289,18 @@ class ESPNStatsFetcher:
 
         return age < max_age
 
-    def _save_to_csv(self, df: pd.DataFrame):
-        """Save stats to CSV for backup"""
-        try:
-            filepath = config.CACHE_DIR / f"espn_stats_{datetime.now().strftime('%Y%m%d')}.csv"
-            df.to_csv(filepath, index=False)
-            logger.info(f"Saved ESPN stats to {filepath}")
-        except Exception as e:
-            logger.error(f"Error saving ESPN stats to CSV: {e}")
-
-    def _load_from_csv(self) -> Optional[pd.DataFrame]:
-        """Load most recent stats from CSV backup"""
-        try:
-            # Find most recent cache file
-            cache_files = sorted(config.CACHE_DIR.glob("espn_stats_*.csv"), reverse=True)
-            if cache_files:
-                logger.info(f"Loading ESPN stats from backup: {cache_files[0]}")
-                df = pd.read_csv(cache_files[0])
-                self.stats_cache = df
-                return df
-        except Exception as e:
-            logger.error(f"Error loading ESPN stats from CSV: {e}")
-
-        return None
+    def _save_snapshot(self, df: pd.DataFrame):
+        """Save stats to the snapshot cache for fast cold starts"""
+        self.snapshot_cache.save(df)
+
+    def _load_snapshot(self) -> Optional[pd.DataFrame]:
+        """Load the latest stats snapshot (None if missing or stale)"""
+        df = self.snapshot_cache.load()
+        if df is not None:
+            self.stats_cache = df
+            # Age of the snapshot, so status reports and staleness checks see when it was fetched
+            self.last_fetch = self.snapshot_cache.saved_at
+        return df
 
     def _load_name_mapping(self) -> Dict[str, str]:
         """Load Odds API -> ESPN team name mappings from CSV"""
@@ -4,13 +4,30 @@ Uses kenpompy to get advanced metrics from kenpom.com
 Requires KenPom subscription
 """
 import pandas as pd
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from datetime import datetime, timedelta
 import kenpompy.utils as kp_utils
 import kenpompy.summary as kp_summary
 from loguru import logger
 from pathlib import Path
 import config
+from utils.stats_snapshot import StatsSnapshotCache
+from utils.team_index import TeamIndex
+
+# Snapshot column types for the columns get_team_metrics reads (others are stored as strings)
+SNAPSHOT_SCHEMA = {
+    "Team": "string",
+    "Rk": "int64",
+    "AdjEM": "float64",
+    "AdjO": "float64",
+    "AdjD": "float64",
+    "AdjT": "float64",
+    "Luck": "float64",
+    "SOS_AdjEM": "float64",
+    "OppO": "float64",
+    "OppD": "float64",
+    "NCSOS_AdjEM": "float64",
+}
 
 
 class KenPomStatsFetcher:
@@ -18,8 +35,22 @@ class KenPomStatsFetcher:
 
     def __init__(self):
         self.browser = None
-        self.stats_cache = None
+        # (stats DataFrame, its TeamIndex), replaced as one object so readers never mix snapshots
+        self._snapshot: Tuple[Optional[pd.DataFrame], Optional[TeamIndex]] = (None, None)
         self.last_fetch = None
+        self.last_error: Optional[str] = None  # Why the last fetch fell back to the saved snapshot
+        self.snapshot_cache = StatsSnapshotCache("kenpom", SNAPSHOT_SCHEMA)
+
+    @property
+    def stats_cache(self) -> Optional[pd.DataFrame]:
+        """Team stats DataFrame (setting it rebuilds the team lookup index)"""
+        return self._snapshot[0]
+
+    @stats_cache.setter
+    def stats_cache(self, df: Optional[pd.DataFrame]):
+        # Build the new index first, then swap DataFrame and index in one assignment
+        team_index = TeamIndex(df, "Team", self._build_metrics) if df is not None else None
+        self._snapshot = (df, team_index)
 
     def _login(self):
         """Authenticate with KenPom"""
@@ -51,6 +82,8 @@ class KenPomStatsFetcher:
         - OppD: Opponent Defensive Efficiency
         - NCSOS_AdjEM: Non-conference SOS
         """
+        self.last_error = None
+
         # Check if we have recent cached data
         if not force_refresh and self._is_cache_valid():
             logger.info("Using cached KenPom stats")
@@ -73,15 +106,16 @@ class KenPomStatsFetcher:
             self.stats_cache = efficiency_df
             self.last_fetch = datetime.now()
 
-            # Save to CSV for persistence
-            self._save_to_csv(efficiency_df)
+            # Save a snapshot for persistence
+            self._save_snapshot(efficiency_df)
 
             return efficiency_df
 
         except Exception as e:
             logger.error(f"Error fetching KenPom stats: {e}")
-            # Try to load from CSV backup
-            return self._load_from_csv()
+            self.last_error = str(e)
+            # Fall back to the last snapshot
+            return self._load_snapshot()
 
     def get_team_metrics(self, team_name: str) -> Optional[Dict]:
         """
@@ -97,12 +131,18 @@ class KenPomStatsFetcher:
             self.fetch_team_stats()
 
         # Try to find team (flexible matching)
-        team_row = self._find_team(team_name)
+        metrics = self._find_team(team_name)
 
-        if team_row is None:
+        if metrics is None:
             logger.warning(f"Team not found in KenPom data: {team_name}")
             return None
 
+        # Copy - callers add fields to the result
+        return dict(metrics)
+
+    @staticmethod
+    def _build_metrics(team_row: Dict) -> Dict:
+        """Metrics dict for one stats_cache row"""
         pace_value = float(team_row["AdjT"])
         return {
             "team_name": team_row["Team"],
@@ -116,28 +156,17 @@ class KenPomStatsFetcher:
             "data_source": "kenpom"
         }
 
-    def _find_team(self, team_name: str) -> Optional[pd.Series]:
-        """Find team in stats cache with flexible matching"""
-        if self.stats_cache is None:
+    def _find_team(self, team_name: str) -> Optional[Dict]:
+        """Find team metrics by name, alias or partial match (dict lookups via the team index)"""
+        team_index = self._snapshot[1]
+        if team_index is None:
             return None
 
-        # Direct match
-        direct = self.stats_cache[self.stats_cache["Team"] == team_name]
-        if not direct.empty:
-            return direct.iloc[0]
-
-        # Case-insensitive match
-        team_lower = team_name.lower()
-        for idx, row in self.stats_cache.iterrows():
-            if row["Team"].lower() == team_lower:
-                return row
-
-        # Partial match (contains)
-        for idx, row in self.stats_cache.iterrows():
-            if team_lower in row["Team"].lower() or row["Team"].lower() in team_lower:
-                return row
+        return team_index.lookup(team_name)
 
-        return None
+    def load_cached_snapshot(self) -> bool:
+        """Load the last saved stats without fetching (served while a refresh runs)"""
+        return self._load_snapshot() is not None
 
     def _is_cache_valid(self) -> bool:
         """Check if cached stats are still valid"""
@@ -149,29 +178,18 @@ class KenPomStatsFetcher:
 
         return age < max_age
 
-    def _save_to_csv(self, df: pd.DataFrame):
-        """Save stats to CSV for backup"""
-        try:
-            filepath = config.CACHE_DIR / f"kenpom_stats_{datetime.now().strftime('%Y%m%d')}.csv"
-            df.to_csv(filepath, index=False)
-            logger.info(f"Saved KenPom stats to {filepath}")
-        except Exception as e:
-            logger.error(f"Error saving KenPom stats to CSV: {e}")
-
-    def _load_from_csv(self) -> Optional[pd.DataFrame]:
-        """Load most recent stats from CSV backup"""
-        try:
-            # Find most recent cache file
-            cache_files = sorted(config.CACHE_DIR.glob("kenpom_stats_*.csv"), reverse=True)
-            if cache_files:
-                logger.info(f"Loading KenPom stats from backup: {cache_files[0]}")
-                df = pd.read_csv(cache_files[0])
-                self.stats_cache = df
-                return df
-        except Exception as e:
-            logger.error(f"Error loading KenPom stats from CSV: {e}")
-
-        return None
+    def _save_snapshot(self, df: pd.DataFrame):
+        """Save stats to the snapshot cache for fast cold starts"""
+        self.snapshot_cache.save(df)
+
+    def _load_snapshot(self) -> Optional[pd.DataFrame]:
+        """Load the latest stats snapshot (None if missing or stale)"""
+        df = self.snapshot_cache.load()
+        if df is not None:
+            self.stats_cache = df
+            # Age of the snapshot, so status reports and staleness checks see when it was fetched
+            self.last_fetch = self.snapshot_cache.saved_at
+        return df
 
     def close(self):
         """Close browser session"""
@@ -3,20 +3,46 @@ NBA Team Stats Fetcher
 Uses sportsdataverse-py to get NBA team statistics
 """
 import pandas as pd
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from sportsdataverse.nba import load_nba_team_boxscore
 from loguru import logger
 import config
+from utils.stats_snapshot import StatsSnapshotCache
+from utils.team_index import TeamIndex
+from utils.team_stats_engine import BASE_METRICS, aggregate_team_stats
+
+# Snapshot column types (metrics are floats)
+SNAPSHOT_SCHEMA = {
+    **{column: "float64" for column in BASE_METRICS[3:]},
+    "team_id": "int64",
+    "team_name": "string",
+    "games_played": "int64",
+    "data_source": "string",
+}
 
 
 class NBAStatsFetcher:
     """Fetches and calculates NBA team statistics from ESPN data"""
 
     def __init__(self):
-        self.stats_cache = None
+        # (stats DataFrame, its TeamIndex), replaced as one object so readers never mix snapshots
+        self._snapshot: Tuple[Optional[pd.DataFrame], Optional[TeamIndex]] = (None, None)
         self.last_fetch = None
+        self.last_error: Optional[str] = None  # Why the last fetch fell back to the saved snapshot
         self.current_season = self._get_current_nba_season()
+        self.snapshot_cache = StatsSnapshotCache("nba", SNAPSHOT_SCHEMA)
+
+    @property
+    def stats_cache(self) -> Optional[pd.DataFrame]:
+        """Team stats DataFrame (setting it rebuilds the team lookup index)"""
+        return self._snapshot[0]
+
+    @stats_cache.setter
+    def stats_cache(self, df: Optional[pd.DataFrame]):
+        # Build the new index first, then swap DataFrame and index in one assignment
+        team_index = TeamIndex(df, "team_name", self._build_metrics) if df is not None else None
+        self._snapshot = (df, team_index)
 
     def _get_current_nba_season(self) -> int:
         """Get current NBA season year (e.g., 2024 for 2023-24 season)"""
@@ -45,6 +71,8 @@ class NBAStatsFetcher:
         - oreb_pct: Offensive rebounding percentage
         - to_rate: Turnovers per game
         """
+        self.last_error = None
+
         # Check if we have recent cached data
         if not force_refresh and self._is_cache_valid():
             logger.info("Using cached NBA stats")
@@ -70,97 +98,20 @@ class NBAStatsFetcher:
             self.stats_cache = team_stats
             self.last_fetch = datetime.now()
 
-            # Save to CSV for persistence
-            self._save_to_csv(team_stats)
+            # Save a snapshot for persistence
+            self._save_snapshot(team_stats)
 
             return team_stats
 
         except Exception as e:
             logger.error(f"Error fetching NBA stats: {e}")
-            # Try to load from CSV backup
-            return self._load_from_csv()
+            self.last_error = str(e)
+            # Fall back to the last snapshot
+            return self._load_snapshot()
 
     def _calculate_team_stats(self, box_scores: pd.DataFrame) -> pd.DataFrame:
         """Calculate advanced metrics from box score data"""
-
-        # Group by team
-        team_groups = []
-
-        for team_id in box_scores['team_id'].unique():
-            team_games = box_scores[box_scores['team_id'] == team_id]
-
-            if len(team_games) == 0:
-                continue
-
-            # Get team name
-            team_name = team_games.iloc[0]['team_display_name']
-            games_played = len(team_games)
-
-            # Get shooting stats (these are already separate columns)
-            fgm = pd.to_numeric(team_games['field_goals_made'], errors='coerce').fillna(0)
-            fga = pd.to_numeric(team_games['field_goals_attempted'], errors='coerce').fillna(0)
-            three_m = pd.to_numeric(team_games['three_point_field_goals_made'], errors='coerce').fillna(0)
-            three_a = pd.to_numeric(team_games['three_point_field_goals_attempted'], errors='coerce').fillna(0)
-            ftm = pd.to_numeric(team_games['free_throws_made'], errors='coerce').fillna(0)
-            fta = pd.to_numeric(team_games['free_throws_attempted'], errors='coerce').fillna(0)
-
-            # Calculate totals
-            total_points = team_games['team_score'].sum()
-            total_fgm = fgm.sum()
-            total_fga = fga.sum()
-            total_3pm = three_m.sum()
-            total_3pa = three_a.sum()
-            total_ftm = ftm.sum()
-            total_fta = fta.sum()
-            total_oreb = team_games['offensive_rebounds'].sum()
-            total_dreb = team_games['defensive_rebounds'].sum()
-            total_reb = team_games['total_rebounds'].sum()
-            total_to = team_games['turnovers'].sum()
-
-            # Opponent stats (for defensive metrics)
-            opp_points = team_games['opponent_team_score'].sum()
-
-            # Calculate pace (estimate using formula: FGA + 0.44*FTA - OReb + TO)
-            poss_estimate = (total_fga + 0.44 * total_fta - total_oreb + total_to)
-            pace = poss_estimate / games_played if games_played > 0 else 0
-
-            # Offensive efficiency (points per 100 possessions)
-            off_eff = (total_points / poss_estimate * 100) if poss_estimate > 0 else 0
-
-            # Defensive efficiency (opponent points per 100 possessions - approximation)
-            def_eff = (opp_points / poss_estimate * 100) if poss_estimate > 0 else 0
-
-            # Shooting percentages
-            fg_pct = (total_fgm / total_fga * 100) if total_fga > 0 else 0
-            three_p_rate = (total_3pa / total_fga) if total_fga > 0 else 0
-            three_p_pct = (total_3pm / total_3pa * 100) if total_3pa > 0 else 0
-            ft_rate = total_fta / games_played if games_played > 0 else 0
-            ft_pct = (total_ftm / total_fta * 100) if total_fta > 0 else 0
-
-            # Rebounding (simplified)
-            oreb_pct = (total_oreb / total_reb * 100) if total_reb > 0 else 0
-
-            # Turnover rate
-            to_rate = total_to / games_played if games_played > 0 else 0
-
-            team_groups.append({
-                'team_id': team_id,
-                'team_name': team_name,
-                'games_played': games_played,
-                'pace': pace,
-                'off_efficiency': off_eff,
-                'def_efficiency': def_eff,
-                'fg_pct': fg_pct,
-                'three_p_rate': three_p_rate,
-                'three_p_pct': three_p_pct,
-                'ft_rate': ft_rate,
-                'ft_pct': ft_pct,
-                'oreb_pct': oreb_pct,
-                'to_rate': to_rate,
-                'data_source': 'nba_espn'
-            })
-
-        return pd.DataFrame(team_groups)
+        return aggregate_team_stats(box_scores, data_source='nba_espn', extended=False)
 
     def get_team_metrics(self, team_name: str) -> Optional[Dict]:
         """
@@ -179,12 +130,18 @@ class NBAStatsFetcher:
             self.fetch_team_stats()
 
         # Try to find team
-        team_row = self._find_team(team_name)
+        metrics = self._find_team(team_name)
 
-        if team_row is None:
+        if metrics is None:
             logger.warning(f"NBA team not found: {team_name}")
             return None
 
+        # Copy - callers add fields to the result
+        return dict(metrics)
+
+    @staticmethod
+    def _build_metrics(team_row: Dict) -> Dict:
+        """Metrics dict for one stats_cache row"""
         return {
             "team_name": team_row["team_name"],
             "pace": float(team_row["pace"]),
@@ -199,28 +156,17 @@ class NBAStatsFetcher:
             "data_source": "nba_espn"
         }
 
-    def _find_team(self, team_name: str) -> Optional[pd.Series]:
-        """Find team in stats cache with flexible matching"""
-        if self.stats_cache is None:
+    def _find_team(self, team_name: str) -> Optional[Dict]:
+        """Find team metrics by name, alias or partial match (dict lookups via the team index)"""
+        team_index = self._snapshot[1]
+        if team_index is None:
             return None
 
-        # Direct match
-        direct = self.stats_cache[self.stats_cache["team_name"] == team_name]
-        if not direct.empty:
-            return direct.iloc[0]
-
-        # Case-insensitive match
-        team_lower = team_name.lower()
-        for idx, row in self.stats_cache.iterrows():
-            if row["team_name"].lower() == team_lower:
-                return row
+        return team_index.lookup(team_name)
 
-        # Partial match (contains) - useful for "Lakers" vs "Los Angeles Lakers"
-        for idx, row in self.stats_cache.iterrows():
-            if team_lower in row["team_name"].lower() or row["team_name"].lower() in team_lower:
-                return row
-
-        return None
+    def load_cached_snapshot(self) -> bool:
+        """Load the last saved stats without fetching (served while a refresh runs)"""
+        return self._load_snapshot() is not None
 
     def _is_cache_valid(self) -> bool:
         """Check if cached stats are still valid"""
@@ -232,29 +178,18 @@ class NBAStatsFetcher:
 
         return age < max_age
 
-    def _save_to_csv(self, df: pd.DataFrame):
-        """Save stats to CSV for backup"""
-        try:
-            filepath = config.CACHE_DIR / f"nba_stats_{datetime.now().strftime('%Y%m%d')}.csv"
-            df.to_csv(filepath, index=False)
-            logger.info(f"Saved NBA stats to {filepath}")
-        except Exception as e:
-            logger.error(f"Error saving NBA stats to CSV: {e}")
-
-    def _load_from_csv(self) -> Optional[pd.DataFrame]:
-        """Load most recent stats from CSV backup"""
-        try:
-            # Find most recent cache file
-            cache_files = sorted(config.CACHE_DIR.glob("nba_stats_*.csv"), reverse=True)
-            if cache_files:
-                logger.info(f"Loading NBA stats from backup: {cache_files[0]}")
-                df = pd.read_csv(cache_files[0])
-                self.stats_cache = df
-                return df
-        except Exception as e:
-            logger.error(f"Error loading NBA stats from CSV: {e}")
-
-        return None
+    def _save_snapshot(self, df: pd.DataFrame):
+        """Save stats to the snapshot cache for fast cold starts"""
+        self.snapshot_cache.save(df)
+
+    def _load_snapshot(self) -> Optional[pd.DataFrame]:
+        """Load the latest stats snapshot (None if missing or stale)"""
+        df = self.snapshot_cache.load()
+        if df is not None:
+            self.stats_cache = df
+            # Age of the snapshot, so status reports and staleness checks see when it was fetched
+            self.last_fetch = self.snapshot_cache.saved_at
+        return df
 
 
 # Singleton instance
@@ -0,0 +1,132 @@
+"""
+Team Stats Running Totals Store
+Persists per-team season box-score totals (possessions inputs, points, FGA,
+...) with a watermark of the newest game folded in, so a refresh only has
+to aggregate box scores played since the last one
+"""
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+import pandas as pd
+from loguru import logger
+from utils.team_stats_engine import sum_box_scores
+
+
+class TeamTotalsStore:
+    """
+    Running per-team totals for one season, saved as a small JSON file
+
+    The watermark is the latest game date folded in plus the IDs of the
+    games on that date, so games finishing later on the same day are still
+    picked up by the next refresh and none are counted twice.
+    """
+
+    def __init__(self, path: Path, season: int, extended: bool = True):
+        """
+        Args:
+            path: JSON file to persist to
+            season: Season the totals belong to (a stored file for another season is ignored)
+            extended: Also total assists, steals, blocks and fouls
+        """
+        self.path = Path(path)
+        self.season = season
+        self.extended = extended
+        self.totals: Optional[pd.DataFrame] = None
+        self.watermark_date = ""
+        self.watermark_game_ids = set()
+        self.updated_at: Optional[datetime] = None
+
+    def load(self) -> bool:
+        """Load saved totals; returns False if there are none for this season"""
+        try:
+            if not self.path.exists():
+                return False
+
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+
+            if data.get("season") != self.season:
+                logger.info(f"Ignoring team totals for season {data.get('season')} (current: {self.season})")
+                return False
+
+            self.totals = pd.DataFrame.from_records(data["totals"]).set_index("team_id")
+            self.watermark_date = data.get("watermark_date", "")
+            self.watermark_game_ids = set(data.get("watermark_game_ids", []))
+            self.updated_at = datetime.fromisoformat(data["updated_at"])
+            logger.info(f"Loaded running totals for {len(self.totals)} teams "
+                        f"(through {self.watermark_date}) from {self.path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error loading team totals from {self.path}: {e}")
+            self.totals = None
+            return False
+
+    def fold(self, box_scores: pd.DataFrame) -> int:
+        """
+        Add box scores newer than the watermark to the running totals
+
+        Args:
+            box_scores: Season team box scores (may include games already folded in)
+
+        Returns:
+            Number of new team box scores folded in
+        """
+        dates = box_scores["game_date"].astype(str).str[:10]
+        game_ids = box_scores["game_id"].astype(str)
+
+        valid = dates.str.match(r"\d{4}-\d{2}-\d{2}$")
+        new_mask = valid & ((dates > self.watermark_date) | (
+            (dates == self.watermark_date) & ~game_ids.isin(self.watermark_game_ids)
+        ))
+        new_rows = box_scores[new_mask]
+
+        if not new_rows.empty:
+            new_totals = sum_box_scores(new_rows, self.extended)
+
+            if self.totals is None:
+                self.totals = new_totals
+            else:
+                numeric = [c for c in new_totals.columns if c != "team_name"]
+                combined = self.totals[numeric].add(new_totals[numeric], fill_value=0)
+                combined["games_played"] = combined["games_played"].astype(int)
+                # Prefer the latest display name
+                combined.insert(0, "team_name", new_totals["team_name"].combine_first(self.totals["team_name"]))
+                self.totals = combined
+
+            # Advance the watermark
+            new_dates = dates[new_mask]
+            latest = new_dates.max()
+            latest_ids = set(game_ids[new_mask][new_dates == latest])
+            if latest == self.watermark_date:
+                self.watermark_game_ids |= latest_ids
+            else:
+                self.watermark_date = latest
+                self.watermark_game_ids = latest_ids
+
+        self.updated_at = datetime.now()
+        return len(new_rows)
+
+    def save(self):
+        """Write the totals and watermark (atomically, via a temp file)"""
+        if self.totals is None:
+            return
+
+        try:
+            data = {
+                "season": self.season,
+                "watermark_date": self.watermark_date,
+                "watermark_game_ids": sorted(self.watermark_game_ids),
+                "updated_at": (self.updated_at or datetime.now()).isoformat(),
+                "totals": json.loads(self.totals.reset_index().to_json(orient="records")),
+            }
+
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+
+        except Exception as e:
+            logger.error(f"Error saving team totals to {self.path}: {e}")
@@ -161,6 +161,7 @@ class MappingValidator:
 
         unmapped_teams = []
         mapped_teams = []
+        missing_csv = []
 
         for team in sorted(odds_teams):
             if not team:
@@ -172,14 +173,7 @@ class MappingValidator:
             if mapping_row.empty:
                 logger.warning(f"  ✗ No CSV mapping for: {team}")
                 unmapped_teams.append(team)
-
-                # Try to find best match in ESPN stats
-                suggestions = self._find_best_espn_match(team)
-                if suggestions:
-                    self.results["suggestions"].append({
-                        "odds_team": team,
-                        "suggestions": suggestions
-                    })
+                missing_csv.append(team)
             else:
                 espn_name = mapping_row.iloc[0]['espn_name']
                 if pd.isna(espn_name) or espn_name == "":
@@ -195,39 +189,50 @@ class MappingValidator:
                         logger.error(f"  ✗ Mapped to '{espn_name}' but NO STATS FOUND")
                         unmapped_teams.append(team)
 
+        # Try to find best matches in ESPN stats (one batch for all unmapped teams)
+        for team, suggestions in self._find_best_espn_matches(missing_csv).items():
+            if suggestions:
+                self.results["suggestions"].append({
+                    "odds_team": team,
+                    "suggestions": suggestions
+                })
+
         logger.info(f"\nMapped: {len(mapped_teams)}/{len(odds_teams)}")
         logger.info(f"Unmapped: {len(unmapped_teams)}/{len(odds_teams)}")
 
         return unmapped_teams
 
-    def _find_best_espn_match(self, odds_team: str, limit: int = 3) -> List[Dict]:
-        """Find best matching ESPN team names using fuzzy matching"""
+    def _find_best_espn_matches(self, odds_teams: List[str], min_score: int = 60) -> Dict[str, List[Dict]]:
+        """Suggest an ESPN team name for each Odds API team (batch fuzzy match via match_many)"""
+        if not odds_teams:
+            return {}
+
         if self.espn_stats.stats_cache is None:
             self.espn_stats.fetch_team_stats()
 
         espn_teams = self.espn_stats.stats_cache['team_name'].tolist()
+        best = self.matcher.match_many(odds_teams, espn_teams, threshold=min_score)
 
-        # Calculate fuzzy match scores
-        scores = []
-        for espn_team in espn_teams:
+        suggestions = {}
+        for odds_team, espn_team in best.items():
+            if espn_team is None:
+                suggestions[odds_team] = []
+                continue
+
+            # Report the same scores as before for the suggested pair
             ratio = fuzz.ratio(odds_team.lower(), espn_team.lower())
             partial = fuzz.partial_ratio(odds_team.lower(), espn_team.lower())
             token_sort = fuzz.token_sort_ratio(odds_team.lower(), espn_team.lower())
 
-            best_score = max(ratio, partial, token_sort)
-
-            if best_score >= 60:  # Only include reasonable matches
-                scores.append({
-                    "espn_name": espn_team,
-                    "score": best_score,
-                    "ratio": ratio,
-                    "partial": partial,
-                    "token_sort": token_sort
-                })
+            suggestions[odds_team] = [{
+                "espn_name": espn_team,
+                "score": max(ratio, partial, token_sort),
+                "ratio": ratio,
+                "partial": partial,
+                "token_sort": token_sort
+            }]
 
-        # Sort by score and return top matches
-        scores.sort(key=lambda x: x['score'], reverse=True)
-        return scores[:limit]
+        return suggestions
 
     def generate_report(self):
         """Generate comprehensive validation report"""
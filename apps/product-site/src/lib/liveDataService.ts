@@ -36,9 +36,15 @@ export interface LiveGame {
 }
 
 export interface LiveGameUpdate {
-  type: 'game_update' | 'games_update' | 'alert';
+  type: 'game_update' | 'game_delta' | 'games_update' | 'alert';
   timestamp: string;
-  data: LiveGame | LiveGame[];
+  data: LiveGame | LiveGame[] | Partial<LiveGame>;
+  // Delta protocol (connect with ?delta=1)
+  game_id?: string;
+  version?: number;
+  base_version?: number;
+  removed?: string[];
+  versions?: Record<string, number>;
 }
 
 // Backend API URL - can be configured via env
@@ -89,9 +95,11 @@ export class LiveGameSocket {
   private maxReconnectAttempts = 5;
   private onUpdateCallback: ((game: LiveGame) => void) | null = null;
   private onGamesCallback: ((games: LiveGame[]) => void) | null = null;
+  // Latest full state and version per game, for applying game_delta messages
+  private games = new Map<string, { version?: number; game: LiveGame }>();
 
   connect() {
-    const wsUrl = API_BASE_URL.replace('http', 'ws') + '/ws';
+    const wsUrl = API_BASE_URL.replace('http', 'ws') + '/ws?delta=1';
 
     try {
       this.ws = new WebSocket(wsUrl);
@@ -105,12 +113,28 @@ export class LiveGameSocket {
         try {
           const message: LiveGameUpdate = JSON.parse(event.data);
 
-          if (message.type === 'game_update' && this.onUpdateCallback) {
-            this.onUpdateCallback(message.data as LiveGame);
+          if (message.type === 'game_update') {
+            const game = message.data as LiveGame;
+            this.games.set(game.game_id, { version: message.version, game });
+            this.onUpdateCallback?.(game);
           }
 
-          if (message.type === 'games_update' && this.onGamesCallback) {
-            this.onGamesCallback(message.data as LiveGame[]);
+          if (message.type === 'game_delta') {
+            const game = this.applyDelta(message);
+            if (game) {
+              this.onUpdateCallback?.(game);
+            } else {
+              // Missed a version - ask the server for full state
+              this.ws?.send('resync');
+            }
+          }
+
+          if (message.type === 'games_update') {
+            const games = message.data as LiveGame[];
+            for (const game of games) {
+              this.games.set(game.game_id, { version: message.versions?.[game.game_id], game });
+            }
+            this.onGamesCallback?.(games);
           }
         } catch (e) {
           console.error('Failed to parse WebSocket message:', e);
@@ -130,6 +154,23 @@ export class LiveGameSocket {
     }
   }
 
+  /**
+   * Merge a game_delta into the cached game; null if it doesn't apply to the version we have
+   */
+  private applyDelta(message: LiveGameUpdate): LiveGame | null {
+    const current = message.game_id ? this.games.get(message.game_id) : undefined;
+    if (!current || current.version === undefined || current.version !== message.base_version) {
+      return null;
+    }
+
+    const game = { ...current.game, ...(message.data as Partial<LiveGame>) };
+    for (const key of message.removed || []) {
+      delete (game as unknown as Record<string, unknown>)[key];
+    }
+    this.games.set(game.game_id, { version: message.version, game });
+    return game;
+  }
+
   private attemptReconnect() {
     if (this.reconnectAttempts < this.maxReconnectAttempts) {
       this.reconnectAttempts++;